@@ -2,7 +2,8 @@
 """
 nfl_data.py
 
-Core ingestion + access layer for nflverse data via nfl_data_py.
+Core ingestion + access layer for nflverse weekly data, read from the
+local nflverse artifact mirror (nfl_data_py only as a fallback).
 
 This module is intentionally:
 - Read-only
@@ -14,31 +15,37 @@ It’s the foundation for:
 - JARVIS tools (start/sit, projections, matchup analysis)
 """
 
-from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 import pandas as pd
-from nfl_data_py import import_weekly_data
+
+from services.nflverse_cache import load_artifact
 
 
 # -----------------------------
 # Internal helpers
 # -----------------------------
 
-@lru_cache(maxsize=16)
 def _load_weekly_data_for_season(season: int) -> pd.DataFrame:
     """
-    Load all weekly data for a given season from nflverse (via nfl_data_py),
-    and cache it in memory for reuse.
+    Load all weekly data for a given season: nflverse's player_stats file
+    (what nfl_data_py's import_weekly_data downloads), from the artifact
+    cache that scripts/sync_nflverse.py mirrors into. The cache keeps it
+    in FRAME_CACHE and revalidates the current season.
 
-    This is the heavy call; everything else filters from here.
+    Only when the cache cannot provide the file is nfl_data_py asked.
+    The returned frame shares data with the cache — do not mutate it.
     """
-    df = import_weekly_data([season])
+    try:
+        df = load_artifact("player_stats", season)
+    except Exception as e:
+        print(f"⚠️ player_stats {season} unavailable from the nflverse cache, using nfl_data_py: {e}")
+        from nfl_data_py import import_weekly_data
 
-    # Normalize column names just in case
-    df.columns = [c.lower() for c in df.columns]
+        df = import_weekly_data([season])
 
-    return df
+    # Normalize column names just in case
+    return df.rename(columns=str.lower, copy=False)
 
 
 def _safe_get(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
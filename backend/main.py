@@ -3,8 +3,11 @@ print(">>> RUNNING MAIN FROM:", __file__)
 
 import os
 import json
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 # ---------------------------------------------------------
@@ -24,11 +27,26 @@ from routers.attribution import router as attribution_router
 # IMPORTANT: use the router-based NFL system
 from routers.nfl_router import router as nfl_router
 
+from services.pbp_watcher import start_watcher
+from services.warmup import readiness, start_warmup
+
+# ---------------------------------------------------------
+# LIFESPAN (background warmup + PBP file watcher)
+# ---------------------------------------------------------
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_warmup()
+    watcher = start_watcher()
+    yield
+    if watcher is not None:
+        watcher.stop()
+
 # ---------------------------------------------------------
 # APP INIT
 # ---------------------------------------------------------
 
-app = FastAPI(title="KramerBot API", version="0.1.0")
+app = FastAPI(title="KramerBot API", version="0.1.0", lifespan=lifespan)
 
 # Read allowed origins from environment (Render)
 allowed_origins = os.getenv("CORS_ALLOWED_ORIGINS", "*").split(",")
@@ -42,6 +60,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (brotli when brotli-asgi is installed, else gzip)
+COMPRESS_MIN_BYTES = int(os.getenv("KRAMERBOT_COMPRESS_MIN_BYTES", "1024"))
+
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=COMPRESS_MIN_BYTES, gzip_fallback=True)
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES)
+
 # ---------------------------------------------------------
 # INCLUDE ROUTERS
 # ---------------------------------------------------------
@@ -73,6 +100,15 @@ def get_standings_file():
         return {"last_updated": None, "standings": []}
 
 
+@app.get("/ready")
+def ready():
+    """
+    Readiness for the platform health check: 503 until startup warmup is done.
+    """
+    state = readiness()
+    return JSONResponse(state, status_code=200 if state["ready"] else 503)
+
+
 @app.get("/")
 def root():
     return {"message": "KramerBot API running. Probably."}
@@ -2,39 +2,77 @@ import polars as pl
 
 # ============================================================
 # CANONICAL PBP SCHEMA (your internal contract)
+#
+# Compact dtypes for the columns the R ingestion pipeline writes, plus
+# the nflverse columns the single-game PBP payload serves (wp, pass,
+# rush). Every PBP loader casts to this once, at ingest:
+#
+# - small counts / clock values → Int8 / Int16
+# - yard and EPA/WPA floats      → Int16 / Float32
+# - teams, play/season type      → Categorical
+# - player ids / names           → Categorical (mostly null, ~500 distinct)
+# - play flags stay Boolean: bit-packed, already 1/8 the size of Int8
+#
+# play_id and game_date stay strings: the API has always returned them
+# as strings ("2024-09-05"), and the frontend slices game_date as one.
 # ============================================================
 
+# Bump when PBP_SCHEMA changes so derived artifacts (IPC mirrors) rebuild
+PBP_SCHEMA_VERSION = "2"
+
 PBP_SCHEMA = {
+    "season": pl.Int16,
+    "week": pl.Int8,
+    "season_type": pl.Categorical,
     "game_id": pl.Utf8,
-    "play_id": pl.Int64,
-    "season": pl.Int64,
-    "week": pl.Int64,
-    "quarter": pl.Int64,
-    "time_remaining": pl.Int64,  # seconds remaining in quarter
-    "offense_team": pl.Utf8,
-    "defense_team": pl.Utf8,
-    "yardline_100": pl.Float64,
-    "down": pl.Int64,
-    "ydstogo": pl.Int64,
-    "play_type": pl.Utf8,
-
-    # Passing
-    "pass_air_yards": pl.Float64,
-    "pass_yac": pl.Float64,
-
-    # Rushing
-    "rush_gap": pl.Utf8,
-    "rush_direction": pl.Utf8,
+    "play_id": pl.Utf8,
+    "posteam": pl.Categorical,
+    "defteam": pl.Categorical,
+    "home_team": pl.Categorical,
+    "away_team": pl.Categorical,
+    "game_date": pl.Utf8,
+
+    # Game situation
+    "qtr": pl.Int8,
+    "quarter_seconds_remaining": pl.Int16,
+    "game_seconds_remaining": pl.Int16,
+    "down": pl.Int8,
+    "ydstogo": pl.Int8,
+    "yardline_100": pl.Int8,
+    "play_type": pl.Categorical,
+
+    # Play flags
+    "pass": pl.Boolean,
+    "rush": pl.Boolean,
+    "pass_attempt": pl.Boolean,
+    "rush_attempt": pl.Boolean,
+    "complete_pass": pl.Boolean,
+    "interception": pl.Boolean,
+    "fumble_lost": pl.Boolean,
+    "touchdown": pl.Boolean,
+    "first_down": pl.Boolean,
+    "penalty": pl.Boolean,
+
+    # Yardage
+    "yards_gained": pl.Int16,
+    "air_yards": pl.Float32,
+    "yac_yards": pl.Float32,
 
     # Advanced metrics
-    "epa": pl.Float64,
-    "wpa": pl.Float64,
-    "success": pl.Int64,
+    "epa": pl.Float32,
+    "wp": pl.Float32,
+    "wpa": pl.Float32,
+    "success": pl.Boolean,
 
     # Player identifiers
-    "qb_id": pl.Utf8,
-    "receiver_id": pl.Utf8,
-    "rusher_id": pl.Utf8,
+    "passer_id": pl.Categorical,
+    "passer": pl.Categorical,
+    "rusher_id": pl.Categorical,
+    "rusher": pl.Categorical,
+    "receiver_id": pl.Categorical,
+    "receiver": pl.Categorical,
+
+    "desc": pl.Utf8,
 }
 
 # ============================================================
@@ -52,26 +90,52 @@ def empty_pbp_frame() -> pl.LazyFrame:
 # SCHEMA ENFORCEMENT
 # ============================================================
 
-def enforce_schema(lf: pl.LazyFrame) -> pl.LazyFrame:
+def enforce_schema(frame, complete: bool = False):
     """
-    Ensures a LazyFrame conforms to the canonical PBP schema.
-    Missing columns are added as nulls.
-    Extra columns are ignored.
-    Types are cast to the canonical types.
+    Casts a PBP DataFrame or LazyFrame to the canonical PBP schema.
+
+    Columns present are cast to their canonical types (values that do not
+    fit become null). By default other columns pass through untouched, so
+    it can sit on top of a projected scan. With complete=True, missing
+    columns are added as nulls and only canonical columns are kept, in
+    canonical order.
     """
-    # Add missing columns
-    for col, dtype in PBP_SCHEMA.items():
-        if col not in lf.columns:
-            lf = lf.with_columns(pl.lit(None, dtype=dtype).alias(col))
+    names = frame.collect_schema().names() if isinstance(frame, pl.LazyFrame) else frame.columns
+    current = frame.collect_schema() if isinstance(frame, pl.LazyFrame) else frame.schema
 
-    # Cast existing columns to correct types
-    lf = lf.with_columns([
+    casts = [
         pl.col(col).cast(dtype, strict=False)
         for col, dtype in PBP_SCHEMA.items()
-        if col in lf.columns
-    ])
+        if col in names and current[col] != dtype
+    ]
+    if casts:
+        frame = frame.with_columns(casts)
+
+    if complete:
+        missing = [pl.lit(None, dtype=dtype).alias(col) for col, dtype in PBP_SCHEMA.items() if col not in names]
+        if missing:
+            frame = frame.with_columns(missing)
+        frame = frame.select(list(PBP_SCHEMA))
 
-    # Select only canonical columns in canonical order
-    lf = lf.select(list(PBP_SCHEMA.keys()))
+    return frame
+
+# ============================================================
+# MEMORY REPORT
+# ============================================================
+
+def memory_report(season: int, raw: pl.DataFrame, compact: pl.DataFrame) -> dict:
+    """
+    Bytes held by a season before and after enforce_schema.
+    """
+    raw_bytes = raw.estimated_size()
+    compact_bytes = compact.estimated_size()
+    saved = raw_bytes - compact_bytes
 
-    return lf
+    return {
+        "season": season,
+        "rows": compact.height,
+        "raw_bytes": raw_bytes,
+        "compact_bytes": compact_bytes,
+        "saved_bytes": saved,
+        "saved_pct": round(100 * saved / raw_bytes, 1) if raw_bytes else 0.0,
+    }
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from routers.nfl_router import load_weekly_data
+from services.loaders.frame_encoding import decode_frame
 from weekly.loader import load_weekly_pbp
 from weekly.usage import aggregate_player_usage
 from analytics.attribution_engine import compute_multiweek_attribution
@@ -14,7 +15,7 @@ def get_multiweek_attribution(season: int, weeks: str, scoring: str = "standard"
     pbp_rows = []
 
     for w in week_list:
-        df_usage = load_weekly_data(season, w)
+        df_usage = decode_frame(load_weekly_data(season, w))
         usage = aggregate_player_usage(df_usage)
         usage_rows.extend(usage.to_dict(orient="records"))
 
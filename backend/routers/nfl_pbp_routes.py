@@ -1,9 +1,16 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
+from services.data_versions import code_version, pbp_version
 from services.nfl_pbp_service import (
+    PBP_MEMORY_REPORTS,
     pbp_games_index,
     pbp_by_game,
 )
+from utils.cache import FRAME_CACHE
+from services.response_cache import cached_response, response_stats
+from utils.responses import make_etag
 
 router = APIRouter(prefix="/nfl", tags=["nfl"])
 
@@ -17,8 +24,31 @@ def pbp_health():
     return {"status": "ok"}
 
 
+@router.get("/cache/stats")
+def cache_stats():
+    """
+    Hit / miss / eviction counters and memory use of the shared frame cache,
+    plus request-coalescing counters for the weekly pipeline, counters of
+    the weekly frame, nflverse artifact and response caches, and the memory
+    the compact PBP schema saved for each season decoded so far.
+    """
+    from routers.nfl_router import FLIGHTS
+    from services.loaders.weekly_frame_cache import weekly_stats
+    from services.nflverse_cache import artifact_stats
+
+    return {
+        **FRAME_CACHE.stats(),
+        "flights": FLIGHTS.stats(),
+        "nflverse": artifact_stats(),
+        "responses": response_stats(),
+        "weekly": weekly_stats(),
+        "pbp_memory": [PBP_MEMORY_REPORTS[s] for s in sorted(PBP_MEMORY_REPORTS)],
+    }
+
+
 @router.get("/pbp/{season}/{week}/games")
 def get_pbp_games(
+    request: Request,
     season: int,
     week: int,
     season_type: str = Query("REG", pattern="^(REG|POST)$"),
@@ -27,16 +57,27 @@ def get_pbp_games(
     Returns a small, stable index of games for a given week.
     Intended for dropdowns and selectors — never hard-fails.
     """
-    try:
-        games = pbp_games_index(season, week, season_type)
-        return games if isinstance(games, list) else []
-    except Exception:
-        # Never break the UI for a dropdown
-        return []
+    def build():
+        try:
+            games = pbp_games_index(season, week, season_type)
+            return JSONResponse(jsonable_encoder(games if isinstance(games, list) else []))
+        except Exception:
+            # Never break the UI for a dropdown (but don't cache the failure)
+            return JSONResponse([], headers={"Cache-Control": "no-store"})
+
+    key = ("pbp-games", season, week, season_type)
+    return cached_response(
+        request,
+        season,
+        key,
+        lambda: make_etag(code_version(), pbp_version(season, week), *key),
+        build,
+    )
 
 
 @router.get("/pbp/{season}/{week}")
 def get_pbp(
+    request: Request,
     season: int,
     week: int,
     game_id: str = Query(..., min_length=1),
@@ -51,17 +92,29 @@ def get_pbp(
     """
     Returns play-by-play for a single game.
     Payload is intentionally trimmed for browser safety.
+    Carries an ETag from the season's PBP fingerprint; If-None-Match
+    gets a 304 without touching the PBP frames.
     """
-    try:
-        return pbp_by_game(
-            season=season,
-            week=week,
-            game_id=game_id,
-            season_type=season_type,
-            limit=limit,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to load play-by-play: {e}",
-        )
+    def build():
+        try:
+            return JSONResponse(jsonable_encoder(pbp_by_game(
+                season=season,
+                week=week,
+                game_id=game_id,
+                season_type=season_type,
+                limit=limit,
+            )))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to load play-by-play: {e}",
+            )
+
+    key = ("pbp", season, week, game_id, season_type, limit)
+    return cached_response(
+        request,
+        season,
+        key,
+        lambda: make_etag(code_version(), pbp_version(season, week), *key),
+        build,
+    )
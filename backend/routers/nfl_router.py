@@ -1,15 +1,26 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 import pandas as pd
 import numpy as np
-import threading
-from pathlib import Path
 
 from services.presenters.usage_presenter import present_usage
+from services.presenters.usage_fields import FieldPlan, parse_fields
 from services.loaders.pbp_weekly_loader import load_weekly_from_pbp
-from services.fantasy.scoring_engine import apply_scoring
+from services.fantasy.scoring_engine import apply_scoring, canonical_scoring
 from services.metrics.custom_metrics import add_efficiency_metrics
 from services.snap_counts.loader import load_snap_counts
 from services.metrics.fantasy_attribution import compute_fantasy_attribution
+from services.loaders.frame_encoding import concat_encoded, decode_frame, encode_frame, encode_player_ids
+from services.loaders.season_cumulative import (
+    CUMULATIVE_KEYS,
+    CUMULATIVE_STATS,
+    parse_week_range,
+    season_cumulative,
+)
+from services.data_versions import code_version, weekly_version
+from services.pbp_catalog import LOCAL_CATALOG
+from services.response_cache import cached_response
+from utils.cache import SingleFlight
+from utils.responses import check_orient, frame_response, make_etag, negotiate_format
 
 router = APIRouter()
 
@@ -18,10 +29,9 @@ router = APIRouter()
 # ============================================================
 
 SEASON_CACHE = {"seasons": [], "loaded": False}
-CACHE_LOCK = threading.Lock()
 
-BASE_DIR = Path(__file__).resolve().parents[2]
-LOCAL_PBP_DIR = BASE_DIR / "backend" / "data" / "pbp"
+# Coalesces concurrent identical loads: ("seasons",) and ("weekly", season, week)
+FLIGHTS = SingleFlight("nfl_router")
 
 
 # ============================================================
@@ -29,23 +39,19 @@ LOCAL_PBP_DIR = BASE_DIR / "backend" / "data" / "pbp"
 # ============================================================
 
 def build_season_cache():
-    print("DEBUG: PBP FILES FOUND:", list(LOCAL_PBP_DIR.glob("pbp_*.parquet")))
-    print("DEBUG: LOCAL_PBP_DIR =", LOCAL_PBP_DIR)
+    if SEASON_CACHE["loaded"]:
+        return
 
-    with CACHE_LOCK:
-        if SEASON_CACHE["loaded"]:
-            return
+    FLIGHTS.do(("seasons",), _scan_seasons)
 
-        seasons = []
-        for path in LOCAL_PBP_DIR.glob("pbp_*.parquet"):
-            try:
-                year = int(path.stem.split("_")[1])
-                seasons.append(year)
-            except Exception:
-                continue
 
-        SEASON_CACHE["seasons"] = sorted(seasons)
-        SEASON_CACHE["loaded"] = True
+def _scan_seasons():
+    if SEASON_CACHE["loaded"]:
+        return
+
+    # Season files and week-partitioned seasons, from the PBP catalog
+    SEASON_CACHE["seasons"] = LOCAL_CATALOG.seasons()
+    SEASON_CACHE["loaded"] = True
 
 
 # ============================================================
@@ -53,15 +59,13 @@ def build_season_cache():
 # ============================================================
 
 def load_rosters(season: int) -> pd.DataFrame:
-    url = (
-        "https://github.com/nflverse/nflverse-data/releases/download/"
-        f"rosters/roster_{season}.parquet"
-    )
+    from services.nflverse_cache import load_artifact
 
     print(f"📡 Loading nflverse roster parquet for {season}")
-    df = pd.read_parquet(url)
+    # Shared with the artifact cache: rename (copy) before changing anything
+    df = load_artifact("rosters", season)
 
-    df.columns = [c.lower() for c in df.columns]
+    df = df.rename(columns=str.lower)
 
     # Fallback: nflverse 2025+ sometimes uses gsis_id or nfl_id
     if "player_id" not in df.columns:
@@ -94,8 +98,44 @@ def load_rosters(season: int) -> pd.DataFrame:
 # ============================================================
 
 def load_weekly_data(season: int, week: int) -> pd.DataFrame:
-    from services.loaders.id_harmonizer import harmonize_ids
+    """
+    Weekly player frame (PBP stats + roster identity + snap_pct).
+    Served from the weekly frame cache (memory, then disk) while its inputs
+    are unchanged; else from the materialized player-week table when the
+    week has been built, computed live otherwise.
+
+    Concurrent calls for the same season/week share one load, so the
+    returned frame may be shared between requests — do not mutate it in place.
+
+    The frame is encoded (int32 player_id keys, categorical team/position);
+    run it through frame_encoding.decode_frame before serializing it.
+
+    Weeks the PBP catalog does not know are answered empty without I/O.
+    """
+    if not LOCAL_CATALOG.has_week(season, week):
+        return pd.DataFrame()
+
+    from services.loaders.weekly_frame_cache import weekly_frame
+
+    return FLIGHTS.do(("weekly", season, week), lambda: weekly_frame(season, week, _load_weekly_data))
+
+
+def _load_weekly_data(season: int, week: int) -> pd.DataFrame:
+    from services.loaders.player_week_table import read_player_week
+
+    df = read_player_week(season, week)
+    if df is not None:
+        print(f"📦 Serving {season} week {week} from player-week table ({len(df)} rows)")
+        return df
+
+    return compute_weekly_data(season, week)
+
 
+def compute_weekly_data(season: int, week: int) -> pd.DataFrame:
+    """
+    Runs the full weekly pipeline: weekly builder → harmonize_ids → snap merge.
+    Returns an encoded frame (see load_weekly_data).
+    """
     print(f"🔥 Loading weekly data from local PBP for {season} week {week}")
 
     df = load_weekly_from_pbp(season, week)
@@ -103,6 +143,71 @@ def load_weekly_data(season: int, week: int) -> pd.DataFrame:
         print(f"⚠️ No weekly data for {season} week {week}")
         return df
 
+    return _finish_weekly(df, season, [week])
+
+
+def load_multi_week_data(season: int, weeks: list[int]) -> pd.DataFrame:
+    """
+    Player-week rows for several weeks of a season, in one frame.
+
+    Weeks held by the weekly frame cache or materialized in the player-week
+    table are read from there; the rest are built together in a single pass
+    (compute_multi_week_data) instead of one weekly pipeline per week.
+    Unknown weeks are skipped.
+    """
+    from services.loaders.player_week_table import read_player_week
+    from services.loaders.weekly_frame_cache import cached_weekly_frame
+
+    weeks = [w for w in sorted(set(weeks)) if LOCAL_CATALOG.has_week(season, w)]
+    if not weeks:
+        return pd.DataFrame()
+
+    def load():
+        frames, missing = [], []
+        for w in weeks:
+            df = cached_weekly_frame(season, w)
+            if df is None:
+                df = read_player_week(season, w)
+            if df is None:
+                missing.append(w)
+            else:
+                frames.append(df)
+
+        if missing:
+            frames.append(compute_multi_week_data(season, missing))
+
+        return concat_encoded(frames)
+
+    return FLIGHTS.do(("multi", season, tuple(weeks)), load)
+
+
+def compute_multi_week_data(season: int, weeks: list[int]) -> pd.DataFrame:
+    """
+    The weekly pipeline for several weeks at once: one PBP scan and grouped
+    build for all weeks, one roster load and harmonize_ids, snaps merged on
+    (player_id, week). Same rows as compute_weekly_data week by week.
+    """
+    from services.loaders.pbp_weekly_loader import load_weeks_from_pbp
+
+    print(f"🔥 Loading weekly data from local PBP for {season} weeks {weeks}")
+
+    df = load_weeks_from_pbp(season, weeks)
+    if df.empty:
+        print(f"⚠️ No weekly data for {season} weeks {weeks}")
+        return df
+
+    return _finish_weekly(df, season, weeks)
+
+
+def _finish_weekly(df: pd.DataFrame, season: int, weeks: list[int]) -> pd.DataFrame:
+    """
+    Builder output → encoded player keys → harmonize_ids → snap merge.
+    """
+    from services.loaders.id_harmonizer import harmonize_ids
+
+    # int32 player keys from here on; decoded at serialization
+    df = encode_player_ids(df)
+
     # Load rosters
     try:
         rosters = load_rosters(season)
@@ -121,12 +226,36 @@ def load_weekly_data(season: int, week: int) -> pd.DataFrame:
         print("⚠️ DEBUG: position column missing after harmonize_ids")
 
     # Snap counts
-    if season >= 2025:
-        snaps = pd.DataFrame({"player_id": [], "snap_pct": []})
+    snaps = _load_snaps(season, weeks)
+
+    if not snaps.empty:
+        snaps = encode_player_ids(snaps)
+        df = df.merge(
+            snaps[["player_id", "week", "snap_pct"]],
+            on=["player_id", "week"],
+            how="left"
+        )
+        df["snap_pct"] = df["snap_pct"].fillna(0)
     else:
+        df["snap_pct"] = 0
+
+    return encode_frame(df)
+
+
+def _load_snaps(season: int, weeks: list[int]) -> pd.DataFrame:
+    """
+    Snap percentages for the given weeks, one frame with a week column.
+    """
+    empty = pd.DataFrame({"player_id": [], "week": [], "snap_pct": []})
+    if season >= 2025:
+        return empty
+
+    frames = []
+    for week in weeks:
         snaps = load_snap_counts(season, week)
+        if snaps.empty:
+            continue
 
-    if not snaps.empty:
         snaps.columns = [c.lower() for c in snaps.columns]
 
         if "offense_pct" in snaps.columns:
@@ -134,16 +263,9 @@ def load_weekly_data(season: int, week: int) -> pd.DataFrame:
         else:
             snaps["snap_pct"] = 0
 
-        df = df.merge(
-            snaps[["player_id", "snap_pct"]],
-            on="player_id",
-            how="left"
-        )
-        df["snap_pct"] = df["snap_pct"].fillna(0)
-    else:
-        df["snap_pct"] = 0
+        frames.append(snaps[["player_id", "snap_pct"]].assign(week=week))
 
-    return df
+    return pd.concat(frames, ignore_index=True) if frames else empty
 
 
 # ============================================================
@@ -151,20 +273,58 @@ def load_weekly_data(season: int, week: int) -> pd.DataFrame:
 # ============================================================
 
 @router.get("/nfl/player-usage/{season}/{week}")
-def get_player_usage(season: int, week: int, position: str = "ALL", scoring: str = "standard"):
+def get_player_usage(
+    request: Request,
+    season: int,
+    week: int,
+    position: str = "ALL",
+    scoring: str = "standard",
+    format: str | None = None,
+    orient: str = "records",
+    fields: str | None = None,
+):
+    # ?format=arrow|parquet or Accept: application/vnd.apache.arrow.stream
+    fmt = negotiate_format(request, format)
+    # JSON only: ?orient=columns → {"columns": [...], "data": [[...], ...]}
+    orient = check_orient(orient)
+    pos = position.upper()
+    scoring = canonical_scoring(scoring)
+
+    # ?fields=qb / table / preset / col,col,... → only the stages those need run
+    try:
+        plan = parse_fields(fields, pos)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Same normalized parameters → same cached body
+    key = (
+        "player-usage", season, week, pos, scoring, fmt, orient,
+        tuple(plan.fields) if plan is not None else None,
+    )
+
+    # If-None-Match → 304 before the pipeline runs
+    return cached_response(
+        request,
+        season,
+        key,
+        lambda: make_etag(code_version(), weekly_version(season, [week]), *key),
+        lambda: frame_response(_player_usage_frame(season, week, pos, scoring, plan), fmt, orient),
+    )
+
 
+def _player_usage_frame(
+    season: int, week: int, pos: str, scoring: str, plan: FieldPlan | None = None
+) -> pd.DataFrame:
     try:
-        print(f"🔥 NFL ROUTE HIT: season={season}, week={week}, position={position}, scoring={scoring}")
+        print(f"🔥 NFL ROUTE HIT: season={season}, week={week}, position={pos}, scoring={scoring}")
 
         df = load_weekly_data(season, week)
         if df.empty or "week" not in df.columns:
-            return []
+            return pd.DataFrame()
 
         week_df = df[df["week"] == week]
         if week_df.empty:
-            return []
-
-        pos = position.upper()
+            return pd.DataFrame()
 
         if pos == "WR/TE":
             week_df = week_df[week_df["position"].isin(["WR", "TE"])]
@@ -172,23 +332,35 @@ def get_player_usage(season: int, week: int, position: str = "ALL", scoring: str
             week_df = week_df[week_df["position"] == pos]
 
         if week_df.empty:
-            return []
+            return pd.DataFrame()
+
+        if plan is not None:
+            # Only the columns the requested fields are computed from
+            week_df = week_df[plan.input_columns(week_df)]
+
+        # Strings again for scoring / presentation
+        week_df = decode_frame(week_df)
 
         # Apply scoring (all systems) + select active
-        week_df = apply_scoring(week_df, scoring)
+        if plan is None or plan.scoring:
+            week_df = apply_scoring(week_df, scoring)
 
         # Fantasy attribution
-        week_df = compute_fantasy_attribution(week_df, scoring)
+        if plan is None or plan.attribution:
+            week_df = compute_fantasy_attribution(week_df, scoring)
 
         # Present usage last
         week_df = present_usage(week_df, pos)
 
         # Advanced metrics
-        week_df = add_efficiency_metrics(week_df)
+        if plan is None or plan.efficiency:
+            week_df = add_efficiency_metrics(week_df)
 
-        week_df = week_df.replace([np.inf, -np.inf], 0).fillna(0)
+        if plan is not None:
+            week_df = week_df[plan.output_columns(week_df)]
 
-        return week_df.to_dict(orient="records")
+        # NaN / inf → 0 happens column-wise in the encoder
+        return week_df
 
     except Exception as e:
         import traceback
@@ -197,77 +369,114 @@ def get_player_usage(season: int, week: int, position: str = "ALL", scoring: str
         raise HTTPException(status_code=500, detail="Failed to load NFL data")
 
 
-
 # ============================================================
 # MULTI-WEEK USAGE + ATTRIBUTION (PATCHED)
 # ============================================================
 
+def _filter_position(df: pd.DataFrame, pos: str) -> pd.DataFrame:
+    if pos == "WR/TE":
+        return df[df["position"].isin(["WR", "TE"])]
+    if pos != "ALL":
+        return df[df["position"] == pos]
+    return df
+
+
+def _aggregate_weeks(season: int, week_list: list[int], pos: str) -> pd.DataFrame:
+    """
+    Per-player totals over a list of weeks (encoded keys).
+    """
+    # Every requested week in one pass (not one pipeline per week)
+    df_all = load_multi_week_data(season, week_list)
+    if df_all.empty or "week" not in df_all.columns:
+        return pd.DataFrame()
+
+    df_all = _filter_position(df_all[df_all["week"].isin(week_list)], pos)
+    if df_all.empty:
+        return pd.DataFrame()
+
+    # Numeric columns only: categorical team/position have no 0 category
+    stats = df_all.select_dtypes("number").columns
+    df_all = df_all.assign(**{c: df_all[c].replace([np.inf, -np.inf], 0).fillna(0) for c in stats})
+
+    for col in CUMULATIVE_STATS:
+        if col not in df_all.columns:
+            df_all[col] = 0
+
+    return (
+        df_all.groupby(CUMULATIVE_KEYS, dropna=False, observed=True)[CUMULATIVE_STATS]
+        .sum()
+        .reset_index()
+    )
+
+
 @router.get("/nfl/multi-usage-v2/{season}")
-def get_multi_week_usage(season: int, weeks: str, position: str = "ALL", scoring: str = "standard"):
+def get_multi_week_usage(
+    request: Request,
+    season: int,
+    weeks: str,
+    position: str = "ALL",
+    scoring: str = "standard",
+    format: str | None = None,
+    orient: str = "records",
+):
+    fmt = negotiate_format(request, format)
+    orient = check_orient(orient)
+    pos = position.upper()
+    scoring = canonical_scoring(scoring)
+    weeks = _normalize_weeks(weeks)
+
+    key = ("multi-usage-v2", season, weeks, pos, scoring, fmt, orient)
+    return cached_response(
+        request,
+        season,
+        key,
+        lambda: make_etag(code_version(), weekly_version(season, _etag_weeks(weeks)), *key),
+        lambda: frame_response(_multi_usage_frame(season, weeks, pos, scoring), fmt, orient),
+    )
 
+
+def _normalize_weeks(weeks: str) -> str:
+    """
+    "3,1,3" → "1,3", " 2 - 5" → "2-5": one spelling per week selection
+    (malformed values unchanged).
+    """
+    week_range = parse_week_range(weeks)
+    if week_range is not None:
+        return f"{week_range[0]}-{week_range[1]}"
     try:
-        week_list = [int(w) for w in weeks.split(",") if w.strip()]
-        if not week_list:
-            raise HTTPException(status_code=400, detail="No weeks provided")
-
-        pos = position.upper()
-        all_frames = []
-
-        for w in week_list:
-            df = load_weekly_data(season, w)
-            if df.empty or "week" not in df.columns:
-                continue
-
-            week_df = df[df["week"] == w]
-            if week_df.empty:
-                continue
-
-            if pos == "WR/TE":
-                week_df = week_df[week_df["position"].isin(["WR", "TE"])]
-            elif pos != "ALL":
-                week_df = week_df[week_df["position"] == pos]
-
-            if week_df.empty:
-                continue
-
-            week_df = week_df.replace([np.inf, -np.inf], 0).fillna(0)
-            week_df["week"] = w
-
-            all_frames.append(week_df)
-
-        if not all_frames:
-            return []
-
-        df_all = pd.concat(all_frames, ignore_index=True)
-
-        required_cols = [
-            "attempts", "receptions",
-            "passing_yards", "rushing_yards", "receiving_yards",
-            "passing_tds", "rushing_tds", "receiving_tds",
-            "interceptions", "fumbles_lost"
-        ]
-        for col in required_cols:
-            if col not in df_all.columns:
-                df_all[col] = 0
-
-        group_cols = ["player_id", "player_name", "team", "position"]
-
-        agg_df = (
-            df_all.groupby(group_cols, dropna=False)
-            .agg(
-                attempts=("attempts", "sum"),
-                receptions=("receptions", "sum"),
-                passing_yards=("passing_yards", "sum"),
-                rushing_yards=("rushing_yards", "sum"),
-                receiving_yards=("receiving_yards", "sum"),
-                passing_tds=("passing_tds", "sum"),
-                rushing_tds=("rushing_tds", "sum"),
-                receiving_tds=("receiving_tds", "sum"),
-                interceptions=("interceptions", "sum"),
-                fumbles_lost=("fumbles_lost", "sum"),
-            )
-            .reset_index()
-        )
+        week_list = sorted({int(w) for w in weeks.split(",") if w.strip()})
+    except ValueError:
+        return weeks
+    return ",".join(str(w) for w in week_list)
+
+
+def _etag_weeks(weeks: str) -> list[int]:
+    week_range = parse_week_range(weeks)
+    if week_range is not None:
+        return list(range(week_range[0], week_range[1] + 1))
+    try:
+        return [int(w) for w in weeks.split(",") if w.strip()]
+    except ValueError:
+        return []
+
+
+def _multi_usage_frame(season: int, weeks: str, pos: str, scoring: str) -> pd.DataFrame:
+    try:
+        week_range = parse_week_range(weeks)
+        if week_range is not None:
+            # weeks=a-b: season-to-date arrays, cum[b] - cum[a-1]
+            agg_df = _filter_position(season_cumulative(season).range_totals(*week_range), pos)
+            agg_df = agg_df.drop(columns="weeks_played")
+        else:
+            week_list = [int(w) for w in weeks.split(",") if w.strip()]
+            if not week_list:
+                raise HTTPException(status_code=400, detail="No weeks provided")
+            agg_df = _aggregate_weeks(season, week_list, pos)
+
+        if agg_df.empty:
+            return pd.DataFrame()
+
+        agg_df = decode_frame(agg_df)
 
         agg_df["touches"] = agg_df["attempts"] + agg_df["receptions"]
         agg_df["total_yards"] = (
@@ -285,10 +494,10 @@ def get_multi_week_usage(season: int, weeks: str, position: str = "ALL", scoring
         agg_df = compute_fantasy_attribution(agg_df, scoring)
         agg_df = present_usage(agg_df, pos)
 
-        agg_df = agg_df.replace([np.inf, -np.inf], 0).fillna(0)
-        agg_df = agg_df.sort_values("fantasy_points", ascending=False)
-
-        return agg_df.to_dict(orient="records")
+        # NaN / inf → 0 happens in the encoder; rank missing points as 0
+        return agg_df.sort_values(
+            "fantasy_points", ascending=False, key=lambda s: s.replace([np.inf, -np.inf], 0).fillna(0)
+        )
 
     except Exception as e:
         print("❌ ERROR IN MULTI-WEEK NFL ROUTE:", e)
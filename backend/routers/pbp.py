@@ -1,16 +1,33 @@
-from fastapi import APIRouter, HTTPException
+import pandas as pd
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from services.multi_pbp import iter_ndjson, page_json, week_plays
+from utils.responses import NDJSON_MEDIA_TYPE, frame_response, negotiate_format, wants_ndjson
 from weekly.loader import load_weekly_pbp   # You already have this or similar
 from weekly.normalizer import normalize_pbp_row  # Your existing normalizer
 
 router = APIRouter()
 
 @router.get("/nfl/multi-pbp/{season}")
-def get_multi_week_pbp(season: int, weeks: str):
+def get_multi_week_pbp(
+    request: Request,
+    season: int,
+    weeks: str,
+    format: str | None = None,
+    limit: int | None = Query(None, ge=1, le=5000, description="Page size (paginated mode)"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+):
     """
     Aggregate PBP rows across multiple weeks.
     Example:
     /nfl/multi-pbp/2025?weeks=1,2,3
+    /nfl/multi-pbp/2025?weeks=1,2,3&format=arrow   (or parquet)
+    /nfl/multi-pbp/2025?weeks=1,2,3&format=ndjson  (or Accept: application/x-ndjson)
+    /nfl/multi-pbp/2025?weeks=1,2,3&limit=500      → {"plays": [...], "next_cursor": ...}
     """
+    # NDJSON streams week by week; everything else goes through negotiation
+    ndjson = wants_ndjson(request, format)
+    fmt = "json" if ndjson else negotiate_format(request, format)
 
     # Parse week list
     try:
@@ -21,6 +38,18 @@ def get_multi_week_pbp(season: int, weeks: str):
     if not week_list:
         raise HTTPException(status_code=400, detail="No weeks provided")
 
+    if ndjson:
+        return StreamingResponse(iter_ndjson(season, week_list), media_type=NDJSON_MEDIA_TYPE)
+
+    if limit is not None:
+        try:
+            return Response(page_json(season, week_list, limit, cursor), media_type="application/json")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if fmt != "json":
+        return frame_response(_multi_week_pbp_frame(season, week_list), fmt)
+
     all_rows = []
 
     # Load each week’s PBP
@@ -34,3 +63,19 @@ def get_multi_week_pbp(season: int, weeks: str):
             print(f"Error loading PBP for week {w}: {e}")
 
     return all_rows
+
+
+def _multi_week_pbp_frame(season: int, week_list: list[int]) -> pd.DataFrame:
+    """
+    Same plays as the JSON body, kept as one frame (Arrow / Parquet).
+    """
+    frames = []
+    for w in week_list:
+        try:
+            frames.append(week_plays(season, w))
+        except Exception as e:
+            print(f"Error loading PBP for week {w}: {e}")
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
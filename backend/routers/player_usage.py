@@ -1,5 +1,8 @@
+import pandas as pd
 from fastapi import APIRouter, HTTPException
 from routers.nfl_router import load_weekly_data
+from services.loaders.frame_encoding import decode_frame
+from services.loaders.season_cumulative import parse_week_range, season_cumulative
 from weekly.usage import aggregate_player_usage
 
 router = APIRouter()
@@ -7,7 +10,7 @@ router = APIRouter()
 
 @router.get("/nfl/player-usage-raw/{season}/{week}")
 def get_player_usage(season: int, week: int):
-    df = load_weekly_data(season, week)
+    df = decode_frame(load_weekly_data(season, week))
     usage = aggregate_player_usage(df)
     return usage.to_dict(orient="records")
 
@@ -17,8 +20,13 @@ def get_multi_week_usage(season: int, weeks: str, scoring: str = "standard"):
     Aggregate player usage across multiple weeks.
     Example:
     /nfl/multi-usage/2025?weeks=1,2,3&scoring=standard
+    /nfl/multi-usage/2025?weeks=5-12   (range: season-to-date fast path)
     """
 
+    week_range = parse_week_range(weeks)
+    if week_range is not None:
+        return _range_usage(season, *week_range)
+
     # Parse week list
     try:
         week_list = [int(w) for w in weeks.split(",") if w.strip()]
@@ -33,10 +41,11 @@ def get_multi_week_usage(season: int, weeks: str, scoring: str = "standard"):
     # Load each week and aggregate raw rows
     for w in week_list:
         try:
-            df = load_weekly_data(season, w)
+            df = decode_frame(load_weekly_data(season, w))
             weekly_usage = aggregate_player_usage(df)
             rows = weekly_usage.to_dict(orient="records")
-            all_rows.extend(rows)
+            # aggregate_player_usage drops the week column
+            all_rows.extend({**row, "week": w} for row in rows)
         except Exception as e:
             print(f"Error loading week {w}: {e}")
 
@@ -69,8 +78,8 @@ def get_multi_week_usage(season: int, weeks: str, scoring: str = "standard"):
         agg = aggregated[pid]
 
         # Track contributing weeks
-        if row.get("week") not in agg["weeks"]:
-            agg["weeks"].append(row.get("week"))
+        if row["week"] not in agg["weeks"]:
+            agg["weeks"].append(row["week"])
 
         # Additive stats
         agg["attempts"] += row.get("attempts", 0)
@@ -93,3 +102,41 @@ def get_multi_week_usage(season: int, weeks: str, scoring: str = "standard"):
 
     return result
 
+
+RAW_USAGE_FIELDS = [
+    "attempts", "receptions", "touches", "total_yards", "touchdowns",
+    "fantasy_points", "fantasy_points_ppr", "fantasy_points_half", "fantasy_points_shen2000",
+]
+
+
+def _range_usage(season: int, start: int, end: int) -> list[dict]:
+    """
+    multi-usage-raw for a contiguous week range, from the season's
+    cumulative arrays instead of one weekly load per week.
+    """
+    cumulative = season_cumulative(season)
+    totals = decode_frame(cumulative.range_totals(start, end))
+    if totals.empty:
+        return []
+
+    totals["weeks"] = cumulative.range_weeks(start, end)
+    totals["first_week"] = [w[0] for w in totals["weeks"]]
+
+    result = []
+    # Identity comes from the player's first week in the range
+    ordered = totals.sort_values(["first_week", "player_id", "player_name"], kind="stable")
+    for _, rows in ordered.groupby("player_id", dropna=False, sort=False):
+        first = rows.iloc[0]
+        row = {
+            "player_id": first["player_id"] or f"{first['player_name']}-{first['team']}",
+            "player_name": first["player_name"],
+            "team": first["team"],
+            "position": None if pd.isna(first["position"]) else first["position"],
+            "weeks": sorted({w for weeks in rows["weeks"] for w in weeks}),
+        }
+        for field in RAW_USAGE_FIELDS:
+            row[field] = float(rows[field].sum()) if field in rows.columns else 0
+        result.append(row)
+
+    result.sort(key=lambda r: r.get("fantasy_points", 0), reverse=True)
+    return result
@@ -0,0 +1,39 @@
+"""Prebuild the memory-mapped Arrow IPC mirrors of local PBP seasons.
+
+load_pbp_season builds a season's mirror on its first load after the parquet
+changes; running this at deploy time moves that cost out of user requests.
+
+Usage:
+  python backend/scripts/build_ipc_mirrors.py                  # all seasons in the PBP cache dir
+  python backend/scripts/build_ipc_mirrors.py --seasons 2023-2025
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from services.nfl_pbp_service import load_pbp_season
+from services.pbp_catalog import CACHE_CATALOG
+from scripts.partition_pbp import parse_seasons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=parse_seasons, help="e.g. 2024 or 2020-2025 or 2019,2024")
+    args = parser.parse_args()
+
+    seasons = args.seasons or CACHE_CATALOG.seasons()
+    for season in seasons:
+        start = time.time()
+        df = load_pbp_season(season)
+        print(f"💾 {season}: {df.height} plays mirrored ({time.time() - start:.2f}s)")
+
+    print("✅ IPC mirrors up to date.")
+
+
+if __name__ == "__main__":
+    main()
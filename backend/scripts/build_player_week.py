@@ -0,0 +1,87 @@
+"""Materialize the player-week table for one or more seasons.
+
+Runs the full load_weekly_data pipeline (weekly builder → harmonize_ids →
+snap merge) once per season/week in parallel worker processes and writes
+backend/data/player_week/player_week_{season}.parquet. The NFL routes serve
+weeks from this table and only compute live for weeks that are missing or
+whose PBP input changed since the build.
+
+Usage:
+  python backend/scripts/build_player_week.py                  # all local seasons, stale weeks only
+  python backend/scripts/build_player_week.py --seasons 2020-2024 --workers 4
+  python backend/scripts/build_player_week.py --seasons 2025 --force
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from services.loaders.player_week_table import fresh_weeks, write_player_week
+from services.pbp_catalog import LOCAL_CATALOG
+from scripts.partition_pbp import parse_seasons
+
+
+def build_week(season: int, week: int):
+    # Imported in the worker so each process builds its own pipeline state
+    from routers.nfl_router import compute_weekly_data
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = compute_weekly_data(season, week)
+    return season, week, df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=parse_seasons, help="e.g. 2024 or 2020-2025 or 2019,2024")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--force", action="store_true", help="Rebuild weeks that are already fresh")
+    args = parser.parse_args()
+
+    seasons = args.seasons or LOCAL_CATALOG.seasons()
+
+    jobs = []
+    for season in seasons:
+        weeks = LOCAL_CATALOG.weeks(season)
+        done = set() if args.force else set(fresh_weeks(season))
+        todo = [w for w in weeks if w not in done]
+        print(f"📅 {season}: {len(weeks)} weeks, {len(todo)} to build")
+        jobs.extend((season, w) for w in todo)
+
+    if not jobs:
+        print("✅ Player-week tables are up to date.")
+        return
+
+    start = time.time()
+    results: dict[int, dict] = {}
+
+    # spawn, not fork: polars' thread pool is not fork-safe
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as pool:
+        futures = {pool.submit(build_week, s, w): (s, w) for s, w in jobs}
+        for future in as_completed(futures):
+            season, week = futures[future]
+            try:
+                _, _, df = future.result()
+            except Exception as e:
+                print(f"❌ {season} week {week}: {e}")
+                continue
+            results.setdefault(season, {})[week] = df
+            print(f"  ✔ {season} week {week}: {len(df)} rows")
+
+    for season, frames in sorted(results.items()):
+        path = write_player_week(season, frames)
+        print(f"💾 {season}: wrote {len(frames)} week(s) → {path}")
+
+    print(f"✅ Player-week build complete ({time.time() - start:.1f}s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Convert monolithic season PBP parquet files into week partitions.
+
+Rewrites each {root}/pbp_{season}.parquet into
+{root}/season={season}/week={week}/part-0.parquet, sorted by game_id and
+play_id with one row group per game. The source files are left in place;
+all PBP loaders prefer the partitions once they exist.
+
+Usage:
+  python backend/scripts/partition_pbp.py                   # all seasons, both PBP dirs
+  python backend/scripts/partition_pbp.py --seasons 2023-2025
+  python backend/scripts/partition_pbp.py --root backend/data/pbp --seasons 2024,2025
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import polars as pl
+
+from services.pbp_catalog import LOCAL_PBP_DIR, PBP_CACHE_DIR, catalog_for
+from services.pbp_loader import season_file, write_season_partitions
+
+
+def parse_seasons(value: str) -> list[int]:
+    seasons = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            seasons.extend(range(int(start), int(end) + 1))
+        else:
+            seasons.append(int(part))
+    return sorted(set(seasons))
+
+
+def convert_root(root: Path, seasons: list[int] | None) -> None:
+    catalog = catalog_for(root)
+    targets = seasons if seasons is not None else [s for s in catalog.seasons() if not catalog.is_partitioned(s)]
+    print(f"📁 {root}: {len(targets)} season(s)")
+
+    for season in targets:
+        src = season_file(root, season)
+        if not src.exists():
+            print(f"⚠️ {season}: missing {src}, skipping")
+            continue
+
+        start = time.time()
+        df = pl.read_parquet(src)
+        paths = write_season_partitions(df, root, season)
+        print(f"💾 {season}: {df.height} plays → {len(paths)} week partitions ({time.time() - start:.1f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--root",
+        action="append",
+        type=Path,
+        help="PBP directory to convert (repeatable). Defaults to the local PBP dir and the PBP cache dir.",
+    )
+    parser.add_argument("--seasons", type=parse_seasons, help="e.g. 2024 or 2020-2025 or 2019,2024")
+    args = parser.parse_args()
+
+    roots = args.root or [LOCAL_PBP_DIR, PBP_CACHE_DIR]
+    for root in roots:
+        convert_root(root.resolve(), args.seasons)
+
+    print("✅ PBP partitioning complete.")
+
+
+if __name__ == "__main__":
+    main()
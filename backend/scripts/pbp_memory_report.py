@@ -0,0 +1,56 @@
+"""Report the memory the compact PBP schema saves, per season.
+
+Decodes each local season parquet as written by the R pipeline, casts it
+with pbp.normalize.schema.enforce_schema, and compares the in-memory size
+of the two frames.
+
+Usage:
+  python backend/scripts/pbp_memory_report.py                  # all local seasons
+  python backend/scripts/pbp_memory_report.py --seasons 2023-2025
+"""
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import polars as pl
+
+from pbp.normalize.schema import enforce_schema, memory_report
+from services.pbp_catalog import LOCAL_CATALOG
+from scripts.partition_pbp import parse_seasons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=parse_seasons, help="e.g. 2024 or 2020-2025 or 2019,2024")
+    args = parser.parse_args()
+
+    seasons = args.seasons or LOCAL_CATALOG.seasons()
+
+    print(f"{'season':>6} {'rows':>8} {'raw MB':>8} {'compact MB':>11} {'saved':>7}")
+    raw_total = compact_total = 0
+    for season in seasons:
+        paths = LOCAL_CATALOG.files(season)
+        if not paths:
+            print(f"⚠️ {season}: not in the local PBP catalog, skipping")
+            continue
+
+        raw = pl.read_parquet(paths)
+        report = memory_report(season, raw, enforce_schema(raw, complete=True))
+        raw_total += report["raw_bytes"]
+        compact_total += report["compact_bytes"]
+        print(
+            f"{season:>6} {report['rows']:>8} {report['raw_bytes'] / 1e6:>8.1f} "
+            f"{report['compact_bytes'] / 1e6:>11.1f} {report['saved_pct']:>6.1f}%"
+        )
+
+    if raw_total:
+        saved_pct = 100 * (raw_total - compact_total) / raw_total
+        print(f"{'total':>6} {'':>8} {raw_total / 1e6:>8.1f} {compact_total / 1e6:>11.1f} {saved_pct:>6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
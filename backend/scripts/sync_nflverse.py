@@ -0,0 +1,94 @@
+"""Mirror the nflverse artifacts the API reads into the local caches.
+
+Downloads pbp, rosters and player_stats (nfl_data_py's weekly data) for a
+season range with a bounded pool of download threads. Interrupted downloads
+resume from their .part file; every file is checked (Content-Length,
+parquet footer) and renamed into place atomically, and its sha256 is
+recorded locally so later runs notice a cached copy that changed on disk
+(nflverse publishes no checksum to verify a download against). Files
+already current are skipped: completed seasons are immutable, the current
+season is revalidated with a conditional GET.
+
+Files land where the runtime artifact cache (services/nflverse_cache.py)
+looks for them, so a deploy can prefetch everything in one step:
+
+Usage:
+  python backend/scripts/sync_nflverse.py                          # 1999 → current season, all artifacts
+  python backend/scripts/sync_nflverse.py --seasons 2020-2025 --workers 8
+  python backend/scripts/sync_nflverse.py --artifacts rosters,player_stats --seasons 2025
+  python backend/scripts/sync_nflverse.py --root /data/nflverse    # standalone mirror directory
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from services.nflverse_cache import NFLVERSE_ARTIFACTS, sync_artifact
+from services.pbp_catalog import CACHE_CATALOG
+from scripts.partition_pbp import parse_seasons
+from utils.helpers import current_season
+
+
+def parse_artifacts(value: str) -> list[str]:
+    artifacts = [a.strip() for a in value.split(",") if a.strip()]
+    unknown = [a for a in artifacts if a not in NFLVERSE_ARTIFACTS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown artifact(s): {', '.join(unknown)}")
+    return artifacts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=parse_seasons, help="e.g. 2024 or 2020-2025 or 2019,2024")
+    parser.add_argument(
+        "--artifacts",
+        type=parse_artifacts,
+        default=list(NFLVERSE_ARTIFACTS),
+        help=f"comma-separated, from: {', '.join(NFLVERSE_ARTIFACTS)}",
+    )
+    parser.add_argument("--workers", type=int, default=6, help="Concurrent downloads")
+    parser.add_argument("--root", type=Path, help="Mirror into this directory instead of the runtime caches")
+    parser.add_argument("--force", action="store_true", help="Download again even when the local copy is current")
+    args = parser.parse_args()
+
+    seasons = args.seasons or list(range(1999, current_season() + 1))
+    jobs = [(artifact, season) for artifact in args.artifacts for season in seasons]
+    print(f"📡 Syncing {len(jobs)} artifact(s) with {args.workers} worker(s)")
+
+    start = time.time()
+    counts: dict[str, int] = {}
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(sync_artifact, artifact, season, args.root, args.force): (artifact, season)
+            for artifact, season in jobs
+        }
+        for future in as_completed(futures):
+            artifact, season = futures[future]
+            try:
+                status = future.result()
+            except Exception as e:
+                failed.append((artifact, season))
+                print(f"❌ {artifact} {season}: {e}")
+                continue
+            counts[status] = counts.get(status, 0) + 1
+            print(f"  ✔ {artifact} {season}: {status}")
+
+    if "pbp" in args.artifacts and args.root is None:
+        CACHE_CATALOG.refresh(seasons)
+
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items())) or "nothing to do"
+    print(f"✅ nflverse sync complete ({time.time() - start:.1f}s): {summary}")
+    if failed:
+        print(f"⚠️ {len(failed)} artifact(s) failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
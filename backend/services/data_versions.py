@@ -0,0 +1,77 @@
+import hashlib
+import os
+from functools import lru_cache
+
+from pbp.normalize.schema import PBP_SCHEMA_VERSION
+from services.nflverse_cache import artifact_path, read_meta
+from services.pbp_catalog import BASE_DIR, CACHE_CATALOG, LOCAL_CATALOG
+
+# ------------------------------------------------------------
+# Input versions (for HTTP validators)
+#
+# Cheap answers to "would this response come out the same?", built
+# from what is already in memory or tiny sidecar files:
+#
+#   PBP        catalog fingerprints (services/pbp_catalog.py)
+#   nflverse   sha256 recorded by the artifact cache
+#   code       hash of the backend sources (or KRAMERBOT_CODE_VERSION)
+#
+# Routes fold these and their query parameters into an ETag and can
+# answer If-None-Match before running any pipeline.
+# ------------------------------------------------------------
+
+# Packages whose code shapes API responses
+CODE_DIRS = ["routers", "services", "utils", "weekly", "pbp"]
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """
+    Set KRAMERBOT_CODE_VERSION (e.g. the deployed commit) to skip hashing.
+    """
+    env = os.getenv("KRAMERBOT_CODE_VERSION")
+    if env:
+        return env
+
+    digest = hashlib.sha1()
+    for name in CODE_DIRS:
+        for path in sorted((BASE_DIR / name).rglob("*.py")):
+            digest.update(str(path.relative_to(BASE_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def artifact_version(artifact: str, season: int) -> str:
+    """
+    Content version of a cached nflverse artifact ("missing" before the
+    first download).
+    """
+    path = artifact_path(artifact, season)
+    sha256 = read_meta(path).get("sha256")
+    if sha256:
+        return sha256
+    try:
+        stat = path.stat()
+    except OSError:
+        return "missing"
+    # A file placed by hand (no sidecar)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def weekly_version(season: int, weeks: list[int]) -> tuple:
+    """
+    Inputs of the weekly pipeline: local PBP for the weeks, rosters and
+    player_stats (snap counts) for the season.
+    """
+    return (
+        tuple(LOCAL_CATALOG.fingerprint(season, week) for week in weeks),
+        artifact_version("rosters", season),
+        artifact_version("player_stats", season),
+    )
+
+
+def pbp_version(season: int, week: int) -> tuple:
+    """
+    Inputs of the PBP service for a week (cached season files).
+    """
+    return CACHE_CATALOG.fingerprint(season, week), PBP_SCHEMA_VERSION
@@ -1,16 +1,10 @@
+import numpy as np
 import pandas as pd
 
 # ============================================================
 #  SAFE NUMERIC ACCESSOR
 # ============================================================
 
-def _num(s, default=0):
-    try:
-        return pd.to_numeric(s, errors="coerce").fillna(default)
-    except Exception:
-        return default if s is None else float(s)
-
-
 def coerce_numeric(val, default=0.0):
     try:
         return float(val)
@@ -20,101 +14,175 @@ def coerce_numeric(val, default=0.0):
 
 # ============================================================
 #  SCORING REGISTRY
+#
+#  A scoring system is points per raw stat. Systems registered with
+#  their coefficients are compiled into one stat × column matrix, so the
+#  comp_* components and every fantasy_points_* column come out of a
+#  single matmul over the frame's stats (no per-system frame copies).
+#  Systems registered as a plain function (df → df) still work: they run
+#  after the matrix pass, in registration order.
 # ============================================================
 
 SCORING_REGISTRY = {}
 
-def register_scoring(name: str):
+# name → {stat: points}, for systems the matrix computes
+SCORING_COEFFICIENTS = {}
+
+# Route scoring= value → fantasy_points_* column
+SCORING_COLUMNS = {}
+
+_COMPILED = {}
+
+
+def register_scoring(name: str, coefficients: dict | None = None):
     def wrapper(func):
         SCORING_REGISTRY[name] = func
+        SCORING_COLUMNS[name] = f"fantasy_points_{name}"
+        if coefficients is not None:
+            SCORING_COEFFICIENTS[name] = dict(coefficients)
+        else:
+            SCORING_COEFFICIENTS.pop(name, None)
+        _COMPILED.clear()
         return func
     return wrapper
 
 
 # ============================================================
-#  BASE COMPONENT BUILDER
+#  COEFFICIENTS
 # ============================================================
 
-def add_fantasy_components(d: pd.DataFrame) -> pd.DataFrame:
+# Raw stat → comp_* column, in output order
+SCORING_STATS = [
+    "passing_yards", "rushing_yards", "receiving_yards",
+    "passing_tds", "rushing_tds", "receiving_tds",
+    "interceptions", "fumbles_lost", "sack_fumbles", "sack_fumbles_lost",
+    "receptions",
+]
+
+STANDARD_POINTS = {
+    # Yardage
+    "passing_yards": 0.04,
+    "rushing_yards": 0.10,
+    "receiving_yards": 0.10,
+    # TDs
+    "passing_tds": 4,
+    "rushing_tds": 6,
+    "receiving_tds": 6,
+    # Turnovers
+    "interceptions": -2,
+    "fumbles_lost": -2,
+    "sack_fumbles": -2,
+    "sack_fumbles_lost": -2,
+}
+
+PPR_POINTS = {**STANDARD_POINTS, "receptions": 1.0}
+HALF_PPR_POINTS = {**STANDARD_POINTS, "receptions": 0.5}
+
+# The comp_* columns attribution splits points into. Receptions carry
+# half-PPR points, as they always have for every scoring system.
+COMPONENT_POINTS = HALF_PPR_POINTS
+
+# Totals are rounded to this many decimals (far below any real scoring unit)
+POINTS_DECIMALS = 9
+
+
+def _compiled() -> tuple[list[str], list[str], np.ndarray]:
     """
-    Adds universal fantasy component fields based on raw stats.
-    These are used by ALL scoring systems.
+    (input stats, output columns, stat × column coefficient matrix) for
+    the components and the registered coefficient systems.
     """
+    if "matrix" not in _COMPILED:
+        systems = list(SCORING_COEFFICIENTS)
+        stats = list(dict.fromkeys(
+            SCORING_STATS + [s for name in systems for s in SCORING_COEFFICIENTS[name]]
+        ))
+        columns = [f"comp_{s}" for s in SCORING_STATS] + [SCORING_COLUMNS[name] for name in systems]
 
-    # Yardage components
-    d["comp_passing_yards"]   = _num(d.get("passing_yards", 0))   * 0.04
-    d["comp_rushing_yards"]   = _num(d.get("rushing_yards", 0))   * 0.10
-    d["comp_receiving_yards"] = _num(d.get("receiving_yards", 0)) * 0.10
+        matrix = np.zeros((len(stats), len(columns)))
+        for j, stat in enumerate(SCORING_STATS):
+            matrix[j, j] = COMPONENT_POINTS.get(stat, 0.0)
+        for k, name in enumerate(systems, start=len(SCORING_STATS)):
+            for stat, points in SCORING_COEFFICIENTS[name].items():
+                matrix[stats.index(stat), k] = points
 
-    # TD components
-    d["comp_passing_tds"]   = _num(d.get("passing_tds", 0))   * 4
-    d["comp_rushing_tds"]   = _num(d.get("rushing_tds", 0))   * 6
-    d["comp_receiving_tds"] = _num(d.get("receiving_tds", 0)) * 6
+        _COMPILED.update(stats=stats, columns=columns, matrix=matrix)
+    return _COMPILED["stats"], _COMPILED["columns"], _COMPILED["matrix"]
 
-    # Turnovers
-    d["comp_interceptions"]      = _num(d.get("interceptions", 0))      * -2
-    d["comp_fumbles_lost"]       = _num(d.get("fumbles_lost", 0))       * -2
-    d["comp_sack_fumbles"]       = _num(d.get("sack_fumbles", 0))       * -2
-    d["comp_sack_fumbles_lost"]  = _num(d.get("sack_fumbles_lost", 0))  * -2
 
-    # Receptions (PPR variants override this)
-    d["comp_receptions"] = _num(d.get("receptions", 0)) * 0.0
+def _stat_array(df: pd.DataFrame, stats: list[str]) -> np.ndarray:
+    """
+    The frame's stats as one float array (missing / non-finite → 0, so
+    a bad value cannot leak into other columns through a zero coefficient).
+    """
+    values = np.zeros((len(df), len(stats)))
+    for j, stat in enumerate(stats):
+        if stat in df.columns:
+            col = pd.to_numeric(df[stat], errors="coerce")
+            values[:, j] = col.to_numpy(dtype=float, na_value=0.0)
+    return np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def score_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    A copy of the frame with every comp_* component and the
+    fantasy_points_* column of every coefficient system, in one matmul.
+    """
+    stats, columns, matrix = _compiled()
+    points = _stat_array(df, stats) @ matrix
+
+    # The matmul sums in its own order: snap totals to the scoring grid
+    # so cancelling components (e.g. -1 and +1 yards) give exactly 0
+    totals = len(SCORING_STATS)
+    points[:, totals:] = points[:, totals:].round(POINTS_DECIMALS)
+
+    return df.assign(**{c: points[:, j] for j, c in enumerate(columns)})
 
+
+# ============================================================
+#  BASE COMPONENT BUILDER
+# ============================================================
+
+def add_fantasy_components(d: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds universal fantasy component fields based on raw stats.
+    These are used by ALL scoring systems.
+    """
+    points = _stat_array(d, SCORING_STATS) * [COMPONENT_POINTS.get(s, 0.0) for s in SCORING_STATS]
+    for j, stat in enumerate(SCORING_STATS):
+        d[f"comp_{stat}"] = points[:, j]
     return d
 
 
 # ============================================================
 #  SCORING SYSTEMS
+#
+#  Direct calls score a single frame; apply_all_scoring computes the
+#  coefficient systems together.
 # ============================================================
 
-@register_scoring("standard")
+@register_scoring("standard", STANDARD_POINTS)
 def score_standard(df: pd.DataFrame) -> pd.DataFrame:
-    d = add_fantasy_components(df.copy())
-
-    d["fantasy_points_standard"] = (
-        d["comp_passing_yards"]
-        + d["comp_rushing_yards"]
-        + d["comp_receiving_yards"]
-        + d["comp_passing_tds"]
-        + d["comp_rushing_tds"]
-        + d["comp_receiving_tds"]
-        + d["comp_interceptions"]
-        + d["comp_fumbles_lost"]
-        + d["comp_sack_fumbles"]
-        + d["comp_sack_fumbles_lost"]
-    )
+    return score_frame(df)
 
-    return d
 
-
-@register_scoring("ppr")
+@register_scoring("ppr", PPR_POINTS)
 def score_ppr(df: pd.DataFrame) -> pd.DataFrame:
-    d = score_standard(df)
-    d["comp_receptions"] = _num(d.get("receptions", 0)) * 1.0
-    d["fantasy_points_ppr"] = d["fantasy_points_standard"] + d["comp_receptions"]
-    return d
+    return score_frame(df)
 
 
-@register_scoring("half")
+@register_scoring("half", HALF_PPR_POINTS)
 def score_half_ppr(df: pd.DataFrame) -> pd.DataFrame:
-    d = score_standard(df)
-    d["comp_receptions"] = _num(d.get("receptions", 0)) * 0.5
-    d["fantasy_points_half"] = d["fantasy_points_standard"] + d["comp_receptions"]
-    return d
+    return score_frame(df)
 
 
-@register_scoring("vandalay")
+@register_scoring("vandalay", HALF_PPR_POINTS)
 def score_vandalay(df: pd.DataFrame) -> pd.DataFrame:
-    d = score_half_ppr(df)
-    d["fantasy_points_vandalay"] = d["fantasy_points_half"]
-    return d
+    return score_frame(df)
 
 
-@register_scoring("shen2000")
+@register_scoring("shen2000", HALF_PPR_POINTS)
 def score_shen2000(df: pd.DataFrame) -> pd.DataFrame:
-    d = score_half_ppr(df)
-    d["fantasy_points_shen2000"] = d["fantasy_points_half"]
-    return d
+    return score_frame(df)
 
 
 # ============================================================
@@ -122,31 +190,29 @@ def score_shen2000(df: pd.DataFrame) -> pd.DataFrame:
 # ============================================================
 
 def apply_all_scoring(df: pd.DataFrame) -> pd.DataFrame:
-    d = df.copy()
+    d = score_frame(df)
     for name, func in SCORING_REGISTRY.items():
-        d = func(d)
+        # Function-only systems
+        if name not in SCORING_COEFFICIENTS:
+            d = func(d)
     return d
 
 
-def apply_scoring(df: pd.DataFrame, scoring: str) -> pd.DataFrame:
+def canonical_scoring(scoring: str | None) -> str:
+    """
+    The SCORING_COLUMNS name a scoring= value selects ("Half-PPR" → "half";
+    unknown systems score as standard).
+    """
     scoring = (scoring or "standard").lower()
-
-    d = apply_all_scoring(df)
-
     if scoring in ["half_ppr", "half-ppr"]:
         scoring = "half"
+    return scoring if scoring in SCORING_COLUMNS else "standard"
+
 
-    col_map = {
-        "standard": "fantasy_points_standard",
-        "ppr": "fantasy_points_ppr",
-        "half": "fantasy_points_half",
-        "vandalay": "fantasy_points_vandalay",
-        "shen2000": "fantasy_points_shen2000",
-    }
+def apply_scoring(df: pd.DataFrame, scoring: str) -> pd.DataFrame:
+    d = apply_all_scoring(df)
 
-    col = col_map.get(scoring, "fantasy_points_standard")
+    col = SCORING_COLUMNS[canonical_scoring(scoring)]
     d["fantasy_points"] = d.get(col, d["fantasy_points_standard"])
 
     return d
-
-
@@ -0,0 +1,175 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# ------------------------------------------------------------
+# Hot-frame encoding
+#
+# Weekly frames are kept dictionary-encoded while they move through
+# the pipeline and the caches:
+#
+#   player_id      → int32 surrogate key (PLAYER_KEYS, -1 = missing)
+#   team, position → pandas category
+#
+# Group-bys and merges then hash ints and category codes instead of
+# "00-00xxxxx" strings. Frames are decoded back to strings only where
+# they leave the process (route serialization, the player-week table).
+# Surrogate keys are process-local and must never be persisted.
+# ------------------------------------------------------------
+
+PLAYER_KEY_DTYPE = np.int32
+MISSING_KEY = -1
+
+CATEGORY_COLUMNS = ["team", "position"]
+
+# PBP string columns dictionary-encoded at scan time in the Polars builder
+PBP_CATEGORICAL_COLUMNS = [
+    "season_type", "play_type", "posteam",
+    "receiver_id", "receiver", "rusher_id", "rusher", "passer_id", "passer",
+]
+
+
+class PlayerKeyRegistry:
+    """
+    Append-only, thread-safe map between player_id strings and int32 keys.
+    A player keeps the same key for the life of the process.
+    """
+
+    def __init__(self):
+        self._keys: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._lookup = np.empty(0, dtype=object)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def encode(self, values) -> np.ndarray:
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+
+        with self._lock:
+            keys = []
+            for player_id in uniques:
+                key = self._keys.get(player_id)
+                if key is None:
+                    key = self._keys[player_id] = len(self._ids)
+                    self._ids.append(player_id)
+                keys.append(key)
+
+        keys = np.asarray(keys, dtype=PLAYER_KEY_DTYPE)
+        if not len(keys):
+            return np.full(len(codes), MISSING_KEY, dtype=PLAYER_KEY_DTYPE)
+        return np.where(codes >= 0, keys[np.maximum(codes, 0)], MISSING_KEY).astype(PLAYER_KEY_DTYPE)
+
+    def decode(self, keys) -> np.ndarray:
+        keys = np.asarray(keys, dtype=np.int64)
+
+        with self._lock:
+            if len(self._lookup) != len(self._ids):
+                self._lookup = np.array(self._ids, dtype=object)
+            lookup = self._lookup
+
+        if not len(lookup):
+            return np.full(len(keys), None, dtype=object)
+        ids = lookup[np.clip(keys, 0, len(lookup) - 1)]
+        ids[keys < 0] = None
+        return ids
+
+
+PLAYER_KEYS = PlayerKeyRegistry()
+
+
+# ============================================================
+# PANDAS FRAMES
+# ============================================================
+
+def is_encoded(df: pd.DataFrame) -> bool:
+    return "player_id" in df.columns and pd.api.types.is_integer_dtype(df["player_id"])
+
+
+def encode_player_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replaces a string player_id column with int32 surrogate keys.
+    """
+    if "player_id" not in df.columns or is_encoded(df):
+        return df
+    df = df.copy()
+    df["player_id"] = PLAYER_KEYS.encode(df["player_id"])
+    return df
+
+
+def _object_categories(col: pd.Series) -> pd.Series:
+    """
+    The categorical column with object categories. An all-null column
+    would otherwise get float64 categories, which cannot be unioned with
+    the string categories of other weeks.
+    """
+    categories = col.cat.categories
+    if categories.dtype == object:
+        return col
+    return col.cat.rename_categories(pd.Index(categories, dtype=object))
+
+
+def encode_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Encodes a weekly frame: int32 player keys + categorical team/position.
+    """
+    df = encode_player_ids(df)
+    cols = [c for c in CATEGORY_COLUMNS if c in df.columns and df[c].dtype != "category"]
+    if not cols:
+        return df
+    df = df.copy()
+    for col in cols:
+        df[col] = _object_categories(df[col].astype("category"))
+    return df
+
+
+def decode_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Maps player keys back to player_id strings and categoricals back to
+    plain object columns. A no-op for frames that are not encoded.
+    """
+    cat_cols = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not is_encoded(df) and not cat_cols:
+        return df
+
+    df = df.copy()
+    if is_encoded(df):
+        df["player_id"] = PLAYER_KEYS.decode(df["player_id"].to_numpy())
+    for col in cat_cols:
+        df[col] = df[col].astype(object)
+    return df
+
+
+def concat_encoded(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    pd.concat that keeps categorical columns categorical when the frames
+    were encoded with different category sets.
+    """
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    for col in CATEGORY_COLUMNS:
+        if all(col in f.columns and isinstance(f[col].dtype, pd.CategoricalDtype) for f in frames):
+            categories = pd.api.types.union_categoricals([_object_categories(f[col]) for f in frames]).categories
+            dtype = pd.CategoricalDtype(categories)
+            frames = [f.assign(**{col: f[col].astype(dtype)}) for f in frames]
+
+    return pd.concat(frames, ignore_index=True)
+
+
+# ============================================================
+# POLARS SCANS
+# ============================================================
+
+def categorize_pbp(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Casts the low-cardinality / key string columns of a PBP scan to
+    Categorical so group_by and joins run on integer codes.
+    """
+    available = lf.collect_schema().names()
+    cols = [c for c in PBP_CATEGORICAL_COLUMNS if c in available]
+    return lf.with_columns(pl.col(cols).cast(pl.Categorical)) if cols else lf
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from services.loaders.frame_encoding import encode_player_ids, is_encoded
+
 
 def _ensure_columns(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     """
@@ -63,6 +65,9 @@ def harmonize_ids(weekly: pd.DataFrame, rosters: pd.DataFrame) -> pd.DataFrame:
     - Never overwrite good PBP values
     - Only fill missing values from roster
     - Backfill player_id using name+team when safe
+
+    When the weekly frame carries int32 player keys (see frame_encoding),
+    the roster is keyed the same way so the joins run on ints.
     """
 
     if weekly.empty or rosters.empty:
@@ -77,6 +82,9 @@ def harmonize_ids(weekly: pd.DataFrame, rosters: pd.DataFrame) -> pd.DataFrame:
     if "player_id" not in r.columns:
         return w
 
+    if is_encoded(w):
+        r = encode_player_ids(r)
+
     # ------------------------------------------------------------
     # 1. Join on player_id (strongest key)
     # ------------------------------------------------------------
@@ -1,279 +1,395 @@
 import pandas as pd
 import polars as pl
-from pathlib import Path
+import pyarrow.parquet as pq
+
+from pbp.normalize.schema import enforce_schema
+from services.loaders.frame_encoding import categorize_pbp
+from services.pbp_catalog import LOCAL_CATALOG, LOCAL_PBP_DIR
 
-from services.nfl_pbp_service import pbp_week
 
 # ------------------------------------------------------------
-# Local PBP directory (written by your R ingestion pipeline)
+# Scan projection: columns each stat family reads
 # ------------------------------------------------------------
-BASE_DIR = Path(__file__).resolve().parents[2]
-LOCAL_PBP_DIR = BASE_DIR / "data" / "pbp"   # <-- UPDATED PATH
+PBP_FILTER_COLUMNS = ["season", "week", "season_type", "play_type"]
+
+PBP_FAMILY_COLUMNS = {
+    "receiving": [
+        "receiver_id", "receiver", "passer_id", "posteam",
+        "complete_pass", "yards_gained", "air_yards", "epa",
+        "touchdown", "fumble_lost",
+    ],
+    "rushing": [
+        "rusher_id", "rusher", "posteam",
+        "yards_gained", "epa", "touchdown", "fumble_lost",
+    ],
+    "passing": [
+        "passer_id", "passer", "receiver_id", "posteam",
+        "pass_attempt", "complete_pass", "yards_gained", "air_yards",
+        "first_down", "epa", "touchdown", "interception", "fumble_lost",
+        "desc",
+    ],
+}
+
+# play_type values each stat family is built from
+PBP_FAMILY_PLAY_TYPES = {
+    "receiving": ["pass"],
+    "rushing": ["run"],
+    "passing": ["pass"],
+}
+
+
+def pbp_scan_columns(families: list[str] | None = None) -> list[str]:
+    """
+    Returns the de-duplicated PBP columns needed by the given stat families
+    (all families when None), including the filter columns.
+    """
+    families = families or list(PBP_FAMILY_COLUMNS)
+    cols = list(PBP_FILTER_COLUMNS)
+    for family in families:
+        for col in PBP_FAMILY_COLUMNS[family]:
+            if col not in cols:
+                cols.append(col)
+    return cols
+
+
+def pbp_scan_play_types(families: list[str] | None = None) -> list[str]:
+    """
+    Returns the play_type values needed by the given stat families.
+    """
+    families = families or list(PBP_FAMILY_PLAY_TYPES)
+    play_types = []
+    for family in families:
+        for play_type in PBP_FAMILY_PLAY_TYPES[family]:
+            if play_type not in play_types:
+                play_types.append(play_type)
+    return play_types
 
 
 # ------------------------------------------------------------
 # Unified PBP Loader (local parquet only)
 # ------------------------------------------------------------
-def load_pbp_local(season: int) -> pl.LazyFrame:
+def load_pbp_local(
+    season: int,
+    columns: list[str] | None = None,
+    week: int | None = None,
+    season_type: str | None = None,
+    play_types: list[str] | None = None,
+    weeks: list[int] | None = None,
+) -> pl.LazyFrame:
     """
     Loads PBP for a season from local parquet written by the R ingestion pipeline.
     Always returns a LazyFrame (may be empty).
-    """
-    path = LOCAL_PBP_DIR / f"pbp_{season}.parquet"
 
-    if not path.exists():
-        print(f"⚠️ Missing local PBP parquet for {season}: {path}")
+    When the season has been converted to week partitions, only the
+    requested weeks' partition files are scanned.
+
+    Optional arguments are pushed into the parquet scan:
+    - columns: projection (columns missing from the file are skipped)
+    - week / weeks / season_type / play_types: row filters, applied before
+      the projection so row groups whose statistics exclude them are never
+      decoded. `weeks` selects several weeks in one scan.
+
+    Columns come back in the compact PBP_SCHEMA dtypes.
+    """
+    entry = LOCAL_CATALOG.entry(season)
+    if entry is None:
+        print(f"⚠️ Missing local PBP parquet for {season}: {LOCAL_PBP_DIR}")
         return pl.LazyFrame()  # empty LF
 
-    print(f"🔥 Loading local PBP parquet for {season}: {path}")
-    return pl.scan_parquet(path)
+    if week is not None:
+        weeks = [week]
+    if weeks is not None:
+        weeks = [w for w in sorted(set(weeks)) if LOCAL_CATALOG.has_week(season, w)]
+        if not weeks:
+            return pl.LazyFrame()
+        if len(weeks) == 1:
+            week = weeks[0]
+
+    partitioned = entry["layout"] == "partitioned"
+    if partitioned:
+        print(f"🔥 Loading local PBP partitions for {season} (weeks={weeks})")
+        if weeks is None:
+            files = LOCAL_CATALOG.files(season)
+        else:
+            files = list(dict.fromkeys(f for w in weeks for f in LOCAL_CATALOG.files(season, w)))
+        lf = pl.scan_parquet(files, hive_partitioning=False)
+    elif week is not None and (groups := _week_row_groups(season, week)):
+        print(f"🔥 Loading local PBP row groups for {season} week {week}")
+        lf = _read_row_groups(groups, columns)
+    else:
+        path = LOCAL_CATALOG.files(season)[0]
+        print(f"🔥 Loading local PBP parquet for {season}: {path}")
+        lf = pl.scan_parquet(path)
+
+    # Schema comes from the parquet footer — no data pages are read
+    available = lf.collect_schema().names()
+
+    filters = []
+    # Week partitions already contain only the requested weeks
+    if weeks is not None and not partitioned and "week" in available:
+        filters.append(pl.col("week") == week if len(weeks) == 1 else pl.col("week").is_in(weeks))
+    if season_type is not None and "season_type" in available:
+        filters.append(pl.col("season_type") == season_type)
+    if play_types is not None and "play_type" in available:
+        filters.append(pl.col("play_type").is_in(play_types))
+
+    if filters:
+        lf = lf.filter(filters)
+
+    if columns is not None:
+        lf = lf.select([c for c in columns if c in available])
+
+    return enforce_schema(lf)
+
+
+def _week_row_groups(season: int, week: int) -> list[tuple]:
+    """
+    The catalog's row groups for a week, when they are a strict subset of
+    the season file's (files written one row group per week or per game).
+    Empty when the whole file would have to be read anyway.
+    """
+    groups = LOCAL_CATALOG.row_groups(season, week)
+    files = {f["path"]: f for f in LOCAL_CATALOG.entry(season)["files"]}
+    total = sum(f["row_groups"] for f in files.values())
+    if not groups or sum(len(idx) for _, idx in groups) >= total:
+        return []
+    return groups
+
+
+def _read_row_groups(groups: list[tuple], columns: list[str] | None) -> pl.LazyFrame:
+    frames = []
+    for path, indices in groups:
+        pf = pq.ParquetFile(path)
+        cols = None
+        if columns is not None:
+            names = pf.schema_arrow.names
+            # Keep the filter columns so the week filter below still applies
+            cols = [c for c in dict.fromkeys(PBP_FILTER_COLUMNS + list(columns)) if c in names]
+        frames.append(pl.from_arrow(pf.read_row_groups(indices, columns=cols)))
+    return pl.concat(frames, how="diagonal_relaxed").lazy()
 
 
 # ------------------------------------------------------------
 # Weekly Builder (PBP → player-level weekly stats)
 # ------------------------------------------------------------
-def load_weekly_from_pbp(season: int, week: int) -> pd.DataFrame:
-    """
-    Builds weekly player-level stats from local PBP parquet.
-    This is the unified weekly builder for ALL seasons.
-    """
-    # Load the parquet
-    local_path = LOCAL_PBP_DIR / f"pbp_{season}.parquet"
+WEEKLY_KEYS = ["player_id", "player_name", "team"]
 
-    # Debug: print schema
-    pbp_week = pd.read_parquet(local_path)
-    print(f"DEBUG: Loaded PBP for {season} week {week}")
-    print("PBP COLUMNS:", pbp_week.columns.tolist())
+# Final column order (matches the pandas reference builder in
+# tests/test_weekly_builder_parity.py)
+WEEKLY_STAT_COLUMNS = [
+    "targets", "receptions", "receiving_yards", "receiving_air_yards",
+    "receiving_epa", "receiving_tds",
+    "carries", "rushing_yards", "rushing_epa", "rushing_tds",
+    "attempts", "completions", "passing_yards", "passing_air_yards",
+    "passing_first_downs", "passing_epa", "passing_tds", "interceptions",
+    "sack_fumbles", "sack_fumbles_lost",
+    "fumbles_lost",
+]
 
-    lf = load_pbp_local(season)
+# Event counts that are 0 (not null) for players outside their family
+WEEKLY_ZERO_FILL_COLUMNS = [
+    "receiving_tds", "rushing_tds", "passing_tds", "interceptions", "fumbles_lost",
+]
 
-    # ------------------------------------------------------------
-    # FIX #1 — LazyFrame has no .is_empty(), so we check via collect()
-    # ------------------------------------------------------------
-    try:
-        # Filter by week inside Polars (fast)
-        lf_week = lf.filter(pl.col("week") == week)
 
-        # Collect to pandas
-        pbp_week = lf_week.collect().to_pandas()
-    except Exception as e:
-        print(f"❌ ERROR collecting PBP for {season} week {week}: {e}")
-        return pd.DataFrame()
+def _count_events(lf: pl.LazyFrame, id_col: str, alias: str) -> pl.LazyFrame:
+    return lf.group_by([id_col, "week"]).agg(pl.len().alias(alias))
 
-    if pbp_week.empty:
-        return pd.DataFrame()
+
+def build_weekly_plan(lf: pl.LazyFrame, season: int) -> pl.LazyFrame:
+    """
+    Builds the weekly player stats as ONE lazy plan over PBP for one or
+    more weeks. Every group_by and join is keyed by week as well, so a
+    multi-week scan yields one row per player-week in the same pass.
+
+    The three stat families share the same scan (Polars eliminates the
+    common subplan), so a single collect() runs every filter, group_by and
+    join multithreaded in Polars without touching the GIL. Player, team and
+    play-type strings are dictionary-encoded first, so those group_bys and
+    joins work on integer codes; keys come back out as strings.
+    """
+    lf = categorize_pbp(lf.with_columns(pl.col(pl.Boolean).cast(pl.Int8)))
+
+    passes = lf.filter(pl.col("play_type") == "pass")
+    runs = lf.filter(pl.col("play_type") == "run")
+    desc = pl.col("desc").str.to_lowercase()
 
     # ------------------------------------------------------------
     # RECEIVING
     # ------------------------------------------------------------
-
-    rec_events = pbp_week[pbp_week["play_type"] == "pass"]
-
-    # Receiving TDs
-    rec_td_events = rec_events[
-        (rec_events["touchdown"] == 1) &
-        (rec_events["receiver_id"].notna()) &
-        (rec_events["passer_id"].notna())
-    ]
-
-    # Receiving fumbles lost
-    rec_fumble_lost_events = rec_events[
-        (rec_events["fumble_lost"] == 1) &
-        (rec_events["receiver_id"].notna())
-    ]
-    # Count events by receiver_id
-    rec_td_counts = rec_td_events.groupby("receiver_id").size().rename("receiving_tds")
-    rec_fumble_lost_counts = rec_fumble_lost_events.groupby("receiver_id").size().rename("fumbles_lost")
-
-    # Base receiving stats
-    rec_df = (
-        rec_events.groupby(["receiver_id", "receiver", "posteam"], dropna=True)
+    rec = (
+        passes
+        .filter(pl.all_horizontal(pl.col(["receiver_id", "receiver", "posteam"]).is_not_null()))
+        .group_by(["receiver_id", "receiver", "posteam", "week"])
         .agg(
-            targets=("receiver_id", "count"),
-            receptions=("complete_pass", "sum"),
-            receiving_yards=("yards_gained", "sum"),
-            receiving_air_yards=("air_yards", "sum"),
-            receiving_epa=("epa", "sum"),
+            pl.len().alias("targets"),
+            pl.col("complete_pass").sum().alias("receptions"),
+            pl.col("yards_gained").sum().alias("receiving_yards"),
+            pl.col("air_yards").sum().alias("receiving_air_yards"),
+            pl.col("epa").sum().alias("receiving_epa"),
+        )
+        .join(
+            _count_events(
+                passes.filter(
+                    (pl.col("touchdown") == 1)
+                    & pl.col("receiver_id").is_not_null()
+                    & pl.col("passer_id").is_not_null()
+                ),
+                "receiver_id", "receiving_tds",
+            ),
+            on=["receiver_id", "week"], how="left",
+        )
+        .join(
+            _count_events(
+                passes.filter((pl.col("fumble_lost") == 1) & pl.col("receiver_id").is_not_null()),
+                "receiver_id", "rec_fumbles_lost",
+            ),
+            on=["receiver_id", "week"], how="left",
         )
-        .reset_index()
+        .with_columns(pl.col(["receiving_tds", "rec_fumbles_lost"]).fill_null(0))
+        .rename({"receiver_id": "player_id", "receiver": "player_name", "posteam": "team"})
     )
 
-    # Merge event counts
-    rec_df = (
-        rec_df
-        .merge(rec_td_counts, on="receiver_id", how="left")
-        .merge(rec_fumble_lost_counts, on="receiver_id", how="left")
-        .fillna(0)
-    )
-    # Final rename
-    rec_df = rec_df.rename(columns={
-        "receiver_id": "player_id",
-        "receiver": "player_name",
-        "posteam": "team"
-    })
-    
     # ------------------------------------------------------------
     # RUSHING
     # ------------------------------------------------------------
-
-    rush_events = pbp_week[pbp_week["play_type"] == "run"]
-
-    # Rushing TDs
-    rush_td_events = rush_events[
-        (rush_events["touchdown"] == 1) &
-        (rush_events["rusher_id"].notna())
-    ]
-    # Rushing fumbles lost
-    rush_fumble_lost_events = rush_events[
-        (rush_events["fumble_lost"] == 1) &
-        (rush_events["rusher_id"].notna())
-    ]
-    # Count events by rusher_id
-    rush_td_counts = rush_td_events.groupby("rusher_id").size().rename("rushing_tds")
-    rush_fumble_lost_counts = rush_fumble_lost_events.groupby("rusher_id").size().rename("fumbles_lost")
-
-    # Base rushing stats
-    rush_df = (
-        rush_events.groupby(["rusher_id", "rusher", "posteam"], dropna=True)
+    rush = (
+        runs
+        .filter(pl.all_horizontal(pl.col(["rusher_id", "rusher", "posteam"]).is_not_null()))
+        .group_by(["rusher_id", "rusher", "posteam", "week"])
         .agg(
-            carries=("rusher_id", "count"),
-            rushing_yards=("yards_gained", "sum"),
-            rushing_epa=("epa", "sum"),
+            pl.len().alias("carries"),
+            pl.col("yards_gained").sum().alias("rushing_yards"),
+            pl.col("epa").sum().alias("rushing_epa"),
         )
-        .reset_index()
-    )
-
-    # Merge event counts
-    rush_df = (
-        rush_df
-        .merge(rush_td_counts, on="rusher_id", how="left")
-        .merge(rush_fumble_lost_counts, on="rusher_id", how="left")
-        .fillna(0)
+        .join(
+            _count_events(
+                runs.filter((pl.col("touchdown") == 1) & pl.col("rusher_id").is_not_null()),
+                "rusher_id", "rushing_tds",
+            ),
+            on=["rusher_id", "week"], how="left",
+        )
+        .join(
+            _count_events(
+                runs.filter((pl.col("fumble_lost") == 1) & pl.col("rusher_id").is_not_null()),
+                "rusher_id", "rush_fumbles_lost",
+            ),
+            on=["rusher_id", "week"], how="left",
+        )
+        .with_columns(pl.col(["rushing_tds", "rush_fumbles_lost"]).fill_null(0))
+        .rename({"rusher_id": "player_id", "rusher": "player_name", "posteam": "team"})
     )
 
-    # Final rename
-    rush_df = rush_df.rename(columns={
-        "rusher_id": "player_id",
-        "rusher": "player_name",
-        "posteam": "team"
-    })
-
     # ------------------------------------------------------------
     # PASSING
     # ------------------------------------------------------------
+    passer = pl.col("passer_id").is_not_null()
+    sack_fumbles_lost = passes.filter(
+        (pl.col("fumble_lost") == 1) & desc.str.contains("sack", literal=True) & passer
+    )
 
-    # TRUE pass plays only
-    pass_events = pbp_week[pbp_week["play_type"] == "pass"]
-    # Passing TDs
-    pass_td_events = pass_events[
-        (pass_events["touchdown"] == 1) &
-        (pass_events["desc"].str.contains("pass", case=False, na=False)) &
-        (pass_events["receiver_id"].notna()) &
-        (pass_events["passer_id"].notna())
-    ]
-
-    # Interceptions
-    int_events = pass_events[
-        (pass_events["interception"] == 1) &
-        (pass_events["desc"].str.contains("intercept", case=False, na=False)) &
-        (pass_events["passer_id"].notna())
-    ]
-
-    # Sack fumbles lost
-    sack_fumble_lost_events = pass_events[
-        (pass_events["fumble_lost"] == 1) &
-        (pass_events["desc"].str.contains("sack", case=False, na=False)) &
-        (pass_events["passer_id"].notna())
-    ]
-
-    # Sack fumbles = sack fumbles lost (no separate fumble column)
-    sack_fumble_events = sack_fumble_lost_events
-
-    # ------------------------------------------------------------
-    # Count events by passer_id (THIS is the fix)
-    # ------------------------------------------------------------
-
-    td_counts = pass_td_events.groupby("passer_id").size().rename("passing_tds")
-    int_counts = int_events.groupby("passer_id").size().rename("interceptions")
-    sack_f_counts = sack_fumble_events.groupby("passer_id").size().rename("sack_fumbles")
-    sack_f_lost_counts = sack_fumble_lost_events.groupby("passer_id").size().rename("sack_fumbles_lost")
-
-    # ------------------------------------------------------------
-    # Base passing stats
-    # ------------------------------------------------------------
-
-    pass_df = (
-        pass_events.groupby(["passer_id", "passer", "posteam"], dropna=True)
+    pas = (
+        passes
+        .filter(pl.all_horizontal(pl.col(["passer_id", "passer", "posteam"]).is_not_null()))
+        .group_by(["passer_id", "passer", "posteam", "week"])
         .agg(
-            attempts=("pass_attempt", "sum"),
-            completions=("complete_pass", "sum"),
-            passing_yards=("yards_gained", "sum"),
-            passing_air_yards=("air_yards", "sum"),
-            passing_first_downs=("first_down", "sum"),
-            passing_epa=("epa", "sum"),
+            pl.col("pass_attempt").sum().alias("attempts"),
+            pl.col("complete_pass").sum().alias("completions"),
+            pl.col("yards_gained").sum().alias("passing_yards"),
+            pl.col("air_yards").sum().alias("passing_air_yards"),
+            pl.col("first_down").sum().alias("passing_first_downs"),
+            pl.col("epa").sum().alias("passing_epa"),
         )
-        .reset_index()
+        .join(
+            _count_events(
+                passes.filter(
+                    (pl.col("touchdown") == 1)
+                    & desc.str.contains("pass", literal=True)
+                    & pl.col("receiver_id").is_not_null()
+                    & passer
+                ),
+                "passer_id", "passing_tds",
+            ),
+            on=["passer_id", "week"], how="left",
+        )
+        .join(
+            _count_events(
+                passes.filter(
+                    (pl.col("interception") == 1) & desc.str.contains("intercept", literal=True) & passer
+                ),
+                "passer_id", "interceptions",
+            ),
+            on=["passer_id", "week"], how="left",
+        )
+        # Sack fumbles = sack fumbles lost (no separate fumble column)
+        .join(_count_events(sack_fumbles_lost, "passer_id", "sack_fumbles"), on=["passer_id", "week"], how="left")
+        .join(_count_events(sack_fumbles_lost, "passer_id", "sack_fumbles_lost"), on=["passer_id", "week"], how="left")
+        .with_columns(
+            pl.col(["passing_tds", "interceptions", "sack_fumbles", "sack_fumbles_lost"]).fill_null(0)
+        )
+        .rename({"passer_id": "player_id", "passer": "player_name", "posteam": "team"})
     )
 
     # ------------------------------------------------------------
-    # Merge event counts
+    # MERGE ALL THREE (outer on player_id + player_name + team)
     # ------------------------------------------------------------
+    weekly = (
+        rec
+        .join(rush, on=WEEKLY_KEYS + ["week"], how="full", coalesce=True)
+        .join(pas, on=WEEKLY_KEYS + ["week"], how="full", coalesce=True)
+    )
 
-    pass_df = (
-        pass_df
-        .merge(td_counts, on="passer_id", how="left")
-        .merge(int_counts, on="passer_id", how="left")
-        .merge(sack_f_counts, on="passer_id", how="left")
-        .merge(sack_f_lost_counts, on="passer_id", how="left")
-        .fillna(0)
+    return (
+        weekly
+        .with_columns(
+            pl.sum_horizontal("rec_fumbles_lost", "rush_fumbles_lost").alias("fumbles_lost"),
+        )
+        .with_columns(pl.col(WEEKLY_ZERO_FILL_COLUMNS).fill_null(0))
+        .select(
+            pl.col(WEEKLY_KEYS).cast(pl.String),
+            pl.col(WEEKLY_STAT_COLUMNS).cast(pl.Float64),
+            pl.lit(season, dtype=pl.Int64).alias("season"),
+            pl.col("week").cast(pl.Int64),
+        )
+        .sort(["week"] + WEEKLY_KEYS)
     )
 
-    # ------------------------------------------------------------
-    # Final rename
-    # ------------------------------------------------------------
 
-    pass_df = pass_df.rename(columns={
-        "passer_id": "player_id",
-        "passer": "player_name",
-        "posteam": "team"
-    })
+def load_weekly_from_pbp(season: int, week: int, season_type: str | None = None) -> pd.DataFrame:
+    """
+    Builds weekly player-level stats from local PBP parquet.
+    This is the unified weekly builder for ALL seasons.
 
-    # ------------------------------------------------------------
-    # MERGE ALL THREE
-    # ------------------------------------------------------------
-    from functools import reduce
+    Only the columns declared in PBP_FAMILY_COLUMNS and the pass/run plays
+    of the requested week are read from the parquet file. All the work runs
+    in one lazy Polars plan; pandas is only produced at the end.
+    """
+    return load_weeks_from_pbp(season, [week], season_type)
 
-    dfs = [rec_df, rush_df, pass_df]
-    dfs = [df for df in dfs if not df.empty]
 
-    if not dfs:
-        return pd.DataFrame()
-    weekly = reduce(
-        lambda left, right: pd.merge(
-            left, right, on=["player_id", "player_name", "team"], how="outer"
-        ),
-        dfs,
+def load_weeks_from_pbp(season: int, weeks: list[int], season_type: str | None = None) -> pd.DataFrame:
+    """
+    Multi-week form of load_weekly_from_pbp: one scan filtered with
+    week.is_in(weeks) and one grouped pass, one row per player-week.
+    """
+    lf = load_pbp_local(
+        season,
+        columns=pbp_scan_columns(),
+        weeks=weeks,
+        season_type=season_type,
+        play_types=pbp_scan_play_types(),
     )
 
-    # ------------------------------------------------------------
-    # CLEAN UP ROLE-SPECIFIC STAT COLUMNS
-    # ------------------------------------------------------------
+    if "play_type" not in lf.collect_schema().names():
+        return pd.DataFrame()
 
-    def sum_columns(df, base_name):
-        cols = [c for c in df.columns if c == base_name or c.startswith(f"{base_name}_")]
-        if not cols:
-            df[base_name] = 0
-        else:
-            df[base_name] = df[cols].sum(axis=1)
-            df.drop(columns=[c for c in cols if c != base_name], inplace=True)
-        return df
-
-    weekly = sum_columns(weekly, "fumbles_lost")
-    weekly = sum_columns(weekly, "interceptions")
-    weekly = sum_columns(weekly, "passing_tds")
-    weekly = sum_columns(weekly, "rushing_tds")
-    weekly = sum_columns(weekly, "receiving_tds")
-    weekly["season"] = season
-    weekly["week"] = week
-
-    return weekly
\ No newline at end of file
+    try:
+        weekly = build_weekly_plan(lf, season).collect()
+    except Exception as e:
+        print(f"❌ ERROR building weekly stats for {season} weeks {weeks}: {e}")
+        return pd.DataFrame()
+
+    if weekly.is_empty():
+        return pd.DataFrame()
+
+    return weekly.to_pandas()
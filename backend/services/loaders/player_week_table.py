@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from services.data_versions import weekly_version
+from services.loaders.frame_encoding import decode_frame, encode_frame
+from services.pbp_loader import source_fingerprint
+
+# ------------------------------------------------------------
+# Materialized player-week table
+#
+# One parquet per season: data/player_week/player_week_{season}.parquet
+# holding the output of load_weekly_data (weekly builder → harmonize_ids
+# → snap merge) for every built week, one row group per week.
+#
+# The file's schema metadata records, per week, the fingerprint of the
+# inputs it was built from: the local PBP files plus the season's rosters
+# (identity, position) and player_stats (snap_pct) artifacts. A week is
+# served from the table only while that fingerprint still matches.
+#
+# Rows are stored decoded (player_id strings) since surrogate player
+# keys are process-local; they are re-encoded on read.
+# ------------------------------------------------------------
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+PLAYER_WEEK_DIR = BASE_DIR / "data" / "player_week"
+
+# Bump when the weekly pipeline changes shape so old tables go stale
+PLAYER_WEEK_VERSION = "2"
+
+_METADATA_KEY = b"kramerbot.player_week"
+
+
+def table_path(season: int) -> Path:
+    return PLAYER_WEEK_DIR / f"player_week_{season}.parquet"
+
+
+def week_fingerprint(season: int, week: int) -> str | None:
+    """
+    Fingerprint a materialized week must carry to be considered fresh.
+    """
+    fp = source_fingerprint(season, week)
+    if not fp:
+        return None
+    inputs = hashlib.sha1(repr(weekly_version(season, [week])).encode()).hexdigest()[:16]
+    return f"{PLAYER_WEEK_VERSION}:{fp}:{inputs}"
+
+
+def read_table_metadata(season: int) -> dict:
+    """
+    Returns {"weeks": {"<week>": {"fingerprint": str, "rows": int}}, ...}
+    for a season table, or an empty dict when the table does not exist.
+    Only the parquet footer is read.
+    """
+    path = table_path(season)
+    if not path.exists():
+        return {}
+
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        return json.loads(metadata.get(_METADATA_KEY, b"{}"))
+    except Exception as e:
+        print(f"⚠️ Unreadable player-week table for {season}: {e}")
+        return {}
+
+
+def fresh_weeks(season: int) -> list[int]:
+    """
+    Weeks whose materialized rows still match the local PBP input.
+    """
+    weeks = read_table_metadata(season).get("weeks", {})
+    return sorted(
+        int(w) for w, info in weeks.items()
+        if info.get("fingerprint") == week_fingerprint(season, int(w))
+    )
+
+
+def read_player_week(season: int, week: int) -> pd.DataFrame | None:
+    """
+    Returns the materialized frame for a season/week, or None when the week
+    is missing from the table or stale (caller should compute it live).
+    """
+    info = read_table_metadata(season).get("weeks", {}).get(str(week))
+    if info is None:
+        return None
+
+    if info.get("fingerprint") != week_fingerprint(season, week):
+        print(f"⚠️ Player-week table stale for {season} week {week}")
+        return None
+
+    if info.get("rows", 0) == 0:
+        return pd.DataFrame()
+
+    df = pd.read_parquet(table_path(season), filters=[("week", "==", week)])
+    return encode_frame(df.reset_index(drop=True))
+
+
+def write_player_week(season: int, frames: dict[int, pd.DataFrame]) -> Path:
+    """
+    Writes a season table from {week: weekly frame}. Weeks already in the
+    table that are still fresh and not in `frames` are carried over.
+    The file is written to a temp path and renamed into place.
+    """
+    path = table_path(season)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    frames = dict(frames)
+    for week in fresh_weeks(season):
+        if week not in frames:
+            frames[week] = read_player_week(season, week)
+
+    week_info = {}
+    tables = []
+    for week in sorted(frames):
+        df = decode_frame(frames[week])
+        week_info[str(week)] = {
+            "fingerprint": week_fingerprint(season, week),
+            "rows": int(len(df)),
+        }
+        if not df.empty:
+            tables.append(pa.Table.from_pandas(df, preserve_index=False))
+
+    metadata = {
+        "season": season,
+        "version": PLAYER_WEEK_VERSION,
+        "built_at": int(time.time()),
+        "weeks": week_info,
+    }
+
+    if tables:
+        table = pa.concat_tables(tables, promote_options="permissive")
+    else:
+        table = pa.table({"season": pa.array([], pa.int64()), "week": pa.array([], pa.int64())})
+
+    schema = table.schema.with_metadata({
+        **(table.schema.metadata or {}),
+        _METADATA_KEY: json.dumps(metadata).encode(),
+    })
+
+    tmp_path = path.with_suffix(".parquet.tmp")
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        for week_table in tables:
+            writer.write_table(_conform(week_table, schema))
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Adds missing columns as nulls and orders/casts columns to `schema`.
+    """
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(table[field.name].cast(field.type))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
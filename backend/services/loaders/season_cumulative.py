@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+from services.data_versions import code_version, weekly_version
+from services.pbp_catalog import LOCAL_CATALOG
+from utils.cache import FRAME_CACHE
+
+# ------------------------------------------------------------
+# Season-to-date cumulative player stats
+#
+# For a season, every player-week row is bucketed by group key
+# (player_id, player_name, team, position) and week, then summed along
+# the week axis:
+#
+#   cum[i]    = stat totals over weeks[:i]   (cum[0] = 0)
+#   played[i] = weeks with a row among weeks[:i]
+#
+# so the totals for any contiguous range a-b are cum[j] - cum[i]: one
+# vectorized subtraction over all players, whatever the range length.
+# Built once per season from the single-pass multi-week pipeline and
+# cached under the versions of its inputs (local PBP weeks, rosters,
+# player_stats, code), like the weekly frame cache, so new weeks or
+# refreshed rosters build a fresh copy.
+# ------------------------------------------------------------
+
+CUMULATIVE_KEYS = ["player_id", "player_name", "team", "position"]
+
+CUMULATIVE_STATS = [
+    "attempts", "receptions",
+    "passing_yards", "rushing_yards", "receiving_yards",
+    "passing_tds", "rushing_tds", "receiving_tds",
+    "interceptions", "fumbles_lost",
+]
+
+
+class SeasonCumulative:
+    def __init__(self, season: int, df: pd.DataFrame):
+        self.season = season
+        self.stats = list(CUMULATIVE_STATS)
+
+        if df.empty or "week" not in df.columns:
+            df = pd.DataFrame({c: [] for c in CUMULATIVE_KEYS + ["week"]})
+
+        self.weeks = np.array(sorted(df["week"].dropna().unique()), dtype=np.int64)
+
+        keys = df.reindex(columns=CUMULATIVE_KEYS)
+        key_ids = keys.groupby(CUMULATIVE_KEYS, dropna=False, observed=True, sort=True).ngroup().to_numpy()
+        _, first_rows = np.unique(key_ids, return_index=True)
+        self.keys = keys.iloc[first_rows].reset_index(drop=True)
+
+        values = (
+            df.reindex(columns=self.stats)
+            .apply(pd.to_numeric, errors="coerce")
+            .replace([np.inf, -np.inf], 0)
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
+        week_idx = np.searchsorted(self.weeks, df["week"].to_numpy(dtype=np.int64)) if len(df) else np.empty(0, dtype=np.int64)
+
+        n_weeks, n_keys = len(self.weeks), len(self.keys)
+        per_week = np.zeros((n_weeks, n_keys, len(self.stats)))
+        np.add.at(per_week, (week_idx, key_ids), values)
+
+        self.present = np.zeros((n_weeks, n_keys), dtype=bool)
+        self.present[week_idx, key_ids] = True
+
+        self.cum = np.concatenate([np.zeros((1, n_keys, len(self.stats))), per_week.cumsum(axis=0)])
+        self.played = np.concatenate([np.zeros((1, n_keys), dtype=np.int64), self.present.cumsum(axis=0)])
+
+    def estimated_size(self) -> int:
+        # Lets FRAME_CACHE budget this like a frame
+        key_bytes = int(self.keys.memory_usage(index=True, deep=True).sum())
+        return self.cum.nbytes + self.played.nbytes + self.present.nbytes + key_bytes
+
+    def _bounds(self, start: int, end: int) -> tuple[int, int]:
+        return (
+            int(np.searchsorted(self.weeks, start, side="left")),
+            int(np.searchsorted(self.weeks, end, side="right")),
+        )
+
+    def range_totals(self, start: int, end: int) -> pd.DataFrame:
+        """
+        Totals over weeks start..end (inclusive) for every key with at least
+        one row in the range: CUMULATIVE_KEYS + CUMULATIVE_STATS +
+        weeks_played. Keys stay encoded, as in the weekly frames.
+        """
+        i, j = self._bounds(start, end)
+        played = self.played[j] - self.played[i]
+        rows = np.flatnonzero(played > 0)
+
+        totals = pd.DataFrame(self.cum[j, rows] - self.cum[i, rows], columns=self.stats)
+        out = self.keys.iloc[rows].reset_index(drop=True)
+        out[self.stats] = totals
+        out["weeks_played"] = played[rows]
+        return out
+
+    def range_weeks(self, start: int, end: int) -> list[list[int]]:
+        """
+        For each row of range_totals(start, end), the weeks it has rows in.
+        """
+        i, j = self._bounds(start, end)
+        rows = np.flatnonzero(self.played[j] - self.played[i] > 0)
+        present = self.present[i:j, rows]
+        weeks = self.weeks[i:j]
+        return [weeks[present[:, k]].tolist() for k in range(len(rows))]
+
+
+def parse_week_range(weeks: str) -> tuple[int, int] | None:
+    """
+    "5-12" → (5, 12); None for any other weeks syntax.
+    """
+    start, sep, end = weeks.strip().partition("-")
+    if not sep or not start.strip().isdigit() or not end.strip().isdigit():
+        return None
+    start, end = int(start), int(end)
+    return (start, end) if start <= end else None
+
+
+def _cumulative_key(season: int) -> tuple:
+    weeks = LOCAL_CATALOG.weeks(season)
+    return ("season_cum", season, code_version(), weekly_version(season, weeks))
+
+
+@FRAME_CACHE.cached(key=_cumulative_key)
+def season_cumulative(season: int) -> SeasonCumulative:
+    """
+    The cumulative arrays for a season's local weeks.
+    """
+    from routers.nfl_router import load_multi_week_data
+
+    df = load_multi_week_data(season, LOCAL_CATALOG.weeks(season))
+    return SeasonCumulative(season, df)
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from services.data_versions import code_version, weekly_version
+from services.loaders.frame_encoding import decode_frame, encode_frame
+from services.loaders.player_week_table import PLAYER_WEEK_VERSION
+from utils.cache import FRAME_CACHE
+
+# ------------------------------------------------------------
+# Weekly frame cache
+#
+# Two tiers in front of the weekly pipeline (load_weekly_data's
+# builder → harmonize_ids → snap merge):
+#
+#   memory   FRAME_CACHE ("weekly_frame", season, week, fingerprint),
+#            bounded by the frame cache budget
+#   disk     {WEEKLY_CACHE_DIR}/{season}/week_{week}-{fingerprint}.parquet,
+#            survives restarts
+#
+# The fingerprint covers every input of the frame: the week's local PBP
+# files, the season's rosters and player_stats artifacts, the code and
+# PLAYER_WEEK_VERSION. Changed inputs simply miss; files of older
+# fingerprints for the week are removed when the new one is written.
+#
+# Frames are stored decoded on disk (surrogate player keys are
+# process-local) and re-encoded on read. Empty frames are not cached.
+# ------------------------------------------------------------
+
+# This file lives in: backend/services/loaders/weekly_frame_cache.py
+BASE_DIR = Path(__file__).resolve().parents[2]
+WEEKLY_CACHE_DIR = Path(os.getenv("KRAMERBOT_WEEKLY_CACHE_DIR", str(BASE_DIR / "tmp" / "weekly_frame_cache")))
+
+DISK_CACHE = os.getenv("KRAMERBOT_WEEKLY_DISK_CACHE", "1").lower() not in ("0", "false", "no")
+
+WEEKLY_STATS = {"memory_hits": 0, "disk_hits": 0, "builds": 0, "disk_writes": 0, "disk_errors": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def _count(stat: str) -> None:
+    with _STATS_LOCK:
+        WEEKLY_STATS[stat] += 1
+
+
+def weekly_fingerprint(season: int, week: int) -> str:
+    parts = (PLAYER_WEEK_VERSION, code_version(), weekly_version(season, [week]))
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+
+def frame_path(season: int, week: int, fingerprint: str) -> Path:
+    return WEEKLY_CACHE_DIR / str(season) / f"week_{week}-{fingerprint}.parquet"
+
+
+# ============================================================
+# TIERS
+# ============================================================
+
+def _read_disk(season: int, week: int, fingerprint: str) -> pd.DataFrame | None:
+    if not DISK_CACHE:
+        return None
+
+    path = frame_path(season, week, fingerprint)
+    if not path.exists():
+        return None
+
+    try:
+        return encode_frame(pd.read_parquet(path))
+    except Exception as e:
+        _count("disk_errors")
+        print(f"⚠️ Unreadable weekly cache file {path.name}: {e}")
+        return None
+
+
+def _write_disk(season: int, week: int, fingerprint: str, df: pd.DataFrame) -> None:
+    if not DISK_CACHE:
+        return
+
+    path = frame_path(season, week, fingerprint)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process temp name: workers missing the same week write concurrently
+        tmp_path = path.with_suffix(f".parquet.{os.getpid()}.tmp")
+        decode_frame(df).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        _count("disk_writes")
+    except Exception as e:
+        _count("disk_errors")
+        print(f"⚠️ Failed to write weekly cache file {path.name}: {e}")
+        return
+
+    # Older fingerprints of the week can never match again
+    for old in path.parent.glob(f"week_{week}-*.parquet"):
+        if old != path:
+            old.unlink(missing_ok=True)
+
+
+def cached_weekly_frame(season: int, week: int) -> pd.DataFrame | None:
+    """
+    The week's frame from memory or disk, or None when neither tier
+    holds it for the current inputs.
+    """
+    fingerprint = weekly_fingerprint(season, week)
+    key = ("weekly_frame", season, week, fingerprint)
+
+    df = FRAME_CACHE.get(key)
+    if df is not None:
+        _count("memory_hits")
+        return df
+
+    df = _read_disk(season, week, fingerprint)
+    if df is not None:
+        _count("disk_hits")
+        FRAME_CACHE.put(key, df)
+    return df
+
+
+def weekly_frame(season: int, week: int, build: Callable[[int, int], pd.DataFrame]) -> pd.DataFrame:
+    """
+    The week's frame from the cache, else build(season, week) stored in
+    both tiers.
+    """
+    df = cached_weekly_frame(season, week)
+    if df is not None:
+        return df
+
+    df = build(season, week)
+    _count("builds")
+    if df.empty:
+        return df
+
+    # Building can fetch inputs for the first time (e.g. the roster file)
+    fingerprint = weekly_fingerprint(season, week)
+    FRAME_CACHE.put(("weekly_frame", season, week, fingerprint), df)
+    _write_disk(season, week, fingerprint, df)
+    return df
+
+
+def weekly_stats() -> dict:
+    with _STATS_LOCK:
+        return dict(WEEKLY_STATS)
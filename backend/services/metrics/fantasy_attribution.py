@@ -1,5 +1,7 @@
 import pandas as pd
 
+from services.fantasy.scoring_engine import SCORING_COLUMNS, canonical_scoring
+
 def compute_fantasy_attribution(df: pd.DataFrame, scoring: str) -> pd.DataFrame:
     """
     Adds fantasy component attribution percentages for the selected scoring system.
@@ -9,19 +11,7 @@ def compute_fantasy_attribution(df: pd.DataFrame, scoring: str) -> pd.DataFrame:
     d = df.copy()
 
     # Determine which fantasy_points_* column is active
-    scoring = (scoring or "standard").lower()
-    if scoring in ["half_ppr", "half-ppr"]:
-        scoring = "half"
-
-    col_map = {
-        "standard": "fantasy_points_standard",
-        "ppr": "fantasy_points_ppr",
-        "half": "fantasy_points_half",
-        "vandalay": "fantasy_points_vandalay",
-        "shen2000": "fantasy_points_shen2000",
-    }
-
-    fp_col = col_map.get(scoring, "fantasy_points_standard")
+    fp_col = SCORING_COLUMNS[canonical_scoring(scoring)]
     d["fantasy_points_active"] = d.get(fp_col, d["fantasy_points_standard"])
 
     # Avoid division by zero
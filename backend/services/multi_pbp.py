@@ -0,0 +1,123 @@
+import base64
+from typing import Iterator
+
+import orjson
+import pandas as pd
+
+from utils.cache import FRAME_CACHE
+from utils.responses import frame_records
+from weekly.loader import load_weekly_pbp
+from weekly.normalizer import normalize_pbp_frame
+
+# ------------------------------------------------------------
+# Multi-week PBP delivery
+#
+# /nfl/multi-pbp can be consumed three ways:
+#
+#   whole    one JSON array (the original contract)
+#   stream   NDJSON, one play per line, produced week by week, so only
+#            one week of plays is held in memory at a time
+#   pages    {"plays": [...], "next_cursor": "..."}. The cursor is an
+#            opaque token for (week, offset) in the request's week list.
+#
+# Plays are encoded by utils.responses' column encoding (frame_records),
+# with missing / non-finite values as null.
+#
+# Normalized week frames are cached in FRAME_CACHE ("multi_pbp_week",
+# season, week), so paging through a week does not reload it. The PBP
+# watcher drops them together with the local week entries.
+# ------------------------------------------------------------
+
+def week_plays(season: int, week: int) -> pd.DataFrame:
+    """
+    A week's plays in the normalize_pbp_row columns. Failed (empty)
+    loads are not cached, so they are retried on the next request.
+    """
+    key = ("multi_pbp_week", season, week)
+    df = FRAME_CACHE.get(key)
+    if df is not None:
+        return df
+
+    df = normalize_pbp_frame(load_weekly_pbp(season, week))
+    if not df.empty:
+        FRAME_CACHE.put(key, df)
+    return df
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    # NaN / inf / pd.NA go out as null
+    return frame_records(df, na=None)
+
+
+# ============================================================
+# NDJSON STREAM
+# ============================================================
+
+def iter_ndjson(season: int, weeks: list[int]) -> Iterator[bytes]:
+    """
+    One chunk of NDJSON lines per week, in week order.
+    """
+    for week in weeks:
+        try:
+            plays = _records(week_plays(season, week))
+        except Exception as e:
+            print(f"Error loading PBP for week {week}: {e}")
+            continue
+        if plays:
+            yield b"".join(orjson.dumps(play) + b"\n" for play in plays)
+
+
+# ============================================================
+# CURSOR PAGES
+# ============================================================
+
+def encode_cursor(week: int, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{week}:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """
+    (week, offset); raises ValueError for a malformed token.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    week, offset = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+    return int(week), int(offset)
+
+
+def page(season: int, weeks: list[int], limit: int, cursor: str | None = None) -> dict:
+    """
+    Up to `limit` plays starting at `cursor` (the start of the first week
+    when None), and the cursor of the next page (None on the last one).
+    """
+    start_week, offset = decode_cursor(cursor) if cursor else (weeks[0], 0)
+    if start_week not in weeks or offset < 0:
+        raise ValueError(f"cursor does not belong to weeks {weeks}")
+
+    plays: list[dict] = []
+    remaining = weeks[weeks.index(start_week):]
+
+    for i, week in enumerate(remaining):
+        try:
+            df = week_plays(season, week)
+        except Exception as e:
+            print(f"Error loading PBP for week {week}: {e}")
+            df = pd.DataFrame()
+
+        chunk = df.iloc[offset:offset + limit - len(plays)]
+        plays.extend(_records(chunk))
+        end = offset + len(chunk)
+        offset = 0
+
+        if len(plays) == limit:
+            if end < len(df):
+                return {"plays": plays, "next_cursor": encode_cursor(week, end)}
+            if i + 1 < len(remaining):
+                return {"plays": plays, "next_cursor": encode_cursor(remaining[i + 1], 0)}
+            break
+
+    return {"plays": plays, "next_cursor": None}
+
+
+def page_json(season: int, weeks: list[int], limit: int, cursor: str | None = None) -> bytes:
+    result = page(season, weeks, limit, cursor)
+    return orjson.dumps(result)
@@ -1,4 +1,2 @@
-from pathlib import Path
-
-PBP_CACHE_DIR = Path("/tmp/kramerbot_pbp_cache")
-PBP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Kept for old imports; the PBP paths are defined in services/pbp_catalog.py
+from services.pbp_catalog import PBP_CACHE_DIR  # noqa: F401
@@ -1,62 +1,173 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from pathlib import Path
+import os
 import polars as pl
 
+from pbp.normalize.schema import PBP_SCHEMA_VERSION, enforce_schema, memory_report
+from utils.cache import FRAME_CACHE
+from utils.helpers import current_season
+
+from services.pbp_catalog import CACHE_CATALOG, PBP_CACHE_DIR, PBP_IPC_DIR
+from services.pbp_loader import play_order, scan_pbp
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-PBP_CACHE_DIR = BASE_DIR / "tmp" / "kramerbot_pbp_cache"
-PBP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
 def _pbp_path(season: int) -> Path:
     return PBP_CACHE_DIR / f"pbp_{season}.parquet"
 
-NFLVERSE_PBP_URL = (
-    "https://github.com/nflverse/nflverse-data/releases/download/pbp/pbp_{season}.parquet"
-)
+# ---------------------------------------------------------------------------
+# Arrow IPC mirror
+#
+# Uncompressed Feather v2 copy of each season, in play order, named after the
+# fingerprint of the parquet it was built from. Reading it memory-maps the
+# file, so loads skip parquet decoding and every worker process shares the
+# OS page cache instead of holding its own heap copy.
+# ---------------------------------------------------------------------------
+
+
+def _ipc_path(season: int, fingerprint: str) -> Path:
+    # Mirrors hold the compact schema, so a schema change invalidates them too
+    return PBP_IPC_DIR / f"pbp_{season}-{fingerprint}-s{PBP_SCHEMA_VERSION}.arrow"
+
+
+def _read_ipc_mirror(season: int, fingerprint: str) -> pl.DataFrame | None:
+    path = _ipc_path(season, fingerprint)
+    if not path.exists():
+        return None
+    try:
+        return pl.read_ipc(path)  # memory-mapped (uncompressed IPC)
+    except Exception as e:
+        print(f"⚠️ Unreadable IPC mirror for {season}: {e}")
+        return None
+
+
+def write_ipc_mirror(season: int, df: pl.DataFrame, fingerprint: str) -> Path:
+    """
+    Writes the IPC mirror for a season (temp file + rename) and removes
+    mirrors built from older versions of the season parquet.
+    """
+    PBP_IPC_DIR.mkdir(parents=True, exist_ok=True)
+    path = _ipc_path(season, fingerprint)
+    tmp_path = path.with_suffix(f".arrow.{os.getpid()}.tmp")
+
+    df.write_ipc(tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+    for old in PBP_IPC_DIR.glob(f"pbp_{season}-*.arrow"):
+        if old != path:
+            old.unlink(missing_ok=True)
+
+    return path
+
+
+def _with_ipc_mirror(season: int, df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Mirrors a freshly decoded season to IPC and returns the memory-mapped
+    copy, so the cached frame lives in the page cache rather than the heap.
+    """
+    fingerprint = CACHE_CATALOG.fingerprint(season)
+    if fingerprint is None:
+        return df
+    try:
+        write_ipc_mirror(season, df, fingerprint)
+    except Exception as e:
+        print(f"⚠️ Failed to write IPC mirror for {season}: {e}")
+        return df
+    mapped = _read_ipc_mirror(season, fingerprint)
+    return mapped if mapped is not None else df
+
+
+# ---------------------------------------------------------------------------
+# Ingest: compact schema + memory report
+# ---------------------------------------------------------------------------
+
+# season -> memory_report() from the last time the season was decoded
+PBP_MEMORY_REPORTS: dict[int, dict] = {}
+
+
+def _ingest(season: int, df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Casts a freshly decoded season to the compact PBP schema (once, before it
+    is mirrored and cached) and records how much memory that saved.
+    """
+    compact = enforce_schema(df, complete=True)
+    report = PBP_MEMORY_REPORTS[season] = memory_report(season, df, compact)
+    print(
+        f"🧮 PBP {season}: {report['raw_bytes'] / 1e6:.1f} MB → "
+        f"{report['compact_bytes'] / 1e6:.1f} MB (-{report['saved_pct']}%)"
+    )
+    return compact
 
 
 # ---------------------------------------------------------------------------
 # Season Loader (cache-first, network fallback)
 # ---------------------------------------------------------------------------
 
-@lru_cache(maxsize=6)
+@FRAME_CACHE.cached(
+    key=lambda season: ("pbp_season", season),
+    pin=lambda season: season == current_season(),
+)
 def load_pbp_season(season: int) -> pl.DataFrame:
     """
     Loads a full season of PBP data.
 
     Priority:
-    1. Local Parquet cache (your R-generated 2025 file lives here)
-    2. nflverse GitHub parquet (for older seasons)
+    1. Local week partitions (scripts/partition_pbp.py output)
+    2. Local Parquet cache (your R-generated 2025 file lives here)
+    3. nflverse GitHub parquet (for older seasons)
+
+    The returned frame is always in play order (game_id, play_id) and in
+    the compact PBP_SCHEMA (pbp/normalize/schema.py). Local seasons are
+    served from their memory-mapped IPC mirror, which is (re)built on the
+    first load after the parquet changes. Which local files exist comes
+    from the PBP catalog (services/pbp_catalog.py), not directory scans.
     """
+    # 0. IPC mirror of the current local parquet (zero-copy)
+    fingerprint = CACHE_CATALOG.fingerprint(season)
+    if fingerprint is not None:
+        df = _read_ipc_mirror(season, fingerprint)
+        if df is not None:
+            return df
+
+    # 1. Week partitions (already in play order)
+    if CACHE_CATALOG.is_partitioned(season):
+        return _with_ipc_mirror(season, _ingest(season, scan_pbp(season, root=PBP_CACHE_DIR).collect()))
+
     path = _pbp_path(season)
 
-    # 1. Local cache (preferred)
-    if path.exists() and path.stat().st_size > 0:
-        return pl.read_parquet(path)
+    # 2. Local cache (preferred)
+    if season in CACHE_CATALOG:
+        return _with_ipc_mirror(season, _ingest(season, play_order(pl.read_parquet(path))))
 
-    # 2. Remote fallback (only for seasons where nflverse publishes)
-    url = NFLVERSE_PBP_URL.format(season=season)
-    df = pl.read_parquet(url)
+    # 3. Remote fallback (only for seasons where nflverse publishes).
+    # Downloaded into the cache dir (resumable, checksummed) for future use.
+    from services.nflverse_cache import sync_artifact
 
-    # Save for future use
-    df.write_parquet(path)
-    return df
+    sync_artifact("pbp", season)
+    CACHE_CATALOG.refresh([season])
+    return _with_ipc_mirror(season, _ingest(season, play_order(pl.read_parquet(path))))
 
 
 # ---------------------------------------------------------------------------
 # Week Filter
 # ---------------------------------------------------------------------------
 
+@FRAME_CACHE.cached(key=lambda season, week, season_type="REG": ("pbp_week", season, week, season_type))
 def pbp_week(season: int, week: int, season_type: str = "REG") -> pl.DataFrame:
     """
-    Returns all plays for a given season/week/season_type.
+    Returns all plays for a given season/week/season_type, in play order.
+    Partitioned seasons read only the requested week's file.
     """
-    df = load_pbp_season(season)
+    if CACHE_CATALOG.is_partitioned(season):
+        df = enforce_schema(scan_pbp(season, weeks=[week], root=PBP_CACHE_DIR).collect(), complete=True)
+    else:
+        df = load_pbp_season(season)
+
+    if df.is_empty():
+        return df
 
     # Defensive filtering — handles missing columns gracefully
     filters = [
@@ -68,6 +179,76 @@ def pbp_week(season: int, week: int, season_type: str = "REG") -> pl.DataFrame:
     return df.filter(filters)
 
 
+# ---------------------------------------------------------------------------
+# Season Game Index
+#
+# Built once per season from the play-ordered season frame. Because the frame
+# is sorted by game_id (which embeds season and week) then play_id, every game
+# is one contiguous run of rows, so a game is just an (offset, length) slice.
+#
+#   games:  (season_type, week) -> [game dicts for dropdowns]
+#   slices: game_id -> (season_type, week, offset, length)
+# ---------------------------------------------------------------------------
+
+GAME_INDEX_COLUMNS = ["game_id", "game_date", "home_team", "away_team"]
+
+
+@FRAME_CACHE.cached(key=lambda season: ("pbp_index", season))
+def season_game_index(season: int) -> dict:
+    df = load_pbp_season(season)
+    index = {"rows": df.height, "games": {}, "slices": {}}
+
+    if df.is_empty() or "game_id" not in df.columns:
+        return index
+
+    meta_cols = [c for c in GAME_INDEX_COLUMNS[1:] if c in df.columns]
+    season_type = pl.col("season_type") if "season_type" in df.columns else pl.lit(None, dtype=pl.Utf8)
+    week = pl.col("week") if "week" in df.columns else pl.lit(None, dtype=pl.Int32)
+
+    games = (
+        df.with_row_index("_row")
+        .with_columns(season_type.alias("_season_type"), week.alias("_week"))
+        .group_by("game_id", maintain_order=True)
+        .agg(
+            pl.col("_row").first().alias("_offset"),
+            pl.len().alias("_length"),
+            pl.col("_season_type").first(),
+            pl.col("_week").first(),
+            *[pl.col(c).first() for c in meta_cols],
+        )
+    )
+
+    # Sort defensively (same order the dropdown has always used)
+    sort_cols = [c for c in ["game_date", "away_team", "home_team", "game_id"] if c in games.columns]
+    games = games.sort(sort_cols, descending=False, nulls_last=True)
+
+    for game in games.to_dicts():
+        key = (game["_season_type"], game["_week"])
+        index["slices"][game["game_id"]] = (*key, game["_offset"], game["_length"])
+        index["games"].setdefault(key, []).append(
+            {c: game[c] for c in GAME_INDEX_COLUMNS if c in game}
+        )
+
+    return index
+
+
+def _season_index(season: int) -> dict:
+    """
+    Returns the game index, rebuilding it if the season frame was reloaded
+    with a different row count since the index was built.
+    """
+    index = season_game_index(season)
+    if index["rows"] != load_pbp_season(season).height:
+        FRAME_CACHE.invalidate(("pbp_index", season))
+        index = season_game_index(season)
+    return index
+
+
+def _matches(value, wanted) -> bool:
+    # Missing season_type/week columns are treated as matching (defensive)
+    return value is None or value == wanted
+
+
 # ---------------------------------------------------------------------------
 # Games Index (for dropdowns)
 # ---------------------------------------------------------------------------
@@ -77,24 +258,21 @@ def pbp_games_index(season: int, week: int, season_type: str = "REG") -> list[di
     Returns a small, stable index of games for UI dropdowns.
     Never throws — always returns a list.
     """
-    df = pbp_week(season, week, season_type)
-
-    if df.is_empty():
-        return []
-
-    # Columns we want to show if available
-    cols = [c for c in ["game_id", "game_date", "home_team", "away_team"] if c in df.columns]
-    if not cols:
+    if season in CACHE_CATALOG and not CACHE_CATALOG.has_week(season, week, season_type):
         return []
 
-    games = df.select(cols).unique()
+    index = _season_index(season)
 
-    # Sort defensively
-    sort_cols = [c for c in ["game_date", "away_team", "home_team", "game_id"] if c in games.columns]
-    if sort_cols:
-        games = games.sort(sort_cols, descending=False, nulls_last=True)
+    games = index["games"].get((season_type, week))
+    if games is None:
+        # Seasons without season_type/week columns index under None
+        games = [
+            g for (st, wk), gs in index["games"].items()
+            if _matches(st, season_type) and _matches(wk, week)
+            for g in gs
+        ]
 
-    return games.to_dicts()
+    return [dict(g) for g in games]
 
 
 # ---------------------------------------------------------------------------
@@ -111,16 +289,22 @@ def pbp_by_game(
     """
     Returns play-by-play for a single game.
     Payload is trimmed for browser safety.
+
+    The game is a contiguous slice of the play-ordered season frame,
+    located through the season game index — O(plays in game).
     """
-    df = pbp_week(season, week, season_type)
+    entry = _season_index(season)["slices"].get(game_id)
+    if entry is None:
+        return []
 
-    if "game_id" not in df.columns:
+    game_season_type, game_week, offset, length = entry
+    if not (_matches(game_season_type, season_type) and _matches(game_week, week)):
         return []
 
-    df = df.filter(pl.col("game_id") == game_id)
+    if limit is not None:
+        length = min(length, limit)
 
-    if df.is_empty():
-        return []
+    df = load_pbp_season(season).slice(offset, length)
 
     # Columns safe for UI
     keep = [
@@ -151,14 +335,4 @@ def pbp_by_game(
     if keep:
         df = df.select(keep)
 
-    # Preserve play ordering
-    for order_col in ["play_id", "index", "game_seconds_remaining"]:
-        if order_col in df.columns:
-            df = df.sort(order_col)
-            break
-
-    # Optional limit for browser safety
-    if limit is not None:
-        df = df.head(limit)
-
     return df.to_dicts()
@@ -0,0 +1,298 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from services.pbp_catalog import PBP_CACHE_DIR
+from utils.cache import FRAME_CACHE, SingleFlight
+from utils.helpers import is_completed_season
+
+# ------------------------------------------------------------
+# nflverse artifact cache
+#
+# Read-through cache for the per-season nflverse release files the
+# weekly pipeline needs (rosters, player_stats):
+#
+#   memory   FRAME_CACHE ("nflverse", artifact, season)
+#   disk     {NFLVERSE_CACHE_DIR}/{artifact}/{file}.parquet
+#            + {file}.parquet.meta.json (url, etag, last_modified, sha256, ...)
+#            (pbp: the PBP cache dir, read by nfl_pbp_service)
+#   remote   GitHub release download
+#
+# Completed seasons are immutable: once on disk they are never fetched
+# again. The current season is revalidated with a conditional GET
+# (If-None-Match / If-Modified-Since) at most every
+# KRAMERBOT_NFLVERSE_TTL_S seconds; a 304 only costs a round trip.
+# When the network is down a cached copy is served as-is, and
+# KRAMERBOT_NFLVERSE_OFFLINE=1 never touches the network.
+# ------------------------------------------------------------
+
+# This file lives in: backend/services/nflverse_cache.py
+BASE_DIR = Path(__file__).resolve().parents[1]
+NFLVERSE_CACHE_DIR = BASE_DIR / "tmp" / "nflverse_cache"
+
+NFLVERSE_RELEASE_URL = "https://github.com/nflverse/nflverse-data/releases/download"
+
+# artifact → release path of a season's file. player_stats is also the
+# "weekly data" nfl_data_py.import_weekly_data reads.
+NFLVERSE_ARTIFACTS = {
+    "pbp": "pbp/pbp_{season}.parquet",
+    "rosters": "rosters/roster_{season}.parquet",
+    "player_stats": "player_stats/player_stats_{season}.parquet",
+}
+
+# Artifacts kept outside NFLVERSE_CACHE_DIR, where their readers look
+ARTIFACT_DIRS = {"pbp": PBP_CACHE_DIR}
+
+CHUNK_BYTES = 1024 * 1024
+
+REVALIDATE_TTL_S = float(os.getenv("KRAMERBOT_NFLVERSE_TTL_S", "21600"))
+OFFLINE = os.getenv("KRAMERBOT_NFLVERSE_OFFLINE", "0").lower() in ("1", "true", "yes")
+FETCH_TIMEOUT_S = float(os.getenv("KRAMERBOT_NFLVERSE_TIMEOUT_S", "30"))
+
+ARTIFACT_FLIGHTS = SingleFlight("nflverse")
+
+ARTIFACT_STATS = {"memory_hits": 0, "disk_reads": 0, "not_modified": 0, "downloads": 0, "stale_served": 0}
+_STATS_LOCK = threading.Lock()
+
+# (artifact, season) → time of the last revalidation attempt
+_CHECKED_AT: dict[tuple[str, int], float] = {}
+
+
+def _count(stat: str) -> None:
+    with _STATS_LOCK:
+        ARTIFACT_STATS[stat] += 1
+
+
+# ============================================================
+# PATHS
+# ============================================================
+
+def artifact_url(artifact: str, season: int) -> str:
+    return f"{NFLVERSE_RELEASE_URL}/{NFLVERSE_ARTIFACTS[artifact].format(season=season)}"
+
+
+def artifact_path(artifact: str, season: int, root: Path | None = None) -> Path:
+    """
+    Where a season's artifact lives. PBP lands in the PBP cache dir that
+    nfl_pbp_service reads, unless an explicit mirror root is given.
+    """
+    name = Path(NFLVERSE_ARTIFACTS[artifact].format(season=season)).name
+    if root is None and artifact in ARTIFACT_DIRS:
+        return ARTIFACT_DIRS[artifact] / name
+    return Path(root or NFLVERSE_CACHE_DIR) / artifact / name
+
+
+def meta_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.meta.json")
+
+
+def read_meta(path: Path) -> dict:
+    try:
+        return json.loads(meta_path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(path: Path, meta: dict) -> None:
+    tmp_path = meta_path(path).with_name(f"{meta_path(path).name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(meta, indent=1))
+    os.replace(tmp_path, meta_path(path))
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ============================================================
+# REMOTE
+#
+# Downloads stream into {file}.part. An interrupted download is resumed
+# with a Range request (If-Range pins it to the same upstream version);
+# a complete file is checked against the response's Content-Length and
+# its parquet footer, and only then renamed into place. nflverse
+# publishes no checksum, so the sha256 in the sidecar is computed
+# locally: it catches a cached copy changed on disk since download, not
+# a download that was corrupt to begin with.
+# ============================================================
+
+def _open(url: str, headers: dict):
+    request = urllib.request.Request(url, headers=headers)
+    return urllib.request.urlopen(request, timeout=FETCH_TIMEOUT_S)
+
+
+def _download(url: str, part: Path, headers: dict) -> tuple[int, dict] | None:
+    """
+    Streams `url` into `part`, resuming what is already there.
+    Returns (total bytes, response headers), or None on 304.
+    """
+    part_meta = read_meta(part)
+    offset = part.stat().st_size if part.exists() else 0
+    if offset and part_meta.get("etag"):
+        headers = {**headers, "Range": f"bytes={offset}-", "If-Range": part_meta["etag"]}
+    else:
+        offset = 0
+
+    try:
+        response = _open(url, headers)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        if e.code == 416:
+            # Range past the end: the partial file is unusable
+            part.unlink(missing_ok=True)
+            meta_path(part).unlink(missing_ok=True)
+            return _download(url, part, {k: v for k, v in headers.items() if k not in ("Range", "If-Range")})
+        raise
+
+    with response:
+        response_headers = dict(response.headers)
+        if response.status != 206:
+            offset = 0
+        _write_meta(part, {"etag": response_headers.get("ETag"), "last_modified": response_headers.get("Last-Modified")})
+
+        with open(part, "ab" if offset else "wb") as f:
+            shutil.copyfileobj(response, f, CHUNK_BYTES)
+
+    length = response_headers.get("Content-Length")
+    total = part.stat().st_size
+    if length is not None and total != offset + int(length):
+        raise IOError(f"short download for {url}: {total} of {offset + int(length)} bytes")
+
+    return total, response_headers
+
+
+def sync_artifact(artifact: str, season: int, root: Path | None = None, force: bool = False) -> str:
+    """
+    Makes the local copy of a season's artifact current. Returns
+    "downloaded", "resumed", "not_modified", "cached" (completed season,
+    matches its recorded sha256) or "local" (a file we did not download,
+    left alone).
+    """
+    path = artifact_path(artifact, season, root)
+    part = path.with_suffix(".parquet.part")
+    meta = read_meta(path)
+    headers = {}
+
+    if path.exists() and not force:
+        if not meta:
+            return "local"
+        if meta.get("sha256") != file_sha256(path):
+            print(f"⚠️ Checksum mismatch for {path}, downloading again")
+        elif is_completed_season(season):
+            return "cached"
+        else:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    resumed = part.exists() and part.stat().st_size > 0
+
+    url = artifact_url(artifact, season)
+    result = _download(url, part, headers)
+    now = time.time()
+
+    if result is None:
+        _count("not_modified")
+        _write_meta(path, {**meta, "checked_at": now})
+        return "not_modified"
+
+    size, response_headers = result
+    pq.read_metadata(part)  # a truncated or corrupt parquet file fails here
+
+    sha256 = file_sha256(part)
+    os.replace(part, path)
+    meta_path(part).unlink(missing_ok=True)
+    _write_meta(path, {
+        "artifact": artifact,
+        "season": season,
+        "url": url,
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "size": size,
+        "sha256": sha256,
+        "fetched_at": now,
+        "checked_at": now,
+    })
+
+    _count("downloads")
+    print(f"💾 Cached nflverse {artifact} {season} ({size / 1e6:.1f} MB) → {path}")
+    return "resumed" if resumed else "downloaded"
+
+
+# ============================================================
+# READ-THROUGH LOAD
+# ============================================================
+
+def _is_fresh(artifact: str, season: int) -> bool:
+    if OFFLINE or is_completed_season(season):
+        return True
+    checked_at = _CHECKED_AT.get((artifact, season))
+    return checked_at is not None and time.time() - checked_at < REVALIDATE_TTL_S
+
+
+def load_artifact(artifact: str, season: int) -> pd.DataFrame:
+    """
+    Returns a season's nflverse artifact as a pandas frame, from memory,
+    then disk, then GitHub. The frame is shared with the cache — do not
+    mutate it in place.
+
+    Raises when there is no cached copy and the download fails.
+    """
+    key = ("nflverse", artifact, season)
+    missing = object()
+
+    df = FRAME_CACHE.get(key, missing)
+    if df is not missing and _is_fresh(artifact, season):
+        _count("memory_hits")
+        return df
+
+    return ARTIFACT_FLIGHTS.do(key, lambda: _load_artifact(artifact, season))
+
+
+def _load_artifact(artifact: str, season: int) -> pd.DataFrame:
+    key = ("nflverse", artifact, season)
+    path = artifact_path(artifact, season)
+
+    if OFFLINE and not path.exists():
+        raise FileNotFoundError(f"nflverse {artifact} {season} is not cached and KRAMERBOT_NFLVERSE_OFFLINE is set")
+
+    changed = True
+    if not (path.exists() and _is_fresh(artifact, season)):
+        try:
+            changed = sync_artifact(artifact, season) in ("downloaded", "resumed")
+        except (urllib.error.URLError, OSError) as e:
+            if not path.exists():
+                raise
+            # Offline (or GitHub is down): serve what we have until the next check
+            _count("stale_served")
+            print(f"⚠️ Could not revalidate nflverse {artifact} {season}, using cached copy: {e}")
+            changed = False
+        _CHECKED_AT[(artifact, season)] = time.time()
+
+    cached = FRAME_CACHE.get(key)
+    if cached is not None and not changed:
+        return cached
+
+    _count("disk_reads")
+    return FRAME_CACHE.put(key, pd.read_parquet(path))
+
+
+def artifact_stats() -> dict:
+    with _STATS_LOCK:
+        stats = dict(ARTIFACT_STATS)
+    return {**stats, "flights": ARTIFACT_FLIGHTS.stats()}
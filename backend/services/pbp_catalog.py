@@ -0,0 +1,332 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+
+# ------------------------------------------------------------
+# PBP locations (the only place these paths are defined)
+# ------------------------------------------------------------
+
+# This file lives in: backend/services/pbp_catalog.py
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+# Written by the R ingestion pipeline; read by the weekly pipeline
+LOCAL_PBP_DIR = BASE_DIR / "data" / "pbp"
+
+# Season cache served by nfl_pbp_service (remote downloads land here too)
+PBP_CACHE_DIR = BASE_DIR / "tmp" / "kramerbot_pbp_cache"
+PBP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+PBP_IPC_DIR = PBP_CACHE_DIR / "ipc"
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+# ------------------------------------------------------------
+# Catalog
+#
+# {root}/manifest.json records, per season:
+#
+#   layout              "season" (pbp_{season}.parquet) or "partitioned"
+#   files               [{path, size, mtime_ns, sha1, rows, row_groups}]
+#   weeks, season_types available weeks / season types
+#   week_season_types   {week: [season types]}
+#   rows, week_rows     play counts
+#   row_groups          {week: [{path, row_groups: [i, ...]}]}
+#   schema_fingerprint  hash of the parquet schema
+#
+# Lookups (seasons, week validation, fingerprints, files to read) are
+# answered from memory. refresh() re-stats the files, rebuilds entries
+# whose files changed and rewrites the manifest; it runs on first use,
+# after our own writers, and from the PBP watcher.
+# ------------------------------------------------------------
+
+class PbpCatalog:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_NAME
+
+        self._seasons: dict[int, dict] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    # ---------------- lookups (no file I/O) ----------------
+
+    def seasons(self) -> list[int]:
+        self._ensure_loaded()
+        return sorted(self._seasons)
+
+    def entry(self, season: int) -> dict | None:
+        self._ensure_loaded()
+        return self._seasons.get(season)
+
+    def __contains__(self, season: int) -> bool:
+        return self.entry(season) is not None
+
+    def is_partitioned(self, season: int) -> bool:
+        entry = self.entry(season)
+        return entry is not None and entry["layout"] == "partitioned"
+
+    def weeks(self, season: int, season_type: str | None = None) -> list[int]:
+        entry = self.entry(season)
+        if entry is None:
+            return []
+        if season_type is None:
+            return list(entry["weeks"])
+        return [int(w) for w, types in entry["week_season_types"].items() if season_type in types]
+
+    def has_week(self, season: int, week: int, season_type: str | None = None) -> bool:
+        return week in self.weeks(season, season_type)
+
+    def season_types(self, season: int) -> list[str]:
+        entry = self.entry(season)
+        return list(entry["season_types"]) if entry else []
+
+    def files(self, season: int, week: int | None = None) -> list[Path]:
+        """
+        Files a season (or one week of it) is read from.
+        """
+        return [self.root / f["path"] for f in self._week_files(season, week)]
+
+    def fingerprint(self, season: int, week: int | None = None) -> str | None:
+        """
+        Content fingerprint of the files behind a season/week (same value
+        as pbp_loader.fingerprint_files), or None if there are none.
+        """
+        from services.pbp_loader import fingerprint_digests
+
+        files = self._week_files(season, week)
+        if not files:
+            return None
+        return fingerprint_digests([(Path(f["path"]).name, f["sha1"]) for f in files])
+
+    def row_groups(self, season: int, week: int) -> list[tuple[Path, list[int]]]:
+        """
+        [(file, row group indices)] holding a week's plays, from the
+        row-group statistics recorded at build time.
+        """
+        entry = self.entry(season)
+        if entry is None:
+            return []
+        return [
+            (self.root / rg["path"], list(rg["row_groups"]))
+            for rg in entry["row_groups"].get(str(week), [])
+        ]
+
+    def _week_files(self, season: int, week: int | None) -> list[dict]:
+        entry = self.entry(season)
+        if entry is None:
+            return []
+        if week is None or entry["layout"] == "season":
+            return list(entry["files"])
+        return [f for f in entry["files"] if week in f["weeks"]]
+
+    # ---------------- refresh ----------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+
+    def _read_manifest(self) -> None:
+        try:
+            manifest = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if manifest.get("version") != MANIFEST_VERSION:
+            return
+        self._seasons = {int(s): entry for s, entry in manifest.get("seasons", {}).items()}
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "root": str(self.root),
+            "updated_at": int(time.time()),
+            "seasons": {str(s): self._seasons[s] for s in sorted(self._seasons)},
+        }
+        tmp_path = self.path.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(manifest, indent=1))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not write PBP manifest {self.path}: {e}")
+
+    def refresh(self, seasons: list[int] | None = None) -> list[int]:
+        """
+        Brings the catalog in line with the files on disk (all seasons, or
+        only `seasons`). Returns the seasons whose entry changed.
+        """
+        from services.pbp_loader import discover_seasons
+
+        with self._lock:
+            if not self._loaded:
+                # First use: start from the manifest and check every season
+                self._read_manifest()
+                self._loaded = True
+                seasons = None
+
+            if not self.root.is_dir():
+                return []
+
+            targets = set(seasons) if seasons is not None else set(discover_seasons(self.root)) | set(self._seasons)
+
+            changed = []
+            for season in sorted(targets):
+                try:
+                    if self._refresh_season(season):
+                        changed.append(season)
+                except Exception as e:
+                    # Mid-write or corrupt file: leave it out until it is readable
+                    print(f"⚠️ Could not catalog PBP {season} in {self.root}: {e}")
+                    if self._seasons.pop(season, None) is not None:
+                        changed.append(season)
+
+            if changed:
+                self._write_manifest()
+            return changed
+
+    def _refresh_season(self, season: int) -> bool:
+        from services.pbp_loader import content_hash, has_partitions, source_files
+
+        paths = source_files(self.root, season)
+        current = self._seasons.get(season)
+
+        if not paths:
+            return self._seasons.pop(season, None) is not None
+
+        layout = "partitioned" if has_partitions(self.root, season) else "season"
+        if current is not None and current["layout"] == layout:
+            known = {f["path"]: f for f in current["files"]}
+            rels = [self._rel(p) for p in paths]
+
+            if set(rels) == set(known):
+                stats = [p.stat() for p in paths]
+                if all(
+                    known[rel]["size"] == st.st_size and known[rel]["mtime_ns"] == st.st_mtime_ns
+                    for rel, st in zip(rels, stats)
+                ):
+                    return False
+
+                # Touched (e.g. fresh checkout) but same bytes: just restamp
+                if all(known[rel]["sha1"] == content_hash(p) for rel, p in zip(rels, paths)):
+                    for rel, st in zip(rels, stats):
+                        known[rel]["size"], known[rel]["mtime_ns"] = st.st_size, st.st_mtime_ns
+                    return True
+
+        self._seasons[season] = self._build_entry(season, layout, paths)
+        return True
+
+    def _build_entry(self, season: int, layout: str, paths: list[Path]) -> dict:
+        from services.pbp_loader import content_hash, schema_hash
+
+        files = []
+        week_rows: dict[int, int] = {}
+        week_types: dict[int, set] = {}
+        row_groups: dict[int, list] = {}
+
+        for path in paths:
+            stat = path.stat()
+            metadata = pq.ParquetFile(path).metadata
+            columns = pq.read_schema(path).names
+
+            counts = (
+                pl.read_parquet(path, columns=[c for c in ("week", "season_type") if c in columns])
+                .group_by([c for c in ("week", "season_type") if c in columns])
+                .len()
+            )
+            file_weeks = set()
+            for row in counts.iter_rows(named=True):
+                week = row.get("week")
+                if week is None:
+                    continue
+                week = int(week)
+                file_weeks.add(week)
+                week_rows[week] = week_rows.get(week, 0) + row["len"]
+                if row.get("season_type") is not None:
+                    week_types.setdefault(week, set()).add(row["season_type"])
+
+            for week in sorted(file_weeks):
+                row_groups.setdefault(week, []).append({
+                    "path": self._rel(path),
+                    "row_groups": _week_row_groups(metadata, columns, week),
+                })
+
+            files.append({
+                "path": self._rel(path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha1": content_hash(path),
+                "rows": metadata.num_rows,
+                "row_groups": metadata.num_row_groups,
+                "weeks": sorted(file_weeks),
+            })
+
+        return {
+            "season": season,
+            "layout": layout,
+            "files": files,
+            "weeks": sorted(week_rows),
+            "season_types": sorted({t for types in week_types.values() for t in types}),
+            "week_season_types": {str(w): sorted(week_types.get(w, [])) for w in sorted(week_rows)},
+            "rows": sum(f["rows"] for f in files),
+            "week_rows": {str(w): week_rows[w] for w in sorted(week_rows)},
+            "row_groups": {str(w): row_groups[w] for w in sorted(row_groups)},
+            "schema_fingerprint": schema_hash(paths[0]),
+        }
+
+    def _rel(self, path: Path) -> str:
+        return str(Path(path).relative_to(self.root))
+
+
+def _week_row_groups(metadata, columns: list[str], week: int) -> list[int]:
+    """
+    Row groups whose week statistics can contain `week` (all of them when
+    the file has no usable statistics).
+    """
+    if "week" not in columns:
+        return list(range(metadata.num_row_groups))
+
+    index = columns.index("week")
+    groups = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(index).statistics
+        if stats is None or not stats.has_min_max or stats.min <= week <= stats.max:
+            groups.append(i)
+    return groups
+
+
+# ------------------------------------------------------------
+# Catalog instances
+# ------------------------------------------------------------
+
+_CATALOGS: dict[Path, PbpCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def catalog_for(root: Path) -> PbpCatalog:
+    root = Path(root).resolve()
+    with _CATALOGS_LOCK:
+        if root not in _CATALOGS:
+            _CATALOGS[root] = PbpCatalog(root)
+        return _CATALOGS[root]
+
+
+LOCAL_CATALOG = catalog_for(LOCAL_PBP_DIR)
+CACHE_CATALOG = catalog_for(PBP_CACHE_DIR)
+
+
+def refresh_catalogs(seasons: list[int] | None = None) -> None:
+    """
+    Refreshes every catalog that has been opened (after files were written).
+    """
+    with _CATALOGS_LOCK:
+        catalogs = list(_CATALOGS.values())
+    for catalog in catalogs:
+        catalog.refresh(seasons)
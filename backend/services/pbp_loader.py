@@ -1,34 +1,299 @@
 from pathlib import Path
+import hashlib
+import os
+
 import polars as pl
+import pyarrow.parquet as pq
+
+from pbp.normalize.schema import enforce_schema
+
+# PBP directories are defined once, in the catalog
+from services.pbp_catalog import LOCAL_CATALOG, LOCAL_PBP_DIR, catalog_for
+
 
 # ------------------------------------------------------------
-# Resolve the backend root and cache directory
+# Storage layout
+#
+# Monolithic:   {root}/pbp_{season}.parquet
+# Partitioned:  {root}/season={season}/week={week}/part-0.parquet
+#
+# Partition files keep their season/week columns and are sorted by
+# game_id then play_id, with one row group per game, so a week read
+# touches one file and a game read touches one row group.
 # ------------------------------------------------------------
 
-# This file lives in: backend/services/pbp_loader.py
-# So parents[2] = backend/
-BASE_DIR = Path(__file__).resolve().parents[2]
+PARTITION_FILE = "part-0.parquet"
+
+
+def season_file(root: Path, season: int) -> Path:
+    return Path(root) / f"pbp_{season}.parquet"
 
-LOCAL_PBP_DIR = BASE_DIR / "data" / "pbp"
+
+def season_partition_dir(root: Path, season: int) -> Path:
+    return Path(root) / f"season={season}"
+
+
+def week_partition_file(root: Path, season: int, week: int) -> Path:
+    return season_partition_dir(root, season) / f"week={week}" / PARTITION_FILE
+
+
+# ------------------------------------------------------------
+# Directory discovery
+#
+# The glob helpers below are what PbpCatalog.refresh() builds the
+# manifest from. Readers ask the catalog (catalog_for(root)) instead,
+# so a request never lists directories.
+# ------------------------------------------------------------
+
+def partition_weeks(root: Path, season: int) -> list[int]:
+    """
+    Returns the weeks that have a partition file for a season (sorted).
+    """
+    season_dir = season_partition_dir(root, season)
+    if not season_dir.is_dir():
+        return []
+
+    weeks = []
+    for week_dir in season_dir.glob("week=*"):
+        try:
+            week = int(week_dir.name.split("=", 1)[1])
+        except ValueError:
+            continue
+        if (week_dir / PARTITION_FILE).exists():
+            weeks.append(week)
+
+    return sorted(weeks)
+
+
+def has_partitions(root: Path, season: int) -> bool:
+    return bool(partition_weeks(root, season))
+
+
+def discover_seasons(root: Path) -> list[int]:
+    """
+    Seasons with a season file or week partitions under `root`.
+    """
+    seasons = set()
+    for path in Path(root).glob("pbp_*.parquet"):
+        try:
+            seasons.add(int(path.stem.split("_")[1]))
+        except (IndexError, ValueError):
+            continue
+    for path in Path(root).glob("season=*"):
+        try:
+            seasons.add(int(path.name.split("=", 1)[1]))
+        except ValueError:
+            continue
+    return sorted(seasons)
+
+
+def source_files(root: Path, season: int, week: int | None = None) -> list[Path]:
+    """
+    Returns the files a season (or one week of it) is read from:
+    the week partition(s) when partitioned, otherwise the season file.
+    """
+    weeks = partition_weeks(root, season)
+    if weeks:
+        wanted = weeks if week is None else [w for w in weeks if w == week]
+        return [week_partition_file(root, season, w) for w in wanted]
+
+    path = season_file(root, season)
+    return [path] if path.exists() else []
+
+
+# (path, size, mtime_ns) → sha1 of file content
+_CONTENT_HASHES: dict[tuple, str] = {}
+
+
+def content_hash(path: Path) -> str:
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+
+    digest = _CONTENT_HASHES.get(key)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _CONTENT_HASHES[key] = digest
+
+    return digest
+
+
+def fingerprint_files(paths: list[Path]) -> str:
+    """
+    Content fingerprint of a set of files. Each file is hashed once per
+    (size, mtime), so repeated calls only cost a stat. Being content-based,
+    it is stable across fresh checkouts and deploys.
+    """
+    return fingerprint_digests([(path.name, content_hash(path)) for path in sorted(paths)])
+
+
+def fingerprint_digests(digests: list[tuple[str, str]]) -> str:
+    """
+    fingerprint_files from already-known (file name, sha1) pairs.
+    """
+    h = hashlib.sha1()
+    for name, digest in sorted(digests):
+        h.update(f"{name}:{digest};".encode())
+    return h.hexdigest()[:16]
+
+
+def source_fingerprint(season: int, week: int | None = None, root: Path = LOCAL_PBP_DIR) -> str | None:
+    """
+    Fingerprint of the local PBP input for a season/week, or None if missing.
+    Answered from the catalog manifest, without touching the files.
+    """
+    return catalog_for(root).fingerprint(season, week)
+
+
+def schema_hash(path: Path) -> str:
+    """
+    Hash of a parquet file's schema (footer only, no data pages read).
+    """
+    schema = pq.read_schema(path).remove_metadata()
+    return hashlib.sha1(schema.to_string().encode()).hexdigest()[:16]
+
+
+def week_digests(path: Path) -> dict[int, tuple[int, int]]:
+    """
+    {week: (rows, content digest)} for a monolithic season file, so a
+    rewritten file can be diffed week by week.
+    """
+    digests = (
+        pl.scan_parquet(path)
+        .group_by("week")
+        .agg(
+            pl.len().alias("rows"),
+            pl.struct(pl.all().exclude("week")).hash(seed=0).sum().alias("digest"),
+        )
+        .collect()
+    )
+    return {
+        int(week): (int(rows), int(digest))
+        for week, rows, digest in digests.iter_rows()
+        if week is not None
+    }
+
+
+def play_order(lf):
+    """
+    Sorts plays by game_id then play_id.
+    play_id is stored as a string by the R pipeline, so it is ordered numerically.
+    """
+    return lf.sort(
+        [pl.col("game_id"), pl.col("play_id").cast(pl.Float64, strict=False)],
+        nulls_last=True,
+    )
 
 
 # ------------------------------------------------------------
 # Unified PBP Loader
 # ------------------------------------------------------------
 
-def load_pbp_local(season: int) -> pl.LazyFrame:
+def scan_pbp(season: int, weeks: list[int] | None = None, root: Path = LOCAL_PBP_DIR) -> pl.LazyFrame:
+    """
+    Scans PBP for a season under `root`, reading only the partitions needed.
+
+    - Partitioned layout: only the requested week files are scanned
+      (all weeks when `weeks` is None). Rows are already in play order.
+    - Monolithic layout: the season file is scanned and filtered by week.
+    - Nothing on disk: returns an empty LazyFrame.
+
+    Files come from the root's catalog manifest, not a directory listing.
+    """
+    catalog = catalog_for(root)
+    if season not in catalog:
+        return pl.LazyFrame()
+
+    if catalog.is_partitioned(season):
+        if weeks is None:
+            files = catalog.files(season)
+        else:
+            files = list(dict.fromkeys(f for w in sorted(set(weeks)) for f in catalog.files(season, w)))
+        if not files:
+            return pl.LazyFrame()
+        return pl.scan_parquet(files, hive_partitioning=False)
+
+    lf = pl.scan_parquet(catalog.files(season)[0])
+    if weeks is not None:
+        lf = lf.filter(pl.col("week").is_in(weeks))
+    return lf
+
+
+def load_pbp_local(season: int, weeks: list[int] | None = None) -> pl.LazyFrame:
     """
     Load PBP for a season from the local parquet files generated
     by the R ingestion pipeline.
 
     This is the single source of truth for all PBP loading.
+    Columns are cast to the compact PBP_SCHEMA. Reads only the week
+    partitions needed when the season has been converted with
+    scripts/partition_pbp.py.
     """
 
-    path = LOCAL_PBP_DIR / f"pbp_{season}.parquet"
-
-    if not path.exists():
-        print(f"⚠️ Local PBP parquet missing for {season}: {path}")
+    if season not in LOCAL_CATALOG:
+        print(f"⚠️ Local PBP parquet missing for {season}: {LOCAL_PBP_DIR}")
         return pl.LazyFrame()
 
-    print(f"🔥 Loading local PBP parquet for {season}: {path}")
-    return pl.scan_parquet(path)
+    print(f"🔥 Loading local PBP parquet for {season}: {LOCAL_PBP_DIR}")
+    return enforce_schema(scan_pbp(season, weeks=weeks, root=LOCAL_PBP_DIR))
+
+
+# ------------------------------------------------------------
+# Partition Writer
+# ------------------------------------------------------------
+
+def write_week_partition(df: pl.DataFrame, root: Path, season: int, week: int) -> Path:
+    """
+    Writes one week of plays as a partition file, sorted by game_id/play_id
+    with one row group per game. The file is written to a temp path and
+    renamed into place so readers never see a partial file.
+    """
+    path = week_partition_file(root, season, week)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+
+    ordered = play_order(df)
+    table = ordered.to_arrow()
+
+    with pq.ParquetWriter(tmp_path, table.schema) as writer:
+        for game in ordered.partition_by("game_id", maintain_order=True):
+            writer.write_table(game.to_arrow().cast(table.schema))
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_season_partitions(df: pl.DataFrame, root: Path, season: int) -> list[Path]:
+    """
+    Splits a season frame into week partitions under `root`.
+    """
+    paths = []
+    for (week,), week_df in df.partition_by("week", as_dict=True).items():
+        if week is None:
+            continue
+        paths.append(write_week_partition(week_df, root, season, int(week)))
+    catalog_for(root).refresh([season])
+    return sorted(paths)
+
+
+def append_week_partition(df: pl.DataFrame, season: int, week: int, root: Path = LOCAL_PBP_DIR) -> Path:
+    """
+    Adds (or replaces) a single week of a season as its own partition,
+    leaving every other week untouched.
+
+    A season still in the monolithic layout is split into partitions first
+    (once), since readers only look at partitions once any exist.
+    """
+    if not catalog_for(root).is_partitioned(season):
+        src = season_file(root, season)
+        if src.exists():
+            existing = pl.read_parquet(src).filter(pl.col("week") != week)
+            write_season_partitions(existing, root, season)
+
+    week_df = df.filter(pl.col("week") == week) if "week" in df.columns else df
+    path = write_week_partition(week_df, root, season, week)
+    catalog_for(root).refresh([season])
+    return path
@@ -0,0 +1,273 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+
+from services.pbp_catalog import LOCAL_PBP_DIR, PBP_CACHE_DIR, catalog_for, refresh_catalogs
+from services.pbp_loader import (
+    PARTITION_FILE,
+    schema_hash,
+    week_digests,
+    write_week_partition,
+)
+from utils.helpers import is_completed_season
+
+# ------------------------------------------------------------
+# Local PBP watcher
+#
+# Polls the PBP directories for files the R pipeline rewrote and drops
+# only the cache entries built from them:
+#
+#   week partition changed     → that week (+ the season frame / index)
+#   season file changed        → the weeks whose rows differ
+#   schema changed / removed   → the whole season
+#
+# Files are stamped by (mtime, size, schema hash); the footer is only
+# re-read for the schema hash when mtime or size moved. When a season file
+# is rewritten for a season that is already partitioned, only its new or
+# changed weeks are written out as partitions.
+# ------------------------------------------------------------
+
+WATCH_INTERVAL_S = float(os.getenv("KRAMERBOT_PBP_WATCH_S", "30"))
+
+# Extra invalidation callbacks: fn(season, weeks), weeks=None → whole season
+INVALIDATION_HOOKS: list[Callable[[int, set[int] | None], None]] = []
+
+
+def default_roots() -> list[Path]:
+    return [LOCAL_PBP_DIR, PBP_CACHE_DIR]
+
+
+def _file_stamp(path: Path, previous: tuple[int, int, str] | None = None) -> tuple[int, int, str] | None:
+    """
+    (mtime, size, schema hash). The parquet footer is only read when the
+    file's mtime or size moved since `previous`.
+    """
+    try:
+        stat = path.stat()
+        if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+            return previous
+        return stat.st_mtime_ns, stat.st_size, schema_hash(path)
+    except (OSError, ValueError):
+        # Missing, or mid-write and not yet a valid parquet file
+        return None
+
+
+def _parse_pbp_path(root: Path, path: Path) -> tuple[int, int | None] | None:
+    """
+    (season, week) for a partition file, (season, None) for a season file.
+    """
+    try:
+        if path.parent == root:
+            return int(path.stem.split("_")[1]), None
+        return int(path.parent.parent.name.split("=")[1]), int(path.parent.name.split("=")[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _pbp_files(root: Path) -> list[Path]:
+    return sorted(root.glob("pbp_*.parquet")) + sorted(root.glob(f"season=*/week=*/{PARTITION_FILE}"))
+
+
+# ============================================================
+# INVALIDATION
+# ============================================================
+
+def invalidate_pbp(season: int, weeks: set[int] | None = None) -> int:
+    """
+    Drops cached data built from a season's PBP. The season frame and game
+    index always go (they span every week); week entries only for `weeks`.
+    The PBP catalogs are refreshed first so fingerprints and week lookups
+    see the new files. Returns the number of frame-cache entries dropped.
+    """
+    from routers.nfl_router import SEASON_CACHE
+    from utils.cache import FRAME_CACHE
+
+    refresh_catalogs([season])
+
+    def affected(key) -> bool:
+        if not isinstance(key, tuple) or len(key) < 2 or key[1] != season:
+            return False
+        if key[0] in ("pbp_season", "pbp_index"):
+            return True
+        if key[0] in ("pbp_week", "multi_pbp_week", "weekly_frame"):
+            return weeks is None or key[2] in weeks
+        return False
+
+    dropped = FRAME_CACHE.invalidate_where(affected)
+
+    if weeks is None:
+        # A season may have appeared or disappeared
+        SEASON_CACHE["loaded"] = False
+
+    for hook in INVALIDATION_HOOKS:
+        try:
+            hook(season, weeks)
+        except Exception as e:
+            print(f"⚠️ PBP invalidation hook failed for {season}: {e}")
+
+    label = "all weeks" if weeks is None else f"weeks {sorted(weeks)}"
+    print(f"♻️ PBP changed for {season} ({label}) — dropped {dropped} cached frame(s)")
+    return dropped
+
+
+# ============================================================
+# WATCHER
+# ============================================================
+
+class PbpWatcher:
+    def __init__(self, roots: list[Path] | None = None, interval_s: float = WATCH_INTERVAL_S):
+        self.roots = [Path(r) for r in (roots or default_roots())]
+        self.interval_s = interval_s
+
+        self._stamps: dict[Path, tuple[int, int, str]] = {}
+        self._digests: dict[Path, dict[int, tuple[int, int]]] = {}
+        self._baselined = False
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ---------------- scanning ----------------
+
+    def scan_once(self) -> dict[int, set[int] | None]:
+        """
+        Compares the PBP files against the previous scan, invalidates what
+        changed and returns {season: weeks} (None = whole season).
+        The first scan only records the baseline.
+        """
+        changes: dict[int, set[int] | None] = {}
+        seen: set[Path] = set()
+
+        for root in self.roots:
+            for path in _pbp_files(root):
+                parsed = _parse_pbp_path(root, path)
+                previous = self._stamps.get(path)
+                stamp = _file_stamp(path, previous)
+                if parsed is None or stamp is None:
+                    continue
+
+                seen.add(path)
+                season, week = parsed
+                self._stamps[path] = stamp
+
+                if not self._baselined:
+                    if week is None and self._track_digests(root, season):
+                        self._digests[path] = week_digests(path)
+                    continue
+
+                if previous == stamp:
+                    continue
+
+                if previous is not None and previous[2] != stamp[2]:
+                    # New schema: every week is suspect
+                    _merge(changes, season, None)
+                elif week is not None:
+                    _merge(changes, season, {week})
+                elif previous is None:
+                    # A season that was not there before
+                    _merge(changes, season, None)
+                else:
+                    _merge(changes, season, self._changed_weeks(root, season, path))
+
+        # Partitions appended during this scan exist but were not listed
+        for path in [p for p in self._stamps if p not in seen and not p.exists()]:
+            root = next((r for r in self.roots if path.is_relative_to(r)), path.parent)
+            parsed = _parse_pbp_path(root, path)
+            del self._stamps[path]
+            self._digests.pop(path, None)
+            if parsed is not None:
+                _merge(changes, parsed[0], None)
+
+        self._baselined = True
+
+        for season, weeks in sorted(changes.items()):
+            if weeks is not None and not weeks:
+                continue
+            invalidate_pbp(season, weeks)
+
+        return changes
+
+    def _track_digests(self, root: Path, season: int) -> bool:
+        # Baseline per-week digests only where rewrites are expected;
+        # older seasons fall back to a whole-season invalidation.
+        seasons = [_parse_pbp_path(root, p) for p in root.glob("pbp_*.parquet")]
+        latest = max((s[0] for s in seasons if s), default=None)
+        return season == latest or not is_completed_season(season)
+
+    def _changed_weeks(self, root: Path, season: int, path: Path) -> set[int] | None:
+        """
+        Diffs a rewritten season file week by week. When the season is
+        partitioned, only the new or changed weeks are written out.
+        """
+        try:
+            digests = week_digests(path)
+        except Exception as e:
+            print(f"⚠️ Could not read rewritten PBP file {path}: {e}")
+            return None
+
+        previous = self._digests.get(path)
+        self._digests[path] = digests
+        if previous is None:
+            return None
+
+        changed = {w for w, d in digests.items() if previous.get(w) != d}
+        removed = set(previous) - set(digests)
+        if removed:
+            return None
+
+        if changed and catalog_for(root).is_partitioned(season):
+            self._append_partitions(root, season, path, changed)
+
+        return changed
+
+    def _append_partitions(self, root: Path, season: int, path: Path, weeks: set[int]) -> None:
+        import polars as pl
+
+        df = pl.read_parquet(path).filter(pl.col("week").is_in(sorted(weeks)))
+        for week in sorted(weeks):
+            part = write_week_partition(df.filter(pl.col("week") == week), root, season, week)
+            # Already accounted for; don't report it again next scan
+            stamp = _file_stamp(part)
+            if stamp is not None:
+                self._stamps[part] = stamp
+            print(f"💾 Appended {season} week {week} partition → {part}")
+
+    # ---------------- background thread ----------------
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.scan_once()
+            except Exception as e:
+                print(f"⚠️ PBP watcher scan failed: {e}")
+            self._stop.wait(self.interval_s)
+
+    def start(self) -> "PbpWatcher":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pbp-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def _merge(changes: dict, season: int, weeks: set[int] | None) -> None:
+    if season in changes and changes[season] is None:
+        return
+    if weeks is None:
+        changes[season] = None
+    else:
+        changes.setdefault(season, set()).update(weeks)
+
+
+def start_watcher() -> PbpWatcher | None:
+    """
+    Starts the background watcher; KRAMERBOT_PBP_WATCH_S=0 disables it.
+    """
+    if WATCH_INTERVAL_S <= 0:
+        return None
+    return PbpWatcher().start()
@@ -0,0 +1,185 @@
+import pandas as pd
+
+# ============================================================
+#  FIELD PROJECTION FOR USAGE ROUTES
+#
+#  ?fields= lists the columns a client wants: column names and/or
+#  preset names, comma-separated ("qb", "table,snap_pct", ...;
+#  "preset" = the preset for the requested position). The plan built
+#  from it says which pipeline stages must run and which input columns
+#  they read, so stages nobody asked for are skipped and the remaining
+#  ones work on a narrow frame. Identity columns are always returned.
+# ============================================================
+
+IDENTITY = ["player_id", "player_name", "team", "position"]
+
+# --- Column groups (the position column sets present_usage used to carry) ---
+RECEIVING = [
+    "targets", "receptions", "receiving_yards", "receiving_tds",
+    "receiving_air_yards",
+]
+
+RUSHING = [
+    "carries", "rushing_yards", "rushing_tds",
+]
+
+PASSING = [
+    "attempts", "completions", "passing_yards",
+    "passing_tds", "interceptions",
+    "passing_air_yards", "passing_first_downs",
+]
+
+EFFICIENCY = [
+    "yards_per_target", "yards_per_reception",
+    "yards_per_carry", "yards_per_attempt",
+    "td_rate", "int_rate",
+    "receiving_epa", "rushing_epa", "passing_epa",
+]
+
+FANTASY = [
+    "fantasy_points",
+    "fantasy_points_standard",
+    "fantasy_points_ppr",
+    "fantasy_points_half",
+    "fantasy_points_vandalay",
+    "fantasy_points_shen2000",
+    "fantasy_per_touch",
+]
+
+COMPONENTS = [
+    "passing_yards", "passing_tds", "interceptions",
+    "rushing_yards", "rushing_tds",
+    "receptions", "receiving_yards", "receiving_tds",
+    "fumbles_lost", "sack_fumbles", "sack_fumbles_lost",
+]
+
+# Attribution (comp_* points and pct_* shares) of every scoring component
+ATTRIBUTION = (
+    [f"comp_{c}" for c in COMPONENTS]
+    + [f"pct_{c}" for c in COMPONENTS]
+    + ["pct_total", "fantasy_points_active"]
+)
+
+FIELD_PRESETS = {
+    "all": ["snap_pct"] + RECEIVING + RUSHING + PASSING + EFFICIENCY + FANTASY + ATTRIBUTION,
+    "wr_te": (
+        ["snap_pct"] + RECEIVING + RUSHING
+        + ["yards_per_target", "yards_per_reception", "receiving_epa", "rushing_epa"]
+        + ["fantasy_points", "fantasy_points_ppr"]
+        + ATTRIBUTION
+    ),
+    "rb": (
+        ["snap_pct"] + RUSHING + RECEIVING
+        + ["yards_per_carry", "yards_per_target", "rushing_epa", "receiving_epa"]
+        + ["fantasy_points", "fantasy_points_ppr"]
+        + ATTRIBUTION
+    ),
+    "qb": (
+        ["snap_pct"] + PASSING + RUSHING
+        + ["yards_per_attempt", "td_rate", "int_rate", "passing_epa", "rushing_epa"]
+        + ["fantasy_points"]
+        + ATTRIBUTION
+    ),
+    # What the weekly usage page (frontend/scripts/nfl.js) reads
+    "table": (
+        ["snap_pct", "attempts", "targets", "carries"]
+        + COMPONENTS
+        + [c for c in FANTASY if c != "fantasy_per_touch"]
+        + ATTRIBUTION
+    ),
+}
+
+POSITION_PRESETS = {"QB": "qb", "RB": "rb", "WR": "wr_te", "TE": "wr_te", "WR/TE": "wr_te"}
+
+# ------------------------------------------------------------
+# Stage outputs and inputs
+# ------------------------------------------------------------
+
+SCORING_INPUTS = COMPONENTS
+
+# present_usage recomputes these from the summed columns
+PRESENT_DERIVED = {
+    "touches": ["attempts", "receptions"],
+    "total_yards": ["passing_yards", "rushing_yards", "receiving_yards"],
+    "total_tds": ["passing_tds", "rushing_tds", "receiving_tds"],
+    "weeks": [],
+}
+
+# add_efficiency_metrics output → the columns it is computed from
+EFFICIENCY_DERIVED = {
+    "yards_per_target": ["receiving_yards", "targets"],
+    "yards_per_reception": ["receiving_yards", "receptions"],
+    "yards_per_carry": ["rushing_yards", "carries"],
+    "yards_per_attempt": ["passing_yards", "attempts"],
+    "td_rate": ["passing_tds", "attempts"],
+    "int_rate": ["interceptions", "attempts"],
+    "fantasy_per_touch": ["fantasy_points", "carries", "receptions"],
+    "vandalay_per_touch": ["vandalay_points", "carries", "receptions"],
+    "workhorse_rb": ["carries", "targets"],
+    "alpha_wr": ["targets"],
+    "deep_threat": ["receiving_yards", "receptions"],
+}
+
+
+def _is_scoring_field(field: str) -> bool:
+    return field.startswith(("comp_", "fantasy_points"))
+
+
+def _is_attribution_field(field: str) -> bool:
+    return field.startswith("pct_") or field == "fantasy_points_active"
+
+
+class FieldPlan:
+    """
+    Which stages run and which columns flow into / out of them for a
+    fields= request.
+    """
+
+    def __init__(self, fields: list[str]):
+        self.fields = list(dict.fromkeys(f for f in fields if f not in IDENTITY))
+
+        wanted = set(self.fields)
+        self.efficiency = bool(wanted & EFFICIENCY_DERIVED.keys())
+
+        # Columns the scoring / attribution / efficiency stages must see
+        needed = set(wanted)
+        for field in wanted & EFFICIENCY_DERIVED.keys():
+            needed.update(EFFICIENCY_DERIVED[field])
+        for field in wanted & PRESENT_DERIVED.keys():
+            needed.update(PRESENT_DERIVED[field])
+
+        self.attribution = any(_is_attribution_field(f) for f in needed)
+        self.scoring = self.attribution or any(_is_scoring_field(f) for f in needed)
+        if self.scoring:
+            needed.update(SCORING_INPUTS)
+
+        self.needed = needed
+
+    def input_columns(self, df: pd.DataFrame) -> list[str]:
+        keep = set(IDENTITY) | {"week", "season"} | self.needed
+        return [c for c in df.columns if c in keep]
+
+    def output_columns(self, df: pd.DataFrame) -> list[str]:
+        return IDENTITY + [f for f in self.fields if f in df.columns]
+
+
+def parse_fields(fields: str | None, position: str = "ALL") -> FieldPlan | None:
+    """
+    FieldPlan for a fields= value, or None when every field is wanted.
+    Raises ValueError for an empty list.
+    """
+    if fields is None:
+        return None
+
+    resolved = []
+    for token in (t.strip() for t in fields.split(",")):
+        if not token:
+            continue
+        name = token.lower()
+        if name == "preset":
+            name = POSITION_PRESETS.get(position.upper(), "all")
+        resolved.extend(FIELD_PRESETS.get(name, [token]))
+
+    if not resolved:
+        raise ValueError("fields= lists no fields")
+    return FieldPlan(resolved)
@@ -0,0 +1,177 @@
+import gzip
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from utils.cache import FRAME_CACHE
+from utils.helpers import is_completed_season
+from utils.responses import cache_headers, etag_matches
+
+# ------------------------------------------------------------
+# Response cache
+#
+# Finished response bodies (already serialized) for the NFL routes,
+# stored in FRAME_CACHE under ("response", route, season, ...normalized
+# params) together with the ETag they were built for:
+#
+#   completed season   served while the ETag (input versions) matches;
+#                      never expires otherwise
+#   current season     served immediately, even when its ETag is behind
+#                      or it is older than RESPONSE_TTL_S; a background
+#                      rebuild then replaces it (stale-while-revalidate)
+#
+# Large bodies are also kept gzip-compressed (made on the first hit that
+# accepts gzip), so hits skip the compression middleware's work too.
+#
+# A miss builds in the request, as before. Only complete 200 responses
+# are stored (no streams, no errors, nothing marked no-store).
+# ------------------------------------------------------------
+
+RESPONSE_TTL_S = float(os.getenv("KRAMERBOT_RESPONSE_TTL_S", "300"))
+# Same threshold as the compression middleware (main.py)
+COMPRESS_MIN_BYTES = int(os.getenv("KRAMERBOT_COMPRESS_MIN_BYTES", "1024"))
+REFRESH_WORKERS = int(os.getenv("KRAMERBOT_RESPONSE_REFRESH_WORKERS", "2"))
+
+RESPONSE_STATS = {"hits": 0, "stale_served": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+_STATS_LOCK = threading.Lock()
+
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="response-refresh")
+_REFRESHING: set = set()
+_REFRESHING_LOCK = threading.Lock()
+
+
+def _count(stat: str) -> None:
+    with _STATS_LOCK:
+        RESPONSE_STATS[stat] += 1
+
+
+class CachedResponse:
+    __slots__ = ("etag", "body", "media_type", "built_at", "gzip_body")
+
+    def __init__(self, etag: str, body: bytes, media_type: str | None):
+        self.etag = etag
+        self.body = body
+        self.media_type = media_type
+        self.built_at = time.time()
+        self.gzip_body = None
+
+    def estimated_size(self) -> int:
+        # Lets FRAME_CACHE budget the body bytes (gzip copy: ~1/8 of them)
+        return len(self.body) + len(self.body) // 8 + 256
+
+    def gzipped(self) -> bytes:
+        if self.gzip_body is None:
+            self.gzip_body = gzip.compress(self.body, compresslevel=9)
+        return self.gzip_body
+
+    def is_fresh(self, etag: str, season: int) -> bool:
+        if self.etag != etag:
+            return False
+        return is_completed_season(season) or time.time() - self.built_at < RESPONSE_TTL_S
+
+
+def _accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def _respond(entry: CachedResponse, request: Request, season: int) -> Response:
+    headers = cache_headers(entry.etag, season)
+    if etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    if len(entry.body) >= COMPRESS_MIN_BYTES and _accepts_gzip(request):
+        # Already encoded: the middleware passes it through
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept, Accept-Encoding"
+        return Response(content=entry.gzipped(), media_type=entry.media_type, headers=headers)
+
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+def _build(key: Hashable, etag_fn: Callable[[], str], build: Callable[[], Response]) -> CachedResponse | Response:
+    """
+    Runs the route and stores its body. Returns the cache entry, or the
+    response itself when it cannot be stored.
+    """
+    response = build()
+    body = getattr(response, "body", None)
+    if response.status_code != 200 or body is None:
+        return response
+    if "no-store" in response.headers.get("cache-control", ""):
+        return response
+
+    # Building can fetch inputs for the first time (e.g. the roster file)
+    entry = CachedResponse(etag_fn(), bytes(body), response.media_type)
+    FRAME_CACHE.put(key, entry)
+    return entry
+
+
+def _refresh(key: Hashable, etag_fn: Callable[[], str], build: Callable[[], Response]) -> None:
+    try:
+        _build(key, etag_fn, build)
+        _count("refreshes")
+    except Exception as e:
+        _count("refresh_errors")
+        print(f"⚠️ Background refresh failed for {key}: {e}")
+    finally:
+        with _REFRESHING_LOCK:
+            _REFRESHING.discard(key)
+
+
+def _schedule_refresh(key: Hashable, etag_fn: Callable[[], str], build: Callable[[], Response]) -> None:
+    with _REFRESHING_LOCK:
+        if key in _REFRESHING:
+            return
+        _REFRESHING.add(key)
+    _REFRESH_POOL.submit(_refresh, key, etag_fn, build)
+
+
+def cached_response(
+    request: Request,
+    season: int,
+    key: tuple,
+    etag_fn: Callable[[], str],
+    build: Callable[[], Response],
+) -> Response:
+    """
+    The route's response from the response cache (see above), with ETag /
+    Cache-Control and If-None-Match handling. `key` must identify the
+    response completely: route name plus normalized parameters.
+    """
+    key = ("response",) + tuple(key)
+    etag = etag_fn()
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag, season))
+
+    entry = FRAME_CACHE.get(key)
+    if entry is not None:
+        if entry.is_fresh(etag, season):
+            _count("hits")
+            return _respond(entry, request, season)
+        if not is_completed_season(season):
+            # Game day: answer now, rebuild behind the request
+            _count("stale_served")
+            _schedule_refresh(key, etag_fn, build)
+            return _respond(entry, request, season)
+
+    _count("misses")
+    result = _build(key, etag_fn, build)
+    if isinstance(result, CachedResponse):
+        return _respond(result, request, season)
+
+    if "cache-control" not in result.headers:
+        result.headers.update(cache_headers(etag_fn(), season))
+    return result
+
+
+def response_stats() -> dict:
+    with _STATS_LOCK:
+        stats = dict(RESPONSE_STATS)
+    with _REFRESHING_LOCK:
+        stats["refreshing"] = len(_REFRESHING)
+    return stats
@@ -1,23 +1,24 @@
 import pandas as pd
 
+from services.nflverse_cache import load_artifact
+
 
 def load_snap_counts(season: int, week: int) -> pd.DataFrame:
     """
     Loads snap counts from nflverse player_stats parquet.
     Normalizes schema and safely computes snap_pct.
-    """
-
-    url = (
-        "https://github.com/nflverse/nflverse-data/releases/download/"
-        f"player_stats/player_stats_{season}.parquet"
-    )
 
-    print(f"📡 Loading snap counts for {season} from {url}")
-    df = pd.read_parquet(url)
+    The season file comes from the nflverse artifact cache, so it is
+    downloaded once per season rather than once per request.
+    """
+    print(f"📡 Loading snap counts for {season} week {week}")
+    df = load_artifact("player_stats", season)
 
-    # Filter to week if available
+    # Filter to week if available (a copy, so the cached frame is untouched)
     if "week" in df.columns:
         df = df[df["week"] == week]
+    else:
+        df = df.copy()
 
     # Normalize column names
     df.columns = [c.lower() for c in df.columns]
@@ -57,12 +58,14 @@ def load_snap_counts(season: int, week: int) -> pd.DataFrame:
     else:
         # Try to derive snap_pct from local PBP if available (approximate)
         try:
-            import polars as pl
             from services.loaders.pbp_weekly_loader import load_pbp_local
 
-            lf = load_pbp_local(season)
-            lf_week = lf.filter(pl.col("week") == week)
-            pbp_df = lf_week.collect().to_pandas()
+            lf = load_pbp_local(
+                season,
+                columns=["posteam", "rusher_id", "passer_id", "receiver_id"],
+                week=week,
+            )
+            pbp_df = lf.collect().to_pandas()
         except Exception:
             pbp_df = None
 
@@ -0,0 +1,189 @@
+import os
+import threading
+import time
+
+# ------------------------------------------------------------
+# Startup warmup
+#
+# Runs once in a background thread when the app starts (see the
+# lifespan hook in main.py) so the first request after a deploy or a
+# spin-up does not pay for the parquet decode, roster download and
+# game-index build. /ready reports 503 until it has finished.
+#
+# KRAMERBOT_WARMUP selects what is warmed:
+#   latest               latest local season + its most recent week (default)
+#   2025                 season 2025 + its most recent week
+#   2025:1-3,2024:18     explicit weeks
+#   2024:none            the season frame only, no weekly pipeline
+#   off                  no warmup; /ready is immediately ready
+#
+# KRAMERBOT_WARMUP_TIMEOUT_S caps how long /ready waits on a warmup
+# that is stuck (e.g. on a slow remote download).
+# ------------------------------------------------------------
+
+WARMUP_SPEC = os.getenv("KRAMERBOT_WARMUP", "latest")
+WARMUP_TIMEOUT_S = float(os.getenv("KRAMERBOT_WARMUP_TIMEOUT_S", "300"))
+
+WARMUP_STATE = {
+    "status": "pending",   # pending → running → ready | disabled
+    "started_at": None,
+    "finished_at": None,
+    "targets": [],
+    "warmed": [],
+    "errors": [],
+}
+_STATE_LOCK = threading.Lock()
+
+
+def _parse_weeks(text: str) -> list[int]:
+    weeks = []
+    for part in text.split("+"):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-", 1)
+            weeks.extend(range(int(start), int(end) + 1))
+        elif part:
+            weeks.append(int(part))
+    return weeks
+
+
+def parse_warmup_spec(spec: str) -> list[tuple[str | int, list[int] | None]]:
+    """
+    Parses KRAMERBOT_WARMUP into [(season, weeks)], where season is an int
+    or "latest" and weeks is None for "most recent week".
+    Week ranges may be joined with "+": "2025:1-3+5".
+    """
+    spec = (spec or "").strip().lower()
+    if spec in ("", "off", "none", "0", "false"):
+        return []
+
+    targets = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+
+        season_text, _, weeks_text = item.partition(":")
+        season = season_text if season_text == "latest" else int(season_text)
+
+        if not weeks_text:
+            weeks = None
+        elif weeks_text == "none":
+            weeks = []
+        else:
+            weeks = _parse_weeks(weeks_text)
+
+        targets.append((season, weeks))
+
+    return targets
+
+
+def _latest_week(season: int) -> int | None:
+    from services.nfl_pbp_service import load_pbp_season
+
+    df = load_pbp_season(season)
+    if df.is_empty() or "week" not in df.columns:
+        return None
+    return df.get_column("week").max()
+
+
+def _record(step: str, error: Exception | None = None) -> None:
+    with _STATE_LOCK:
+        if error is None:
+            WARMUP_STATE["warmed"].append(step)
+        else:
+            WARMUP_STATE["errors"].append(f"{step}: {error}")
+
+
+def run_warmup(spec: str = WARMUP_SPEC) -> dict:
+    """
+    Warms the season list, then for each target season the PBP season frame
+    and game index, then the weekly pipeline for the target weeks.
+    Failures are recorded and skipped; warmup always finishes.
+    """
+    from routers.nfl_router import SEASON_CACHE, build_season_cache, load_weekly_data
+    from services.nfl_pbp_service import season_game_index
+
+    targets = parse_warmup_spec(spec)
+
+    with _STATE_LOCK:
+        WARMUP_STATE.update(status="running", started_at=time.time(), finished_at=None)
+        WARMUP_STATE.update(targets=[], warmed=[], errors=[])
+
+    if not targets:
+        with _STATE_LOCK:
+            WARMUP_STATE.update(status="disabled", finished_at=time.time())
+        return WARMUP_STATE
+
+    start = time.time()
+    print(f"🔥 Warmup starting: {spec}")
+
+    try:
+        build_season_cache()
+        _record("seasons")
+    except Exception as e:
+        _record("seasons", e)
+
+    for season, weeks in targets:
+        if season == "latest":
+            if not SEASON_CACHE["seasons"]:
+                _record("latest", RuntimeError("no local seasons"))
+                continue
+            season = SEASON_CACHE["seasons"][-1]
+
+        try:
+            season_game_index(season)
+            _record(f"pbp {season}")
+        except Exception as e:
+            _record(f"pbp {season}", e)
+            continue
+
+        if weeks is None:
+            latest = _latest_week(season)
+            weeks = [] if latest is None else [int(latest)]
+
+        with _STATE_LOCK:
+            WARMUP_STATE["targets"].append({"season": season, "weeks": weeks})
+
+        for week in weeks:
+            try:
+                load_weekly_data(season, week)
+                _record(f"weekly {season} week {week}")
+            except Exception as e:
+                _record(f"weekly {season} week {week}", e)
+
+    with _STATE_LOCK:
+        WARMUP_STATE.update(status="ready", finished_at=time.time())
+        errors = len(WARMUP_STATE["errors"])
+
+    print(f"✅ Warmup finished in {time.time() - start:.1f}s ({errors} error(s))")
+    return WARMUP_STATE
+
+
+def start_warmup(spec: str = WARMUP_SPEC) -> threading.Thread:
+    """
+    Runs the warmup in a daemon thread so startup is not blocked.
+    """
+    thread = threading.Thread(target=run_warmup, args=(spec,), name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_ready() -> bool:
+    """
+    True once warmup has finished (or is disabled, or has exceeded its timeout).
+    """
+    with _STATE_LOCK:
+        status = WARMUP_STATE["status"]
+        started_at = WARMUP_STATE["started_at"]
+
+    if status in ("ready", "disabled"):
+        return True
+    return started_at is not None and time.time() - started_at > WARMUP_TIMEOUT_S
+
+
+def readiness() -> dict:
+    with _STATE_LOCK:
+        state = {k: (list(v) if isinstance(v, list) else v) for k, v in WARMUP_STATE.items()}
+    state["ready"] = is_ready()
+    return state
@@ -0,0 +1,106 @@
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import pytest
+
+from utils.cache import FrameCache, SingleFlight
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = FrameCache("test", budget_bytes=100)
+    cache.put("a", "A", size=40)
+    cache.put("b", "B", size=40)
+    cache.get("a")
+    cache.put("c", "C", size=40)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["used_bytes"] == 80
+
+
+def test_pinned_entries_survive_eviction():
+    cache = FrameCache("test", budget_bytes=100)
+    cache.put("current", "X", size=60, pin=True)
+    cache.put("old", "Y", size=30)
+    cache.put("older", "Z", size=30)
+
+    assert "current" in cache
+    assert "old" not in cache
+    assert "older" in cache
+
+
+def test_oversized_value_is_returned_but_not_stored():
+    cache = FrameCache("test", budget_bytes=100)
+    assert cache.put("big", "B", size=500) == "B"
+    assert "big" not in cache
+
+
+def test_cached_decorator_counts_hits_and_misses():
+    cache = FrameCache("test", budget_bytes=10_000)
+    calls = []
+
+    @cache.cached(key=lambda season: ("season", season))
+    def load(season):
+        calls.append(season)
+        return [season]
+
+    assert load(2024) == [2024]
+    assert load(2024) == [2024]
+    assert calls == [2024]
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_invalidate_where_drops_matching_keys():
+    cache = FrameCache("test", budget_bytes=10_000)
+    cache.put(("pbp_week", 2024, 1), 1, size=1)
+    cache.put(("pbp_week", 2024, 2), 2, size=1)
+    cache.put(("pbp_week", 2023, 1), 3, size=1)
+
+    assert cache.invalidate_where(lambda k: k[1] == 2024) == 2
+    assert ("pbp_week", 2023, 1) in cache
+
+
+def test_concurrent_misses_share_one_load():
+    cache = FrameCache("test", budget_bytes=10_000)
+    calls = []
+    release = threading.Event()
+
+    @cache.cached(key=lambda season: ("season", season))
+    def load(season):
+        calls.append(season)
+        release.wait(timeout=5)
+        return [season]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(load, 2024) for _ in range(8)]
+        while cache.stats()["coalesced"] < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert calls == [2024]
+    assert all(r is results[0] for r in results)
+
+
+def test_single_flight_shares_errors_and_forgets_key():
+    flights = SingleFlight("test")
+
+    def boom():
+        raise ValueError("no data")
+
+    with pytest.raises(ValueError):
+        flights.do(("weekly", 2024, 1), boom)
+
+    assert flights.in_flight() == []
+    assert flights.do(("weekly", 2024, 1), lambda: 42) == 42
@@ -0,0 +1,72 @@
+import io
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import pandas as pd
+
+from services.loaders.frame_encoding import (
+    PlayerKeyRegistry,
+    concat_encoded,
+    decode_frame,
+    encode_frame,
+)
+
+
+def test_registry_keys_are_stable_int32():
+    keys = PlayerKeyRegistry()
+    first = keys.encode(["00-0033873", "00-0036355", None, "00-0033873"])
+
+    assert first.dtype == np.int32
+    assert first.tolist() == [0, 1, -1, 0]
+    assert keys.encode(["00-0036355"]).tolist() == [1]
+    assert keys.decode(first).tolist() == ["00-0033873", "00-0036355", None, "00-0033873"]
+
+
+def test_frame_round_trip():
+    df = pd.DataFrame({
+        "player_id": ["00-0033873", "00-0036355", None],
+        "player_name": ["P.Mahomes", "J.Herbert", "X.Unknown"],
+        "team": ["KC", "LAC", "KC"],
+        "position": ["QB", "QB", None],
+        "passing_yards": [250.0, 300.0, 0.0],
+    })
+
+    encoded = encode_frame(df)
+    assert encoded["player_id"].dtype == np.int32
+    assert encoded["team"].dtype == "category"
+
+    decoded = decode_frame(encoded)
+    assert decoded["player_id"].tolist() == ["00-0033873", "00-0036355", None]
+    assert decoded["team"].tolist() == ["KC", "LAC", "KC"]
+    assert decoded["team"].dtype == object
+
+
+def test_concat_keeps_categories_across_weeks():
+    week_1 = encode_frame(pd.DataFrame({"player_id": ["a"], "team": ["KC"], "position": ["QB"]}))
+    week_2 = encode_frame(pd.DataFrame({"player_id": ["b"], "team": ["BUF"], "position": ["WR"]}))
+
+    both = concat_encoded([week_1, week_2])
+    assert both["team"].dtype == "category"
+    assert decode_frame(both)["team"].tolist() == ["KC", "BUF"]
+
+
+def test_concat_mixes_built_and_parquet_weeks_with_null_positions():
+    # A roster that matches no one leaves position all-NaN (float)
+    built = encode_frame(pd.DataFrame({"player_id": ["a"], "team": ["KC"], "position": [np.nan]}))
+    assert built["position"].cat.categories.dtype == object
+
+    buffer = io.BytesIO()
+    decode_frame(built).to_parquet(buffer, index=False)
+    from_disk = encode_frame(pd.read_parquet(io.BytesIO(buffer.getvalue())))
+    other = encode_frame(pd.DataFrame({"player_id": ["b"], "team": ["BUF"], "position": ["WR"]}))
+
+    # Frames encoded before the fix may still carry float categories
+    legacy = built.assign(position=pd.Series([np.nan]).astype("category"))
+
+    both = concat_encoded([built, from_disk, other, legacy])
+    assert both["position"].dtype == "category"
+    assert decode_frame(both)["position"].isna().tolist() == [True, True, False, True]
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+
+import services.multi_pbp as multi_pbp
+from utils.cache import FRAME_CACHE
+
+
+@pytest.fixture
+def fake_weeks(monkeypatch):
+    sizes = {1: 5, 2: 0, 3: 7}
+
+    def load_weekly_pbp(season, week):
+        n = sizes[week]
+        return pd.DataFrame({
+            "game_id": [f"{season}_{week:02d}_AAA_BBB"] * n,
+            "play_id": list(range(1, n + 1)),
+            "week": [week] * n,
+            "epa": [np.nan if i == 0 else 0.1 * i for i in range(n)],
+            "success": [1.0] * n,
+        })
+
+    monkeypatch.setattr(multi_pbp, "load_weekly_pbp", load_weekly_pbp)
+    FRAME_CACHE.invalidate_where(lambda key: isinstance(key, tuple) and key[0] == "multi_pbp_week")
+    yield sizes
+    FRAME_CACHE.invalidate_where(lambda key: isinstance(key, tuple) and key[0] == "multi_pbp_week")
+
+
+def test_pages_walk_every_play_once(fake_weeks):
+    weeks = [1, 2, 3]
+    expected = [(w, p) for w in weeks for p in range(1, fake_weeks[w] + 1)]
+
+    for limit in (1, 3, 5, 12, 100):
+        seen, cursor = [], None
+        while True:
+            result = multi_pbp.page(2030, weeks, limit, cursor)
+            assert len(result["plays"]) <= limit
+            seen.extend((p["week"], p["play_id"]) for p in result["plays"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == expected
+
+    with pytest.raises(ValueError):
+        multi_pbp.page(2030, weeks, 5, multi_pbp.encode_cursor(9, 0))
+    with pytest.raises(ValueError):
+        multi_pbp.page(2030, weeks, 5, "not-a-cursor")
+
+
+def test_ndjson_streams_one_play_per_line(fake_weeks):
+    chunks = list(multi_pbp.iter_ndjson(2030, [1, 2, 3]))
+    assert len(chunks) == 2  # empty week 2 yields nothing
+
+    plays = [orjson.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert [p["play_id"] for p in plays] == list(range(1, 6)) + list(range(1, 8))
+    assert plays[0]["epa"] is None and plays[0]["success"] is True
+
+
+def test_nullable_ints_are_numbers_or_null(monkeypatch):
+    def load_weekly_pbp(season, week):
+        return pd.DataFrame({
+            "game_id": [f"{season}_{week:02d}_AAA_BBB"] * 2,
+            "play_id": np.array([1, 2], dtype=np.int64),
+            "week": [week] * 2,
+            "rushing_yards": pd.array([7, None], dtype="Int64"),
+            "epa": np.array([np.float32(0.5), np.nan], dtype=np.float32),
+        })
+
+    monkeypatch.setattr(multi_pbp, "load_weekly_pbp", load_weekly_pbp)
+    FRAME_CACHE.invalidate_where(lambda key: isinstance(key, tuple) and key[0] == "multi_pbp_week")
+
+    lines = b"".join(multi_pbp.iter_ndjson(2031, [1])).splitlines()
+    pages = orjson.loads(multi_pbp.page_json(2031, [1], 5))["plays"]
+    for plays in ([orjson.loads(line) for line in lines], pages):
+        assert [(p["play_id"], p["rushing_yards"], p["epa"]) for p in plays] == [(1, 7, 0.5), (2, None, None)]
+    FRAME_CACHE.invalidate_where(lambda key: isinstance(key, tuple) and key[0] == "multi_pbp_week")
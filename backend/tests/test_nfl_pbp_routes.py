@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from datetime import date
+
+import polars as pl
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import nfl_pbp_routes
+from services import data_versions
+from services import nfl_pbp_service as svc
+from services.pbp_catalog import PbpCatalog
+from utils.cache import FRAME_CACHE
+
+SEASON = 1905
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(nfl_pbp_routes.router)
+    return TestClient(app)
+
+
+def test_games_route_lists_games_with_string_dates(tmp_path, monkeypatch):
+    catalog = PbpCatalog(tmp_path)
+    monkeypatch.setattr(svc, "PBP_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(svc, "PBP_IPC_DIR", tmp_path / "ipc")
+    monkeypatch.setattr(svc, "CACHE_CATALOG", catalog)
+    monkeypatch.setattr(data_versions, "CACHE_CATALOG", catalog)
+
+    # Dated games, as both the R pipeline and nflverse write them
+    pl.DataFrame({
+        "game_id": [f"{SEASON}_01_AAA_HOM", f"{SEASON}_01_BBB_HOM"],
+        "play_id": ["1", "1"],
+        "season": [SEASON, SEASON],
+        "week": [1, 1],
+        "season_type": ["REG", "REG"],
+        "game_date": [date(SEASON, 9, 8), date(SEASON, 9, 7)],
+        "home_team": ["HOM", "HOM"],
+        "away_team": ["AAA", "BBB"],
+    }).write_parquet(svc._pbp_path(SEASON))
+    catalog.refresh([SEASON])
+    FRAME_CACHE.invalidate_where(lambda key: key[:2] in (("pbp_season", SEASON), ("pbp_index", SEASON)))
+
+    response = _client().get(f"/nfl/pbp/{SEASON}/1/games")
+    assert response.status_code == 200
+    assert [(g["away_team"], g["game_date"]) for g in response.json()] == [
+        ("BBB", f"{SEASON}-09-07"),
+        ("AAA", f"{SEASON}-09-08"),
+    ]
+    FRAME_CACHE.invalidate_where(lambda key: key[:2] in (("pbp_season", SEASON), ("pbp_index", SEASON)))
+
+
+def test_games_route_encodes_date_values(monkeypatch):
+    games = [{"game_id": f"{SEASON + 1}_01_AAA_HOM", "game_date": date(SEASON + 1, 9, 7)}]
+    monkeypatch.setattr(nfl_pbp_routes, "pbp_games_index", lambda season, week, season_type: games)
+
+    response = _client().get(f"/nfl/pbp/{SEASON + 1}/1/games")
+    assert response.json() == [{"game_id": f"{SEASON + 1}_01_AAA_HOM", "game_date": f"{SEASON + 1}-09-07"}]
@@ -0,0 +1,130 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+from services import nfl_pbp_service as svc
+from services.pbp_catalog import PbpCatalog
+from utils.cache import FRAME_CACHE
+
+SEASON = 1903
+
+
+def _plays(weeks, plays_per_game=3):
+    rows = []
+    for week in weeks:
+        for game in range(2):
+            for play in range(plays_per_game):
+                rows.append({
+                    "game_id": f"{SEASON}_{week:02d}_G{game}_HOM",
+                    "play_id": str(plays_per_game - play),
+                    "season": SEASON,
+                    "week": week,
+                    "season_type": "REG",
+                    "home_team": "HOM",
+                    "away_team": f"G{game}",
+                    "desc": f"week {week} game {game} play {plays_per_game - play}",
+                })
+    return pl.DataFrame(rows)
+
+
+def _drop_season():
+    FRAME_CACHE.invalidate_where(lambda key: key[:2] in (("pbp_season", SEASON), ("pbp_index", SEASON)))
+
+
+def _cache_catalog(tmp_path, monkeypatch) -> PbpCatalog:
+    (tmp_path / "cache").mkdir()
+    catalog = PbpCatalog(tmp_path / "cache")
+    monkeypatch.setattr(svc, "PBP_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(svc, "PBP_IPC_DIR", tmp_path / "ipc")
+    monkeypatch.setattr(svc, "CACHE_CATALOG", catalog)
+    return catalog
+
+
+def test_ipc_mirror_is_rebuilt_when_the_parquet_changes(tmp_path, monkeypatch):
+    catalog = _cache_catalog(tmp_path, monkeypatch)
+
+    decoded = []
+    ingest = svc._ingest
+    monkeypatch.setattr(svc, "_ingest", lambda season, df: decoded.append(df.height) or ingest(season, df))
+
+    _plays([1]).write_parquet(svc._pbp_path(SEASON))
+    catalog.refresh([SEASON])
+
+    _drop_season()
+    first = svc.load_pbp_season(SEASON)
+    assert decoded == [6]
+    assert list((tmp_path / "ipc").iterdir()) == [svc._ipc_path(SEASON, catalog.fingerprint(SEASON))]
+
+    # A reload maps the mirror instead of decoding the parquet again
+    _drop_season()
+    assert svc.load_pbp_season(SEASON).equals(first)
+    assert decoded == [6]
+
+    # New parquet → new fingerprint: decoded once more, the old mirror removed
+    _plays([1, 2]).write_parquet(svc._pbp_path(SEASON))
+    catalog.refresh([SEASON])
+
+    _drop_season()
+    second = svc.load_pbp_season(SEASON)
+    assert decoded == [6, 12]
+    assert second.height == 12
+    assert list((tmp_path / "ipc").iterdir()) == [svc._ipc_path(SEASON, catalog.fingerprint(SEASON))]
+    assert svc.load_pbp_season(SEASON)["play_id"].to_list()[:3] == ["1", "2", "3"]
+    _drop_season()
+
+
+def test_pbp_by_game_slices_match_a_game_id_filter(tmp_path, monkeypatch):
+    catalog = _cache_catalog(tmp_path, monkeypatch)
+    # Written out of play order; the season frame sorts it
+    _plays([2, 1], plays_per_game=4).write_parquet(svc._pbp_path(SEASON))
+    catalog.refresh([SEASON])
+
+    _drop_season()
+    season = svc.load_pbp_season(SEASON)
+    for week in (1, 2):
+        games = svc.pbp_games_index(SEASON, week)
+        assert [g["game_id"] for g in games] == [f"{SEASON}_{week:02d}_G{n}_HOM" for n in (0, 1)]
+
+        for game in games:
+            plays = svc.pbp_by_game(SEASON, week, game["game_id"])
+            expected = season.filter(pl.col("game_id") == game["game_id"]).select(list(plays[0])).to_dicts()
+            assert plays == expected
+            assert [p["desc"][-6:] for p in plays] == ["play 1", "play 2", "play 3", "play 4"]
+            assert svc.pbp_by_game(SEASON, week, game["game_id"], limit=2) == expected[:2]
+
+    # Wrong week / season type / unknown game
+    assert svc.pbp_by_game(SEASON, 2, f"{SEASON}_01_G0_HOM") == []
+    assert svc.pbp_by_game(SEASON, 1, f"{SEASON}_01_G0_HOM", season_type="POST") == []
+    assert svc.pbp_by_game(SEASON, 1, f"{SEASON}_01_G9_HOM") == []
+    _drop_season()
+
+
+def test_nflverse_columns_survive_ingest(tmp_path, monkeypatch):
+    catalog = _cache_catalog(tmp_path, monkeypatch)
+    # nflverse layout: dated games, 0/1 float flags, plus columns outside the schema
+    _plays([1]).with_columns(
+        pl.lit(date(SEASON, 9, 7)).alias("game_date"),
+        pl.lit(0.52).alias("wp"),
+        pl.lit(1.0).alias("pass"),
+        pl.lit(0.0).alias("rush"),
+        pl.lit("x").alias("nflverse_only"),
+    ).write_parquet(svc._pbp_path(SEASON))
+    catalog.refresh([SEASON])
+
+    _drop_season()
+    assert "nflverse_only" not in svc.load_pbp_season(SEASON).columns
+
+    games = svc.pbp_games_index(SEASON, 1)
+    assert {g["game_date"] for g in games} == {f"{SEASON}-09-07"}
+
+    play = svc.pbp_by_game(SEASON, 1, games[0]["game_id"])[0]
+    assert play["wp"] == pytest.approx(0.52)
+    assert (play["pass"], play["rush"]) == (True, False)
+    _drop_season()
@@ -0,0 +1,127 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import hashlib
+import io
+import urllib.error
+
+import pandas as pd
+import pytest
+
+import services.nflverse_cache as nc
+from utils.cache import FRAME_CACHE
+from utils.helpers import current_season
+
+
+def _parquet(rows):
+    buf = io.BytesIO()
+    pd.DataFrame({"player_id": [f"00-{i}" for i in range(rows)]}).to_parquet(buf)
+    return buf.getvalue()
+
+
+class _Response(io.BytesIO):
+    def __init__(self, status, body, headers):
+        super().__init__(body)
+        self.status = status
+        self.headers = headers
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    """A fake GitHub release: honours If-None-Match / Range, can go offline."""
+    state = {"body": _parquet(2), "etag": '"v1"', "requests": [], "offline": False}
+
+    def open_url(url, headers):
+        state["requests"].append(dict(headers))
+        if state["offline"]:
+            raise urllib.error.URLError("offline")
+        if headers.get("If-None-Match") == state["etag"]:
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        body, status = state["body"], 200
+        if "Range" in headers and headers.get("If-Range") == state["etag"]:
+            offset = int(headers["Range"].split("=")[1].rstrip("-"))
+            body, status = body[offset:], 206
+        return _Response(status, body, {"ETag": state["etag"], "Content-Length": str(len(body))})
+
+    monkeypatch.setattr(nc, "NFLVERSE_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(nc, "_open", open_url)
+    monkeypatch.setattr(nc, "_CHECKED_AT", {})
+    FRAME_CACHE.invalidate_where(lambda k: isinstance(k, tuple) and k[0] == "nflverse")
+    yield state
+    FRAME_CACHE.invalidate_where(lambda k: isinstance(k, tuple) and k[0] == "nflverse")
+
+
+def test_completed_season_is_downloaded_once(remote):
+    season = current_season() - 1
+
+    assert len(nc.load_artifact("rosters", season)) == 2
+    FRAME_CACHE.clear()
+    assert len(nc.load_artifact("rosters", season)) == 2
+
+    # Second load came from disk with no request at all
+    assert len(remote["requests"]) == 1
+    assert nc.read_meta(nc.artifact_path("rosters", season))["etag"] == '"v1"'
+
+
+def test_current_season_revalidates_and_survives_offline(remote, monkeypatch):
+    season = current_season()
+    nc.load_artifact("player_stats", season)
+
+    # TTL expired, unchanged upstream → conditional GET answered 304
+    monkeypatch.setattr(nc, "_CHECKED_AT", {})
+    assert len(nc.load_artifact("player_stats", season)) == 2
+    assert remote["requests"][-1]["If-None-Match"] == '"v1"'
+
+    # New upstream version is picked up on the next revalidation
+    remote.update(body=_parquet(3), etag='"v2"')
+    monkeypatch.setattr(nc, "_CHECKED_AT", {})
+    assert len(nc.load_artifact("player_stats", season)) == 3
+
+    # Network down: the cached copy is served
+    remote["offline"] = True
+    monkeypatch.setattr(nc, "_CHECKED_AT", {})
+    FRAME_CACHE.clear()
+    assert len(nc.load_artifact("player_stats", season)) == 3
+
+
+def test_sync_resumes_partial_download_and_checks_it(remote):
+    season = current_season() - 1
+    path = nc.artifact_path("rosters", season)
+    part = path.with_suffix(".parquet.part")
+    part.parent.mkdir(parents=True)
+    part.write_bytes(remote["body"][:100])
+    nc.meta_path(part).write_text('{"etag": "\\"v1\\""}')
+
+    assert nc.sync_artifact("rosters", season) == "resumed"
+    assert remote["requests"][-1]["Range"] == "bytes=100-"
+    assert path.read_bytes() == remote["body"]
+    assert nc.read_meta(path)["sha256"] == hashlib.sha256(remote["body"]).hexdigest()
+    assert not part.exists()
+
+    # Current copy: nothing to do. Corrupted copy: fetched again.
+    assert nc.sync_artifact("rosters", season) == "cached"
+    path.write_bytes(b"garbage")
+    assert nc.sync_artifact("rosters", season) == "downloaded"
+    assert path.read_bytes() == remote["body"]
+
+
+def test_weekly_usage_reads_the_player_stats_mirror(monkeypatch):
+    from analytics import nfl_data
+
+    stats = pd.DataFrame({
+        "PLAYER_ID": ["00-1", "00-2", "00-3"],
+        "player_name": ["A", "B", "C"],
+        "week": [1, 1, 2],
+        "targets": [3, 9, 4],
+        "fantasy_points_ppr": [5.0, 12.5, 8.0],
+    })
+    loads = []
+    monkeypatch.setattr(nfl_data, "load_artifact", lambda artifact, season: loads.append((artifact, season)) or stats)
+    monkeypatch.setitem(sys.modules, "nfl_data_py", None)  # never imported
+
+    assert [p["player_id"] for p in nfl_data.get_weekly_usage(2024, 1)] == ["00-2", "00-1"]
+    assert loads == [("player_stats", 2024)]
+    assert list(stats.columns)[0] == "PLAYER_ID"  # the cached frame is untouched
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import importlib
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from services.pbp_catalog import catalog_for
+from services.pbp_loader import play_order, scan_pbp, season_file
+
+partition_pbp = importlib.import_module("scripts.partition_pbp")
+
+SEASON = 1904
+
+
+def _season():
+    rows = []
+    # Weeks, games and plays deliberately out of order; play_id is a string
+    for week in (3, 1, 2):
+        for game in ("BBB", "AAA"):
+            for play in (10, 2, 1):
+                rows.append({
+                    "game_id": f"{SEASON}_{week:02d}_{game}_HOM",
+                    "play_id": str(play),
+                    "season": SEASON,
+                    "week": week,
+                    "season_type": "REG",
+                    "yards_gained": float(week * 100 + play),
+                })
+    return pl.DataFrame(rows)
+
+
+def test_partitions_match_the_source_in_play_order(tmp_path):
+    source = _season()
+    source.write_parquet(season_file(tmp_path, SEASON))
+
+    partition_pbp.convert_root(tmp_path, None)
+
+    catalog = catalog_for(tmp_path)
+    assert catalog.is_partitioned(SEASON)
+    assert catalog.weeks(SEASON) == [1, 2, 3]
+
+    partitioned = scan_pbp(SEASON, root=tmp_path).collect()
+    assert partitioned.equals(play_order(source))
+    assert partitioned["play_id"].to_list()[:3] == ["1", "2", "10"]
+
+    # One row group per game
+    for path in catalog.files(SEASON):
+        assert pq.ParquetFile(path).num_row_groups == 2
+
+    # Already-partitioned seasons are skipped on a second run
+    partition_pbp.convert_root(tmp_path, None)
+    assert scan_pbp(SEASON, root=tmp_path).collect().equals(partitioned)
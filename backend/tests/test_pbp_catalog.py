@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import polars as pl
+
+from services import pbp_loader
+from services.pbp_catalog import MANIFEST_NAME, PbpCatalog, catalog_for
+from services.pbp_loader import append_week_partition, fingerprint_files, partition_weeks, scan_pbp, season_file, source_files
+
+
+def _plays(season, weeks, season_type="REG"):
+    rows = []
+    for week in weeks:
+        for play in range(2):
+            rows.append({
+                "game_id": f"{season}_{week:02d}_AAA_BBB",
+                "play_id": str(play + 1),
+                "season": season,
+                "week": week,
+                "season_type": season_type,
+            })
+    return pl.DataFrame(rows)
+
+
+def test_catalog_answers_lookups_from_manifest(tmp_path):
+    _plays(2030, [1, 2]).vstack(_plays(2030, [19], "POST")).write_parquet(season_file(tmp_path, 2030))
+
+    catalog = PbpCatalog(tmp_path)
+    assert catalog.seasons() == [2030]
+    assert catalog.weeks(2030) == [1, 2, 19]
+    assert catalog.weeks(2030, "POST") == [19]
+    assert catalog.has_week(2030, 2, "REG")
+    assert not catalog.has_week(2030, 3)
+    assert catalog.fingerprint(2030) == fingerprint_files(source_files(tmp_path, 2030))
+    assert (tmp_path / MANIFEST_NAME).exists()
+
+    # A new process reads the manifest; unchanged files are not rebuilt
+    reloaded = PbpCatalog(tmp_path)
+    assert reloaded.weeks(2030) == [1, 2, 19]
+    assert reloaded.refresh() == []
+
+
+def test_catalog_follows_appended_partitions(tmp_path):
+    _plays(2030, [1, 2]).write_parquet(season_file(tmp_path, 2030))
+    catalog = PbpCatalog(tmp_path)
+    assert not catalog.is_partitioned(2030)
+
+    append_week_partition(_plays(2030, [3]), 2030, 3, root=tmp_path)
+    assert catalog.refresh([2030]) == [2030]
+
+    assert catalog.is_partitioned(2030)
+    assert catalog.weeks(2030) == partition_weeks(tmp_path, 2030) == [1, 2, 3]
+    assert catalog.files(2030, 3) == source_files(tmp_path, 2030, week=3)
+    assert catalog.fingerprint(2030, 3) == fingerprint_files(source_files(tmp_path, 2030, week=3))
+
+
+def test_scan_pbp_reads_files_from_catalog(tmp_path, monkeypatch):
+    _plays(2030, [1, 2]).write_parquet(season_file(tmp_path, 2030))
+    append_week_partition(_plays(2030, [3]), 2030, 3, root=tmp_path)
+    catalog_for(tmp_path)
+
+    # Readers never list directories once the catalog is built
+    def no_glob(*args, **kwargs):
+        raise AssertionError("scan_pbp listed the PBP directory")
+
+    monkeypatch.setattr(pbp_loader, "partition_weeks", no_glob)
+    monkeypatch.setattr(pbp_loader, "has_partitions", no_glob)
+
+    assert scan_pbp(2030, root=tmp_path).collect()["week"].to_list() == [1, 1, 2, 2, 3, 3]
+    assert scan_pbp(2030, weeks=[3, 1, 9], root=tmp_path).collect()["week"].to_list() == [1, 1, 3, 3]
+    assert scan_pbp(2030, weeks=[9], root=tmp_path).collect().is_empty()
+    assert scan_pbp(2031, root=tmp_path).collect().is_empty()
@@ -0,0 +1,86 @@
+
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import polars as pl
+
+from services.pbp_loader import append_week_partition, partition_weeks, scan_pbp, season_file
+from services import pbp_watcher
+from services.pbp_watcher import PbpWatcher
+from utils.cache import FRAME_CACHE
+
+
+def _plays(weeks, yards=1.0):
+    rows = []
+    for week in weeks:
+        for play in range(3):
+            rows.append({
+                "game_id": f"2030_{week:02d}_AAA_BBB",
+                "play_id": str(play + 1),
+                "season": 2030,
+                "week": week,
+                "yards_gained": yards,
+            })
+    return pl.DataFrame(rows)
+
+
+def _rewrite(root, df):
+    df.write_parquet(season_file(root, 2030))
+
+
+def test_rewritten_season_file_invalidates_changed_weeks_only(tmp_path):
+    _rewrite(tmp_path, _plays([1, 2]))
+    watcher = PbpWatcher(roots=[tmp_path])
+    assert watcher.scan_once() == {}
+
+    FRAME_CACHE.put(("pbp_week", 2030, 1, "REG"), "w1", size=1)
+    FRAME_CACHE.put(("pbp_week", 2030, 3, "REG"), "w3", size=1)
+    FRAME_CACHE.put(("pbp_season", 2030), "season", size=1)
+
+    _rewrite(tmp_path, pl.concat([_plays([1, 2]), _plays([3], yards=5.0)]))
+    assert watcher.scan_once() == {2030: {3}}
+
+    assert ("pbp_week", 2030, 1, "REG") in FRAME_CACHE
+    assert ("pbp_week", 2030, 3, "REG") not in FRAME_CACHE
+    assert ("pbp_season", 2030) not in FRAME_CACHE
+    FRAME_CACHE.invalidate(("pbp_week", 2030, 1, "REG"))
+
+
+def test_new_week_is_appended_as_its_own_partition(tmp_path):
+    _rewrite(tmp_path, _plays([1, 2, 3]))
+    append_week_partition(_plays([3]), 2030, 3, root=tmp_path)
+    assert partition_weeks(tmp_path, 2030) == [1, 2, 3]
+
+    watcher = PbpWatcher(roots=[tmp_path])
+    watcher.scan_once()
+    week_1 = (tmp_path / "season=2030" / "week=1" / "part-0.parquet").stat().st_mtime_ns
+
+    # R rewrites the season file with week 4 added; only week 4 is written
+    _rewrite(tmp_path, _plays([1, 2, 3, 4]))
+    assert watcher.scan_once() == {2030: {4}}
+    assert partition_weeks(tmp_path, 2030) == [1, 2, 3, 4]
+    assert (tmp_path / "season=2030" / "week=1" / "part-0.parquet").stat().st_mtime_ns == week_1
+    assert scan_pbp(2030, root=tmp_path).collect().height == 12
+
+    # Nothing changed since: the partition we wrote is not reported again
+    assert watcher.scan_once() == {}
+
+
+def test_unchanged_files_skip_the_footer_read(tmp_path, monkeypatch):
+    _rewrite(tmp_path, _plays([1, 2]))
+    watcher = PbpWatcher(roots=[tmp_path])
+    watcher.scan_once()
+
+    reads = []
+    schema_hash = pbp_watcher.schema_hash
+    monkeypatch.setattr(pbp_watcher, "schema_hash", lambda path: reads.append(path) or schema_hash(path))
+
+    assert watcher.scan_once() == {}
+    assert reads == []
+
+    _rewrite(tmp_path, _plays([1, 2], yards=3.0))
+    watcher.scan_once()
+    assert reads == [season_file(tmp_path, 2030)]
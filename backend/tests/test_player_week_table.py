@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import pandas as pd
+
+from services.loaders import player_week_table as pwt
+from services.loaders.frame_encoding import decode_frame, encode_frame
+
+SEASON = 1902
+
+
+def _week(week: int) -> pd.DataFrame:
+    return encode_frame(pd.DataFrame({
+        "player_id": ["00-0000001", "00-0000002"],
+        "player_name": ["A.One", "B.Two"],
+        "team": ["KC", "BUF"],
+        "position": ["WR", "QB"],
+        "season": [SEASON, SEASON],
+        "week": [week, week],
+        "targets": [7.0, 0.0],
+        "snap_pct": [0.8, 1.0],
+    }))
+
+
+def test_player_week_table_round_trip_and_freshness(tmp_path, monkeypatch):
+    monkeypatch.setattr(pwt, "PLAYER_WEEK_DIR", tmp_path)
+    monkeypatch.setattr(pwt, "source_fingerprint", lambda season, week: "pbp-v1")
+    monkeypatch.setattr(pwt, "weekly_version", lambda season, weeks: ("rosters-v1", "stats-v1"))
+
+    pwt.write_player_week(SEASON, {1: _week(1), 2: _week(2), 3: pd.DataFrame()})
+    assert pwt.fresh_weeks(SEASON) == [1, 2, 3]
+
+    for week in (1, 2):
+        pd.testing.assert_frame_equal(decode_frame(pwt.read_player_week(SEASON, week)), decode_frame(_week(week)))
+    assert pwt.read_player_week(SEASON, 3).empty
+    assert pwt.read_player_week(SEASON, 4) is None
+
+    # A roster / snap refresh makes every built week stale
+    monkeypatch.setattr(pwt, "weekly_version", lambda season, weeks: ("rosters-v2", "stats-v1"))
+    assert pwt.fresh_weeks(SEASON) == []
+    assert pwt.read_player_week(SEASON, 1) is None
+
+    # Rebuilding one week keeps only fresh weeks from the old table
+    pwt.write_player_week(SEASON, {2: _week(2)})
+    assert pwt.fresh_weeks(SEASON) == [2]
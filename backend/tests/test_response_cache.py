@@ -0,0 +1,108 @@
+import gzip
+import sys
+import threading
+import time
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi.responses import JSONResponse, Response
+from starlette.requests import Request
+
+from services import response_cache
+from services.fantasy.scoring_engine import canonical_scoring
+from utils.helpers import current_season
+from utils.responses import make_etag
+
+
+def _request(if_none_match=None, accept_encoding=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    if accept_encoding:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_canonical_scoring():
+    assert canonical_scoring("Half-PPR") == canonical_scoring("half_ppr") == "half"
+    assert canonical_scoring(None) == canonical_scoring("made-up") == "standard"
+    assert canonical_scoring("PPR") == "ppr"
+
+
+def test_completed_season_served_from_cache_until_etag_changes():
+    builds = []
+
+    def build():
+        builds.append(1)
+        return Response(f"[{len(builds)}]".encode(), media_type="application/json")
+
+    key = ("test-completed", 2020, 3)
+    etag = make_etag(*key)
+    first = response_cache.cached_response(_request(), 2020, key, lambda: etag, build)
+    again = response_cache.cached_response(_request(), 2020, key, lambda: etag, build)
+    assert first.body == again.body == b"[1]" and len(builds) == 1
+    assert again.headers["etag"] == etag
+
+    assert response_cache.cached_response(_request(etag), 2020, key, lambda: etag, build).status_code == 304
+
+    changed = response_cache.cached_response(_request(), 2020, key, lambda: etag + "x", build)
+    assert changed.body == b"[2]" and len(builds) == 2
+
+
+def test_current_season_serves_stale_and_refreshes_in_background():
+    season = current_season()
+    refreshed = threading.Event()
+    builds = []
+
+    def build():
+        builds.append(1)
+        if len(builds) > 1:
+            refreshed.set()
+        return Response(f"[{len(builds)}]".encode(), media_type="application/json")
+
+    key = ("test-current", season)
+    old, new = make_etag("old"), make_etag("new")
+    assert response_cache.cached_response(_request(), season, key, lambda: old, build).body == b"[1]"
+
+    stale = response_cache.cached_response(_request(), season, key, lambda: new, build)
+    assert stale.body == b"[1]" and stale.headers["etag"] == old
+
+    assert refreshed.wait(5)
+    for _ in range(50):
+        fresh = response_cache.cached_response(_request(), season, key, lambda: new, build)
+        if fresh.body == b"[2]":
+            break
+        time.sleep(0.05)
+    assert fresh.body == b"[2]" and fresh.headers["etag"] == new
+
+
+def test_large_bodies_served_pre_compressed():
+    body = b"[" + b",".join(b"0" for _ in range(2000)) + b"]"
+    key = ("test-gzip", 2020)
+
+    def build():
+        return Response(body, media_type="application/json")
+
+    def get(accept_encoding):
+        request = _request(accept_encoding=accept_encoding)
+        return response_cache.cached_response(request, 2020, key, lambda: make_etag(*key), build)
+
+    get(None)
+    compressed = get("gzip, br")
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(compressed.body) == body
+    assert get(None).body == body
+
+
+def test_no_store_responses_are_not_cached():
+    builds = []
+
+    def build():
+        builds.append(1)
+        return JSONResponse([], headers={"Cache-Control": "no-store"})
+
+    key = ("test-no-store", 2020)
+    for _ in range(2):
+        response = response_cache.cached_response(_request(), 2020, key, lambda: make_etag(*key), build)
+        assert response.headers["cache-control"] == "no-store"
+    assert len(builds) == 2
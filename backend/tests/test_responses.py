@@ -0,0 +1,161 @@
+import io
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import Response
+from starlette.requests import Request
+
+from utils.helpers import current_season
+from utils.responses import (
+    ARROW_MEDIA_TYPE,
+    conditional_response,
+    frame_json,
+    frame_response,
+    json_column,
+    make_etag,
+    negotiate_format,
+)
+from weekly.normalizer import normalize_pbp_frame, normalize_pbp_row
+
+
+def _request(accept=None, if_none_match=None):
+    headers = [(b"accept", accept.encode())] if accept else []
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_negotiate_format():
+    assert negotiate_format(_request()) == "json"
+    assert negotiate_format(_request("application/json")) == "json"
+    assert negotiate_format(_request(f"{ARROW_MEDIA_TYPE};q=1.0, application/json")) == "arrow"
+    assert negotiate_format(_request(ARROW_MEDIA_TYPE), "parquet") == "parquet"
+    with pytest.raises(HTTPException):
+        negotiate_format(_request(), "xml")
+
+
+def test_binary_formats_round_trip():
+    df = pd.DataFrame({
+        "player_name": ["A", "B"],
+        "team": pd.Categorical(["KC", "SF"]),
+        "fantasy_points": [12.5, 3.0],
+        "attempts": np.array([10, 2], dtype=np.int32),
+    })
+
+    arrow = frame_response(df, "arrow")
+    assert arrow.media_type == ARROW_MEDIA_TYPE
+    pd.testing.assert_frame_equal(pa.ipc.open_stream(arrow.body).read_pandas(), df)
+
+    parquet = frame_response(df, "parquet")
+    pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(parquet.body)), df)
+
+    assert orjson.loads(frame_response(df, "json").body) == df.to_dict(orient="records")
+
+
+def test_json_encoding_zeroes_non_finite_values():
+    df = pd.DataFrame({
+        "player_name": ["A", None],
+        "targets": np.array([3, 0], dtype=np.int64),
+        "catch_rate": [np.inf, np.nan],
+        "epa": np.array([0.1, -np.inf], dtype=np.float32),
+    })
+    legacy = df.replace([np.inf, -np.inf], 0).fillna(0).to_dict(orient="records")
+
+    assert orjson.loads(frame_json(df)) == legacy
+    assert orjson.loads(frame_json(df, "columns")) == {
+        "columns": ["player_name", "targets", "catch_rate", "epa"],
+        "data": [["A", 0], [3, 0], [0, 0], [float(np.float32(0.1)), 0]],
+    }
+    assert not np.isfinite(df["catch_rate"]).any()  # input untouched
+
+
+def test_json_encoding_keeps_numbers_in_object_and_nullable_columns():
+    df = pd.DataFrame({
+        "mixed": pd.Series([np.float64(1.5), np.int64(2), None], dtype=object),
+        "snaps": pd.array([10, None, 3], dtype="Int64"),
+        "share": pd.array([0.5, None, 1.0], dtype="Float64"),
+        "active": pd.array([True, None, False], dtype="boolean"),
+    })
+
+    assert orjson.loads(frame_json(df, "columns"))["data"] == [
+        [1.5, 2, 0],
+        [10, 0, 3],
+        [0.5, 0, 1.0],
+        [True, 0, False],
+    ]
+
+    with pytest.raises(TypeError):
+        frame_json(pd.DataFrame({"x": pd.Series([object()], dtype=object)}))
+
+
+def test_numeric_columns_reach_orjson_as_arrays():
+    df = pd.DataFrame({
+        "targets": np.array([3, 0], dtype=np.int64),
+        "epa": np.array([0.5, np.nan], dtype=np.float32),
+        "snaps": pd.array([10, None], dtype="Int64"),
+        "kickoff": pd.to_datetime(["2024-09-05 20:20", None]),
+    })
+
+    assert isinstance(json_column(df["targets"]), np.ndarray)
+    assert json_column(df["epa"]).tolist() == [0.5, 0.0]
+    assert json_column(df["snaps"]).tolist() == [10, 0]
+    assert json_column(df["snaps"]).dtype == np.int64
+
+    # na=None keeps missing values as null
+    assert orjson.loads(frame_json(df, "columns", na=None))["data"] == [
+        [3, 0],
+        [0.5, None],
+        [10, None],
+        ["2024-09-05T20:20:00", None],
+    ]
+    assert orjson.loads(frame_json(df, na=None))[1] == {"targets": 0, "epa": None, "snaps": None, "kickoff": None}
+
+
+def test_normalize_pbp_frame_matches_rows():
+    df = pd.DataFrame({
+        "game_id": ["g1", "g1"],
+        "play_id": [1, 2],
+        "week": [3, 3],
+        "posteam": ["KC", "SF"],
+        "rushing_yards": [4.0, np.nan],
+        "epa": [0.3, -1.2],
+        "success": [1.0, 0.0],
+        "desc": ["run", "pass"],
+    })
+    rows = [normalize_pbp_row(r) for r in df.to_dict(orient="records")]
+    frame = normalize_pbp_frame(df).to_dict(orient="records")
+
+    assert [list(r) for r in frame] == [list(r) for r in rows]
+    assert pd.DataFrame(frame).equals(pd.DataFrame(rows))
+
+
+def test_conditional_response_skips_build_on_matching_etag():
+    builds = []
+
+    def build():
+        builds.append(1)
+        return Response(b"[]", media_type="application/json")
+
+    etag = make_etag("player-usage", 2020, 3, "ppr")
+    first = conditional_response(_request(), 2020, lambda: etag, build)
+    assert first.status_code == 200 and first.headers["etag"] == etag
+    assert first.headers["cache-control"].startswith("public, max-age=")
+
+    again = conditional_response(_request(if_none_match=f'"x", {etag}'), 2020, lambda: etag, build)
+    assert again.status_code == 304 and again.headers["etag"] == etag
+    assert len(builds) == 1
+
+    other = make_etag("player-usage", 2020, 3, "standard")
+    assert conditional_response(_request(if_none_match=etag), 2020, lambda: other, build).status_code == 200
+
+    current = conditional_response(_request(), current_season(), lambda: etag, build)
+    assert current.headers["cache-control"] == "no-cache"
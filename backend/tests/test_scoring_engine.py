@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import pandas as pd
+
+from services.fantasy import scoring_engine as se
+
+
+def _frame():
+    return pd.DataFrame({
+        "passing_yards": [250, 0],
+        "passing_tds": [2, 0],
+        "interceptions": [1, 0],
+        "rushing_yards": [-1, 40],
+        "receiving_yards": [1, 85],
+        "receiving_tds": [0, 1],
+        "receptions": [0, 6],
+        "fumbles_lost": [0, np.nan],
+    })
+
+
+def test_all_systems_from_one_pass():
+    d = se.apply_scoring(_frame(), "half-ppr")
+
+    assert d["fantasy_points_standard"].tolist() == [16.0, 18.5]
+    assert d["fantasy_points_ppr"].tolist() == [16.0, 24.5]
+    assert d["fantasy_points_half"].tolist() == d["fantasy_points"].tolist() == [16.0, 21.5]
+    assert d["fantasy_points_vandalay"].tolist() == d["fantasy_points_shen2000"].tolist() == [16.0, 21.5]
+
+    # Components carry half-PPR receptions; missing stats count as 0
+    assert d["comp_receptions"].tolist() == [0.0, 3.0]
+    assert d["comp_fumbles_lost"].tolist() == [0.0, 0.0]
+    assert "comp_sack_fumbles_lost" in d.columns
+
+
+def test_registered_systems_join_the_pass(monkeypatch):
+    monkeypatch.setattr(se, "SCORING_REGISTRY", dict(se.SCORING_REGISTRY))
+    monkeypatch.setattr(se, "SCORING_COEFFICIENTS", dict(se.SCORING_COEFFICIENTS))
+    monkeypatch.setattr(se, "SCORING_COLUMNS", dict(se.SCORING_COLUMNS))
+    monkeypatch.setattr(se, "_COMPILED", {})
+
+    se.register_scoring("six_pt_pass", {**se.STANDARD_POINTS, "passing_tds": 6})(se.score_frame)
+
+    @se.register_scoring("yards_only")
+    def score_yards_only(df):
+        df["fantasy_points_yards_only"] = df["comp_rushing_yards"] + df["comp_receiving_yards"]
+        return df
+
+    d = se.apply_scoring(_frame(), "six_pt_pass")
+    assert d["fantasy_points"].tolist() == [20.0, 18.5]
+    assert d["fantasy_points_yards_only"].tolist() == [0.0, 12.5]
+    assert se.canonical_scoring("YARDS_ONLY") == "yards_only"
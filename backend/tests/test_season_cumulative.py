@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import pandas as pd
+
+from services.loaders import season_cumulative
+from services.loaders.season_cumulative import CUMULATIVE_KEYS, CUMULATIVE_STATS, SeasonCumulative, parse_week_range
+
+
+def _weeks_frame():
+    rng = np.random.default_rng(7)
+    rows = []
+    for week in [1, 2, 3, 5, 6]:
+        for pid in ["A", "B", "C", "D"]:
+            if pid == "D" and week != 3:
+                continue
+            row = {"player_id": pid, "player_name": pid.lower(), "team": "T1", "position": "WR", "week": week}
+            row.update({stat: float(rng.integers(0, 20)) for stat in CUMULATIVE_STATS})
+            rows.append(row)
+    # Mid-season trade: same player, new team key
+    rows.append({**rows[-1], "team": "T2", "week": 6})
+    return pd.DataFrame(rows)
+
+
+def test_range_totals_match_groupby():
+    df = _weeks_frame()
+    cumulative = SeasonCumulative(2030, df)
+
+    for start, end in [(1, 6), (2, 5), (4, 4), (3, 3), (6, 9)]:
+        window = df[df["week"].between(start, end)]
+        expected = (
+            window.groupby(CUMULATIVE_KEYS, as_index=False)[CUMULATIVE_STATS].sum()
+            .sort_values(CUMULATIVE_KEYS).reset_index(drop=True)
+        )
+        got = (
+            cumulative.range_totals(start, end).drop(columns="weeks_played")
+            .sort_values(CUMULATIVE_KEYS).reset_index(drop=True)
+        )
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+    totals = cumulative.range_totals(2, 5)
+    weeks = dict(zip(totals["player_id"] + totals["team"], cumulative.range_weeks(2, 5)))
+    assert weeks["AT1"] == [2, 3, 5]
+    assert weeks["DT1"] == [3]
+
+
+def test_parse_week_range():
+    assert parse_week_range("5-12") == (5, 12)
+    assert parse_week_range(" 1 - 18 ") == (1, 18)
+    assert parse_week_range("1,2,3") is None
+    assert parse_week_range("7") is None
+    assert parse_week_range("9-3") is None
+
+
+def test_cumulative_key_follows_roster_and_snap_versions(monkeypatch):
+    versions = {"rosters": "v1"}
+    monkeypatch.setattr(season_cumulative, "weekly_version", lambda season, weeks: (versions["rosters"], "stats"))
+
+    before = season_cumulative._cumulative_key(2025)
+    assert before[:2] == ("season_cum", 2025)
+
+    versions["rosters"] = "v2"
+    assert season_cumulative._cumulative_key(2025) != before
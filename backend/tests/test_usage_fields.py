@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.fantasy.scoring_engine import apply_scoring
+from services.metrics.custom_metrics import add_efficiency_metrics
+from services.metrics.fantasy_attribution import compute_fantasy_attribution
+from services.presenters.usage_fields import COMPONENTS, parse_fields
+from services.presenters.usage_presenter import present_usage
+
+
+def _week():
+    rng = np.random.default_rng(3)
+    n = 40
+    df = pd.DataFrame({
+        "player_id": [f"00-{i:07d}" for i in range(n)],
+        "player_name": [f"P{i}" for i in range(n)],
+        "team": rng.choice(["KC", "SF", "BUF"], n),
+        "position": rng.choice(["QB", "RB", "WR", "TE"], n),
+        "season": 2030,
+        "week": 1,
+    })
+    for col in COMPONENTS + ["targets", "carries", "attempts", "completions", "snap_pct", "receiving_epa"]:
+        df[col] = rng.integers(0, 12, n).astype(float)
+    return df
+
+
+def _pipeline(df, pos, scoring, plan=None):
+    # Same stage order as the player-usage route
+    if plan is not None:
+        df = df[plan.input_columns(df)]
+    if plan is None or plan.scoring:
+        df = apply_scoring(df, scoring)
+    if plan is None or plan.attribution:
+        df = compute_fantasy_attribution(df, scoring)
+    df = present_usage(df, pos)
+    if plan is None or plan.efficiency:
+        df = add_efficiency_metrics(df)
+    return df if plan is None else df[plan.output_columns(df)]
+
+
+@pytest.mark.parametrize("fields", ["table", "preset", "targets,snap_pct", "yards_per_carry", "pct_receptions", "touches,weeks"])
+def test_projection_matches_full_pipeline(fields):
+    full = _pipeline(_week(), "ALL", "ppr")
+    plan = parse_fields(fields, "ALL")
+    projected = _pipeline(_week(), "ALL", "ppr", plan)
+
+    assert [f for f in plan.fields if f in full.columns] == list(projected.columns[4:])
+    pd.testing.assert_frame_equal(projected, full[list(projected.columns)])
+
+
+def test_plan_skips_unrequested_stages():
+    plan = parse_fields("targets,receptions,snap_pct")
+    assert not (plan.scoring or plan.attribution or plan.efficiency)
+
+    plan = parse_fields("fantasy_per_touch")
+    assert plan.scoring and plan.efficiency and not plan.attribution
+
+    plan = parse_fields("table")
+    assert plan.scoring and plan.attribution and not plan.efficiency
+
+    assert parse_fields(None) is None
+    with pytest.raises(ValueError):
+        parse_fields(" , ")
@@ -0,0 +1,20 @@
+
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from services.warmup import parse_warmup_spec, run_warmup
+
+
+def test_parse_warmup_spec():
+    assert parse_warmup_spec("latest") == [("latest", None)]
+    assert parse_warmup_spec("2025:1-3+5, 2024:none") == [(2025, [1, 2, 3, 5]), (2024, [])]
+    assert parse_warmup_spec("off") == []
+    assert parse_warmup_spec("") == []
+
+
+def test_disabled_warmup_is_ready():
+    state = run_warmup("off")
+    assert state["status"] == "disabled"
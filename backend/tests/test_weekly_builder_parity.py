@@ -0,0 +1,328 @@
+import sys
+from functools import reduce
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from services.pbp_catalog import LOCAL_CATALOG
+from services.loaders.pbp_weekly_loader import (
+    LOCAL_PBP_DIR,
+    WEEKLY_KEYS,
+    build_weekly_plan,
+    load_pbp_local,
+    load_weekly_from_pbp,
+    load_weeks_from_pbp,
+    pbp_scan_columns,
+    pbp_scan_play_types,
+)
+
+
+# ------------------------------------------------------------
+# Reference pandas builder
+#
+# The original pandas implementation, kept as the parity baseline for
+# build_weekly_plan.
+# ------------------------------------------------------------
+def build_weekly_pandas(pbp_week: pd.DataFrame, season: int, week: int) -> pd.DataFrame:
+    """
+    Builds weekly player-level stats from one week of PBP with pandas.
+    Play flags may be bools (raw parquet) or ints (see build_weekly_plan).
+    """
+    if pbp_week.empty:
+        return pd.DataFrame()
+
+    # ------------------------------------------------------------
+    # RECEIVING
+    # ------------------------------------------------------------
+
+    rec_events = pbp_week[pbp_week["play_type"] == "pass"]
+
+    # Receiving TDs
+    rec_td_events = rec_events[
+        (rec_events["touchdown"] == 1) &
+        (rec_events["receiver_id"].notna()) &
+        (rec_events["passer_id"].notna())
+    ]
+
+    # Receiving fumbles lost
+    rec_fumble_lost_events = rec_events[
+        (rec_events["fumble_lost"] == 1) &
+        (rec_events["receiver_id"].notna())
+    ]
+    # Count events by receiver_id
+    rec_td_counts = rec_td_events.groupby("receiver_id").size().rename("receiving_tds")
+    rec_fumble_lost_counts = rec_fumble_lost_events.groupby("receiver_id").size().rename("fumbles_lost")
+
+    # Base receiving stats
+    rec_df = (
+        rec_events.groupby(["receiver_id", "receiver", "posteam"], dropna=True)
+        .agg(
+            targets=("receiver_id", "count"),
+            receptions=("complete_pass", "sum"),
+            receiving_yards=("yards_gained", "sum"),
+            receiving_air_yards=("air_yards", "sum"),
+            receiving_epa=("epa", "sum"),
+        )
+        .reset_index()
+    )
+
+    # Merge event counts
+    rec_df = (
+        rec_df
+        .merge(rec_td_counts, on="receiver_id", how="left")
+        .merge(rec_fumble_lost_counts, on="receiver_id", how="left")
+        .fillna(0)
+    )
+    # Final rename
+    rec_df = rec_df.rename(columns={
+        "receiver_id": "player_id",
+        "receiver": "player_name",
+        "posteam": "team"
+    })
+    
+    # ------------------------------------------------------------
+    # RUSHING
+    # ------------------------------------------------------------
+
+    rush_events = pbp_week[pbp_week["play_type"] == "run"]
+
+    # Rushing TDs
+    rush_td_events = rush_events[
+        (rush_events["touchdown"] == 1) &
+        (rush_events["rusher_id"].notna())
+    ]
+    # Rushing fumbles lost
+    rush_fumble_lost_events = rush_events[
+        (rush_events["fumble_lost"] == 1) &
+        (rush_events["rusher_id"].notna())
+    ]
+    # Count events by rusher_id
+    rush_td_counts = rush_td_events.groupby("rusher_id").size().rename("rushing_tds")
+    rush_fumble_lost_counts = rush_fumble_lost_events.groupby("rusher_id").size().rename("fumbles_lost")
+
+    # Base rushing stats
+    rush_df = (
+        rush_events.groupby(["rusher_id", "rusher", "posteam"], dropna=True)
+        .agg(
+            carries=("rusher_id", "count"),
+            rushing_yards=("yards_gained", "sum"),
+            rushing_epa=("epa", "sum"),
+        )
+        .reset_index()
+    )
+
+    # Merge event counts
+    rush_df = (
+        rush_df
+        .merge(rush_td_counts, on="rusher_id", how="left")
+        .merge(rush_fumble_lost_counts, on="rusher_id", how="left")
+        .fillna(0)
+    )
+
+    # Final rename
+    rush_df = rush_df.rename(columns={
+        "rusher_id": "player_id",
+        "rusher": "player_name",
+        "posteam": "team"
+    })
+
+    # ------------------------------------------------------------
+    # PASSING
+    # ------------------------------------------------------------
+
+    # TRUE pass plays only
+    pass_events = pbp_week[pbp_week["play_type"] == "pass"]
+    # Passing TDs
+    pass_td_events = pass_events[
+        (pass_events["touchdown"] == 1) &
+        (pass_events["desc"].str.contains("pass", case=False, na=False)) &
+        (pass_events["receiver_id"].notna()) &
+        (pass_events["passer_id"].notna())
+    ]
+
+    # Interceptions
+    int_events = pass_events[
+        (pass_events["interception"] == 1) &
+        (pass_events["desc"].str.contains("intercept", case=False, na=False)) &
+        (pass_events["passer_id"].notna())
+    ]
+
+    # Sack fumbles lost
+    sack_fumble_lost_events = pass_events[
+        (pass_events["fumble_lost"] == 1) &
+        (pass_events["desc"].str.contains("sack", case=False, na=False)) &
+        (pass_events["passer_id"].notna())
+    ]
+
+    # Sack fumbles = sack fumbles lost (no separate fumble column)
+    sack_fumble_events = sack_fumble_lost_events
+
+    # ------------------------------------------------------------
+    # Count events by passer_id (THIS is the fix)
+    # ------------------------------------------------------------
+
+    td_counts = pass_td_events.groupby("passer_id").size().rename("passing_tds")
+    int_counts = int_events.groupby("passer_id").size().rename("interceptions")
+    sack_f_counts = sack_fumble_events.groupby("passer_id").size().rename("sack_fumbles")
+    sack_f_lost_counts = sack_fumble_lost_events.groupby("passer_id").size().rename("sack_fumbles_lost")
+
+    # ------------------------------------------------------------
+    # Base passing stats
+    # ------------------------------------------------------------
+
+    pass_df = (
+        pass_events.groupby(["passer_id", "passer", "posteam"], dropna=True)
+        .agg(
+            attempts=("pass_attempt", "sum"),
+            completions=("complete_pass", "sum"),
+            passing_yards=("yards_gained", "sum"),
+            passing_air_yards=("air_yards", "sum"),
+            passing_first_downs=("first_down", "sum"),
+            passing_epa=("epa", "sum"),
+        )
+        .reset_index()
+    )
+
+    # ------------------------------------------------------------
+    # Merge event counts
+    # ------------------------------------------------------------
+
+    pass_df = (
+        pass_df
+        .merge(td_counts, on="passer_id", how="left")
+        .merge(int_counts, on="passer_id", how="left")
+        .merge(sack_f_counts, on="passer_id", how="left")
+        .merge(sack_f_lost_counts, on="passer_id", how="left")
+        .fillna(0)
+    )
+
+    # ------------------------------------------------------------
+    # Final rename
+    # ------------------------------------------------------------
+
+    pass_df = pass_df.rename(columns={
+        "passer_id": "player_id",
+        "passer": "player_name",
+        "posteam": "team"
+    })
+
+    # ------------------------------------------------------------
+    # MERGE ALL THREE
+    # ------------------------------------------------------------
+    dfs = [rec_df, rush_df, pass_df]
+    dfs = [df for df in dfs if not df.empty]
+
+    if not dfs:
+        return pd.DataFrame()
+    weekly = reduce(
+        lambda left, right: pd.merge(
+            left, right, on=["player_id", "player_name", "team"], how="outer"
+        ),
+        dfs,
+    )
+
+    # ------------------------------------------------------------
+    # CLEAN UP ROLE-SPECIFIC STAT COLUMNS
+    # ------------------------------------------------------------
+
+    def sum_columns(df, base_name):
+        cols = [c for c in df.columns if c == base_name or c.startswith(f"{base_name}_")]
+        if not cols:
+            df[base_name] = 0
+        else:
+            df[base_name] = df[cols].sum(axis=1)
+            df.drop(columns=[c for c in cols if c != base_name], inplace=True)
+        return df
+
+    weekly = sum_columns(weekly, "fumbles_lost")
+    weekly = sum_columns(weekly, "interceptions")
+    weekly = sum_columns(weekly, "passing_tds")
+    weekly = sum_columns(weekly, "rushing_tds")
+    weekly = sum_columns(weekly, "receiving_tds")
+    weekly["season"] = season
+    weekly["week"] = week
+
+    return weekly
+
+
+def _local_seasons():
+    seasons = set()
+    for path in LOCAL_PBP_DIR.glob("pbp_*.parquet"):
+        seasons.add(int(path.stem.split("_")[1]))
+    for path in LOCAL_PBP_DIR.glob("season=*"):
+        seasons.add(int(path.name.split("=")[1]))
+    return sorted(seasons)
+
+
+def _assert_same_weekly(expected: pd.DataFrame, actual: pd.DataFrame):
+    assert list(actual.columns) == list(expected.columns)
+
+    expected = expected.sort_values(WEEKLY_KEYS).reset_index(drop=True)
+    actual = actual.sort_values(WEEKLY_KEYS).reset_index(drop=True)
+    assert len(actual) == len(expected)
+
+    for col in expected.columns:
+        if col in WEEKLY_KEYS:
+            assert actual[col].tolist() == expected[col].tolist(), col
+        else:
+            np.testing.assert_allclose(
+                pd.to_numeric(actual[col]).to_numpy(dtype=float),
+                pd.to_numeric(expected[col]).to_numpy(dtype=float),
+                # EPA is Float32 in the compact schema; sums differ in accumulation order
+                rtol=1e-5,
+                atol=1e-4,
+                equal_nan=True,
+                err_msg=col,
+            )
+
+
+@pytest.mark.parametrize("season", _local_seasons())
+def test_polars_builder_matches_pandas_builder(season):
+    season_lf = load_pbp_local(
+        season,
+        columns=pbp_scan_columns(),
+        play_types=pbp_scan_play_types(),
+    )
+    season_df = season_lf.with_columns(pl.col(pl.Boolean).cast(pl.Int8)).collect()
+    weeks = sorted(season_df.get_column("week").drop_nulls().unique().to_list())
+    assert weeks
+
+    for week in weeks:
+        week_df = season_df.filter(pl.col("week") == week)
+
+        # The pandas reference expects plain string columns
+        raw_week = week_df.with_columns(pl.col(pl.Categorical).cast(pl.String))
+        expected = build_weekly_pandas(raw_week.to_pandas(), season, week)
+        actual = build_weekly_plan(week_df.lazy(), season).collect().to_pandas()
+
+        _assert_same_weekly(expected, actual)
+
+
+@pytest.mark.parametrize("season", [_local_seasons()[0], _local_seasons()[-1]])
+def test_weekly_loader_matches_pandas_on_raw_parquet(season):
+    # The original path: the season's parquet as written, straight into pandas
+    raw = pd.concat([pd.read_parquet(path) for path in LOCAL_CATALOG.files(season)], ignore_index=True)
+
+    for week in sorted(raw["week"].dropna().unique()):
+        raw_week = raw[raw["week"] == week].reset_index(drop=True)
+        expected = build_weekly_pandas(raw_week, season, int(week))
+        _assert_same_weekly(expected, load_weekly_from_pbp(season, int(week)))
+
+
+def test_multi_week_build_matches_single_weeks():
+    season = _local_seasons()[-1]
+    weeks = [1, 2, 3]
+
+    combined = load_weeks_from_pbp(season, weeks)
+    assert sorted(combined["week"].unique()) == weeks
+
+    for week in weeks:
+        expected = load_weekly_from_pbp(season, week)
+        actual = combined[combined["week"] == week].reset_index(drop=True)
+        _assert_same_weekly(expected, actual)
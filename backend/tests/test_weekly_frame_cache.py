@@ -0,0 +1,104 @@
+import sys
+from pathlib import Path
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import importlib
+
+import pandas as pd
+
+from services.loaders import player_week_table, weekly_frame_cache
+from services.loaders.frame_encoding import decode_frame, encode_frame
+from utils.cache import FRAME_CACHE
+
+SEASON = 1901
+
+
+def _drop_memory_tier():
+    FRAME_CACHE.invalidate_where(lambda key: key[:2] == ("weekly_frame", SEASON))
+
+
+def test_weekly_frame_memory_then_disk_then_rebuild(tmp_path, monkeypatch):
+    monkeypatch.setattr(weekly_frame_cache, "WEEKLY_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(weekly_frame_cache, "DISK_CACHE", True)
+    monkeypatch.setattr(weekly_frame_cache, "weekly_fingerprint", lambda season, week: "v1")
+    builds = []
+
+    def build(season, week):
+        builds.append(week)
+        return encode_frame(pd.DataFrame({
+            "player_id": ["00-0000001", "00-0000002"],
+            "team": ["KC", "BUF"],
+            "position": ["WR", "QB"],
+            "week": [week, week],
+            "targets": [7, 0],
+        }))
+
+    _drop_memory_tier()
+    first = weekly_frame_cache.weekly_frame(SEASON, 4, build)
+    assert weekly_frame_cache.weekly_frame(SEASON, 4, build) is first
+    assert builds == [4]
+
+    # A restart: only the parquet tier is left
+    _drop_memory_tier()
+    from_disk = weekly_frame_cache.weekly_frame(SEASON, 4, build)
+    assert builds == [4]
+    pd.testing.assert_frame_equal(decode_frame(from_disk), decode_frame(first))
+
+    # New inputs → new fingerprint: rebuilt, the old file removed
+    monkeypatch.setattr(weekly_frame_cache, "weekly_fingerprint", lambda season, week: "v2")
+    weekly_frame_cache.weekly_frame(SEASON, 4, build)
+    assert builds == [4, 4]
+    assert [p.name for p in (tmp_path / str(SEASON)).iterdir()] == ["week_4-v2.parquet"]
+    _drop_memory_tier()
+
+
+def test_empty_weekly_frames_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(weekly_frame_cache, "WEEKLY_CACHE_DIR", tmp_path)
+    builds = []
+
+    def build(season, week):
+        builds.append(week)
+        return pd.DataFrame()
+
+    for _ in range(2):
+        assert weekly_frame_cache.weekly_frame(SEASON, 9, build).empty
+    assert builds == [9, 9]
+    assert not (tmp_path / str(SEASON)).exists()
+
+
+def test_roster_refresh_bypasses_stale_player_week_table(tmp_path, monkeypatch):
+    nfl_router = importlib.import_module("routers.nfl_router")
+    versions = {"rosters": "v1"}
+
+    def weekly_version(season, weeks):
+        return ("pbp", versions["rosters"], "stats")
+
+    monkeypatch.setattr(weekly_frame_cache, "WEEKLY_CACHE_DIR", tmp_path / "weekly")
+    monkeypatch.setattr(weekly_frame_cache, "DISK_CACHE", True)
+    monkeypatch.setattr(weekly_frame_cache, "weekly_version", weekly_version)
+    monkeypatch.setattr(player_week_table, "PLAYER_WEEK_DIR", tmp_path / "player_week")
+    monkeypatch.setattr(player_week_table, "source_fingerprint", lambda season, week: "pbp")
+    monkeypatch.setattr(player_week_table, "weekly_version", weekly_version)
+
+    def frame(targets):
+        return encode_frame(pd.DataFrame({
+            "player_id": ["00-0000001"], "team": ["KC"], "position": ["WR"],
+            "week": [5], "targets": [targets],
+        }))
+
+    player_week_table.write_player_week(SEASON, {5: frame(7)})
+    monkeypatch.setattr(nfl_router, "compute_weekly_data", lambda season, week: frame(9))
+
+    _drop_memory_tier()
+    assert weekly_frame_cache.weekly_frame(SEASON, 5, nfl_router._load_weekly_data)["targets"].tolist() == [7]
+
+    # New roster: the table row is stale, so the week is rebuilt
+    versions["rosters"] = "v2"
+    _drop_memory_tier()
+    assert weekly_frame_cache.weekly_frame(SEASON, 5, nfl_router._load_weekly_data)["targets"].tolist() == [9]
+
+    _drop_memory_tier()
+    assert weekly_frame_cache.cached_weekly_frame(SEASON, 5)["targets"].tolist() == [9]
+    _drop_memory_tier()
@@ -0,0 +1,291 @@
+# backend/utils/cache.py
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# ============================================================
+#  SIZE ESTIMATION
+# ============================================================
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimated in-memory size of a cached value, in bytes.
+    Understands polars and pandas frames; falls back to sys.getsizeof.
+    """
+    if hasattr(value, "estimated_size"):  # polars DataFrame
+        try:
+            return int(value.estimated_size())
+        except Exception:
+            pass
+
+    if hasattr(value, "memory_usage"):  # pandas DataFrame
+        try:
+            return int(value.memory_usage(index=True, deep=True).sum())
+        except Exception:
+            pass
+
+    return sys.getsizeof(value)
+
+
+# ============================================================
+#  SINGLE-FLIGHT
+# ============================================================
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Per-key request coalescing. Concurrent callers of `do(key, fn)` for the
+    same key wait on the one in-flight call and share its result (or its
+    exception). Different keys never block each other.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def in_flight(self) -> list:
+        with self._lock:
+            return list(self._flights)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": [repr(k) for k in self._flights],
+            }
+
+
+# ============================================================
+#  BYTE-BUDGETED LRU
+# ============================================================
+
+class FrameCache:
+    """
+    Thread-safe LRU that evicts by estimated size against a byte budget
+    rather than by entry count.
+
+    - Pinned entries are never evicted (they still count against the budget).
+    - A value larger than the unpinned budget is returned but not stored.
+    - hits / misses / evictions are tracked for observability.
+    - Concurrent misses on the same key through `cached` run the loader once.
+    """
+
+    def __init__(self, name: str, budget_bytes: int):
+        self.name = name
+        self.budget_bytes = budget_bytes
+
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._pinned: set = set()
+        self._used = 0
+        self._lock = threading.RLock()
+        self._flights = SingleFlight(name)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------------- lookup ----------------
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _peek(self, key: Hashable, default: Any = None) -> Any:
+        # Lookup without touching LRU order or hit/miss counters
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None else entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    # ---------------- insert ----------------
+
+    def put(self, key: Hashable, value: Any, pin: bool = False, size: Optional[int] = None) -> Any:
+        size = estimate_size(value) if size is None else size
+
+        with self._lock:
+            self._remove(key)
+
+            pinned_bytes = sum(self._entries[k][1] for k in self._pinned)
+            if not pin and size > self.budget_bytes - pinned_bytes:
+                print(f"⚠️ [{self.name}] {key!r} ({size / 1e6:.1f} MB) exceeds cache budget — not cached")
+                return value
+
+            self._entries[key] = (value, size)
+            self._used += size
+            if pin:
+                self._pinned.add(key)
+
+            self._evict()
+
+        return value
+
+    def pin(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._pinned.add(key)
+
+    def unpin(self, key: Hashable) -> None:
+        with self._lock:
+            self._pinned.discard(key)
+            self._evict()
+
+    # ---------------- removal ----------------
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Drops every entry whose key matches `predicate`. Returns the count.
+        """
+        with self._lock:
+            keys = [k for k in self._entries if predicate(k)]
+            for k in keys:
+                self._remove(k)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self._used = 0
+
+    def _remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        self._pinned.discard(key)
+        if entry is None:
+            return False
+        self._used -= entry[1]
+        return True
+
+    def _evict(self) -> None:
+        # Oldest unpinned entries go first
+        for key in list(self._entries):
+            if self._used <= self.budget_bytes:
+                break
+            if key in self._pinned:
+                continue
+            self._remove(key)
+            self.evictions += 1
+
+    # ---------------- observability ----------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "budget_bytes": self.budget_bytes,
+                "used_bytes": self._used,
+                "entries": len(self._entries),
+                "pinned": len(self._pinned),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "coalesced": self._flights.coalesced,
+                "keys": [repr(k) for k in self._entries],
+            }
+
+    # ---------------- decorator ----------------
+
+    def cached(
+        self,
+        key: Callable[..., Hashable],
+        pin: Optional[Callable[..., bool]] = None,
+    ):
+        """
+        Memoizes a function in this cache.
+        `key(*args, **kwargs)` builds the cache key; `pin(*args, **kwargs)`
+        decides whether the result is pinned. Callers that miss while the
+        same key is already loading wait for that load instead of repeating it.
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                k = key(*args, **kwargs)
+                missing = object()
+                value = self.get(k, missing)
+                if value is not missing:
+                    return value
+
+                def load():
+                    # A flight that finished just before we joined may have stored it
+                    value = self._peek(k, missing)
+                    if value is not missing:
+                        return value
+                    value = func(*args, **kwargs)
+                    return self.put(k, value, pin=bool(pin and pin(*args, **kwargs)))
+
+                return self._flights.do(k, load)
+
+            wrapper.cache = self
+            return wrapper
+
+        return decorator
+
+
+# ============================================================
+#  SHARED FRAME CACHE
+# ============================================================
+
+# Season and week frames (PBP seasons, PBP weeks, nflverse weekly data)
+# share one budget. Size it well below the instance's memory limit.
+FRAME_CACHE_BUDGET_MB = int(os.getenv("KRAMERBOT_FRAME_CACHE_MB", "192"))
+
+FRAME_CACHE = FrameCache("frames", FRAME_CACHE_BUDGET_MB * 1024 * 1024)
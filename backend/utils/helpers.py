@@ -0,0 +1,19 @@
+# backend/utils/helpers.py
+
+from datetime import date
+
+
+def current_season(today: date | None = None) -> int:
+    """
+    The NFL season in progress (or most recently played).
+    Seasons kick off in September and finish in February of the next year.
+    """
+    today = today or date.today()
+    return today.year if today.month >= 9 else today.year - 1
+
+
+def is_completed_season(season: int, today: date | None = None) -> bool:
+    """
+    True for seasons whose data can no longer change.
+    """
+    return season < current_season(today)
@@ -0,0 +1,271 @@
+# backend/utils/responses.py
+
+import hashlib
+import os
+from typing import Callable
+
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+
+from utils.helpers import is_completed_season
+
+
+# ============================================================
+#  FRAME RESPONSE FORMATS
+#
+#  Routes whose result is a DataFrame can return it as:
+#
+#    json     list of records (default)
+#    arrow    Arrow IPC stream   (application/vnd.apache.arrow.stream)
+#    parquet  Parquet file       (application/vnd.apache.parquet)
+#
+#  Chosen with ?format=, else from the Accept header. Arrow and Parquet
+#  are written straight from the frame's columns: no per-row dicts, and
+#  the dtypes survive the trip (pd.read_parquet / pa.ipc.open_stream).
+#
+#  JSON is encoded here with orjson and returned as a ready Response, so
+#  FastAPI's jsonable_encoder never walks the rows. ?orient=columns gives
+#  the compact layout {"columns": [...], "data": [[col 0 values], ...]}.
+# ============================================================
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+FORMAT_MEDIA_TYPES = {
+    "arrow": ARROW_MEDIA_TYPE,
+    "parquet": PARQUET_MEDIA_TYPE,
+}
+
+# Accept media type → format
+ACCEPT_FORMATS = {
+    ARROW_MEDIA_TYPE: "arrow",
+    PARQUET_MEDIA_TYPE: "parquet",
+    "application/x-parquet": "parquet",
+}
+
+
+ORIENTS = ("records", "columns")
+
+# Line-delimited JSON for streamed routes (one record per line)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def negotiate_format(request: Request, format: str | None = None) -> str:
+    """
+    "json", "arrow" or "parquet" for this request. An explicit ?format=
+    wins over Accept; unknown formats are a 400.
+    """
+    if format:
+        fmt = format.strip().lower()
+        if fmt != "json" and fmt not in FORMAT_MEDIA_TYPES:
+            raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+        return fmt
+
+    for part in request.headers.get("accept", "").split(","):
+        fmt = ACCEPT_FORMATS.get(part.split(";")[0].strip().lower())
+        if fmt:
+            return fmt
+    return "json"
+
+
+def wants_ndjson(request: Request, format: str | None = None) -> bool:
+    if format:
+        return format.strip().lower() == "ndjson"
+    accept = request.headers.get("accept", "").lower()
+    return any(part.split(";")[0].strip() == NDJSON_MEDIA_TYPE for part in accept.split(","))
+
+
+def check_orient(orient: str) -> str:
+    if orient not in ORIENTS:
+        raise HTTPException(status_code=400, detail=f"Unsupported orient: {orient}")
+    return orient
+
+
+# ============================================================
+#  NON-FINITE VALUES
+#
+#  JSON has no NaN / Infinity. Numeric NaN and ±inf go out as 0, and
+#  missing values in other columns too (what the routes' old
+#  .replace([inf, -inf], 0).fillna(0) produced), or as null with na=None.
+#  Cleaned by column mask, so only columns that actually hold such values
+#  are copied.
+# ============================================================
+
+def finite_column(col: pd.Series) -> pd.Series:
+    """
+    Numeric column with NaN / ±inf replaced by 0 (others as-is).
+    """
+    if col.dtype.kind != "f":
+        return col
+    if not isinstance(col.dtype, np.dtype):
+        # Nullable Float64: pd.NA → NaN, then treated like NaN
+        col = pd.Series(col.to_numpy(dtype=float, na_value=np.nan), index=col.index, name=col.name)
+    finite = np.isfinite(col.to_numpy())
+    return col if finite.all() else col.where(finite, 0)
+
+
+def json_column(col: pd.Series, na=0) -> np.ndarray | list:
+    """
+    A column's values for orjson: a numpy array for plain numeric / bool /
+    datetime columns (serialized natively with OPT_SERIALIZE_NUMPY), else
+    a list. Missing and non-finite values become `na`, by column mask.
+    """
+    kind = col.dtype.kind
+
+    if kind == "f":
+        # float32 goes out as the float64 it has always been
+        values = col.to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = ~np.isfinite(values)
+    elif kind in "iub" and not isinstance(col.dtype, np.dtype):
+        # Nullable Int64 / boolean: pd.NA filled with 0, and masked
+        values = col.to_numpy(dtype=col.dtype.numpy_dtype, na_value=0)
+        missing = col.isna().to_numpy()
+    elif kind in "iubM":
+        values = col.to_numpy()
+        missing = np.isnat(values) if kind == "M" else np.zeros(len(values), dtype=bool)
+    else:
+        values = col.to_numpy(dtype=object)
+        missing = col.isna().to_numpy() | pd.Series(values).isin([np.inf, -np.inf]).to_numpy()
+
+    if missing.any():
+        if na == 0 and kind in "iuf":
+            values = np.where(missing, 0, values).astype(values.dtype, copy=False)
+        else:
+            # datetime64 via datetime objects: orjson writes both as ISO 8601
+            values = (values.astype("datetime64[us]") if kind == "M" else values).astype(object)
+            values[missing] = na
+
+    return values.tolist() if values.dtype == object else np.ascontiguousarray(values)
+
+
+# ============================================================
+#  SERIALIZATION
+# ============================================================
+
+def _values_list(values: np.ndarray | list) -> list:
+    if isinstance(values, list):
+        return values
+    if values.dtype.kind == "M":
+        # datetime64[ns].tolist() gives ints; [us] gives datetime objects
+        values = values.astype("datetime64[us]")
+    return values.tolist()
+
+
+def frame_records(df: pd.DataFrame, na=0) -> list[dict]:
+    """
+    The frame as JSON-ready records (one dict per row).
+    """
+    names = [str(c) for c in df.columns]
+    columns = [_values_list(json_column(df[c], na)) for c in df.columns]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def frame_json(df: pd.DataFrame, orient: str = "records", na=0) -> bytes:
+    if orient == "columns":
+        # Numeric columns go to orjson as arrays, never as Python values
+        body = {
+            "columns": [str(c) for c in df.columns],
+            "data": [json_column(df[c], na) for c in df.columns],
+        }
+    else:
+        body = frame_records(df, na)
+
+    # No default=: a type orjson cannot encode is an error, not a string
+    return orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def frame_to_arrow(df: pd.DataFrame) -> pa.Table:
+    # Typed formats keep real nulls in non-numeric columns
+    fixed = {}
+    for c in df.columns:
+        col = df[c]
+        finite = finite_column(col)
+        if finite is not col:
+            fixed[c] = finite
+    return pa.Table.from_pandas(df.assign(**fixed) if fixed else df, preserve_index=False)
+
+
+def frame_bytes(df: pd.DataFrame, fmt: str) -> bytes:
+    """
+    The frame as an Arrow IPC stream or a Parquet file.
+    """
+    table = frame_to_arrow(df)
+    sink = pa.BufferOutputStream()
+
+    if fmt == "arrow":
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif fmt == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        raise ValueError(f"no binary encoding for format {fmt!r}")
+
+    return sink.getvalue().to_pybytes()
+
+
+def frame_response(df: pd.DataFrame, fmt: str, orient: str = "records") -> Response:
+    """
+    A route's result frame in the negotiated format.
+    """
+    if fmt == "json":
+        return Response(content=frame_json(df, orient), media_type="application/json")
+    return Response(content=frame_bytes(df, fmt), media_type=FORMAT_MEDIA_TYPES[fmt])
+
+
+# ============================================================
+#  CONDITIONAL REQUESTS
+#
+#  ETags are weak (W/"..."): the same representation may be sent gzip-
+#  or brotli-encoded. Completed seasons never change, so their responses
+#  may be cached for PAST_SEASON_MAX_AGE_S; the current season is always
+#  revalidated, which costs a 304 when nothing changed.
+# ============================================================
+
+PAST_SEASON_MAX_AGE_S = int(os.getenv("KRAMERBOT_PAST_SEASON_MAX_AGE_S", str(7 * 24 * 3600)))
+
+
+def make_etag(*parts) -> str:
+    return f'W/"{hashlib.sha1(repr(parts).encode()).hexdigest()[:24]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def cache_headers(etag: str, season: int) -> dict:
+    if is_completed_season(season):
+        cache_control = f"public, max-age={PAST_SEASON_MAX_AGE_S}"
+    else:
+        cache_control = "no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept"}
+
+
+def conditional_response(
+    request: Request,
+    season: int,
+    etag_fn: Callable[[], str],
+    build: Callable[[], Response],
+) -> Response:
+    """
+    304 when If-None-Match already holds etag_fn(), without calling
+    build(); otherwise build()'s response with ETag / Cache-Control.
+    """
+    etag = etag_fn()
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag, season))
+
+    response = build()
+    # Building can fetch inputs for the first time (e.g. the roster file)
+    response.headers.update(cache_headers(etag_fn(), season))
+    return response
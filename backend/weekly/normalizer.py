@@ -161,3 +161,27 @@ def normalize_pbp_row(raw):
         # Description
         "desc": raw.get("desc", ""),
     }
+
+
+# Column → default when missing, in normalize_pbp_row's order
+PBP_ROW_DEFAULTS = {
+    "game_id": None, "play_id": None, "season": None, "week": None,
+    "posteam": None, "defteam": None,
+    "rushing_yards": 0, "receiving_yards": 0, "passing_yards": 0,
+    "rushing_tds": 0, "receiving_tds": 0, "passing_tds": 0,
+    "epa": 0, "success": False,
+    "rusher_player_id": None, "receiver_player_id": None, "passer_player_id": None,
+    "desc": "",
+}
+
+
+def normalize_pbp_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise normalize_pbp_row: same columns, defaults and order,
+    without building a dict per play.
+    """
+    out = pd.DataFrame(index=df.index)
+    for col, default in PBP_ROW_DEFAULTS.items():
+        out[col] = df[col] if col in df.columns else default
+    out["success"] = out["success"].astype(bool)
+    return out.reset_index(drop=True)
@@ -124,6 +124,22 @@ function fmt2(v) {
   return num(v).toFixed(2);
 }
 
+// orient=columns payload {columns: [...], data: [[col values], ...]} → row objects
+function rowsFromColumns(payload) {
+  const columns = payload?.columns;
+  const data = payload?.data;
+  if (!Array.isArray(columns) || !Array.isArray(data)) return [];
+
+  const n = data.length ? data[0].length : 0;
+  const rows = new Array(n);
+  for (let i = 0; i < n; i++) {
+    const row = {};
+    for (let c = 0; c < columns.length; c++) row[columns[c]] = data[c][i];
+    rows[i] = row;
+  }
+  return rows;
+}
+
 function setHidden(el, hidden) {
   if (!el) return;
   el.classList.toggle("hidden", hidden);
@@ -299,12 +315,12 @@ async function loadStats() {
 
   try {
     const res = await fetch(
-      `${BACKEND_URL}/nfl/player-usage/${season}/${week}?scoring=${encodeURIComponent(scoring)}`
+      `${BACKEND_URL}/nfl/player-usage/${season}/${week}?scoring=${encodeURIComponent(scoring)}&orient=columns&fields=table`
     );
     if (!res.ok) throw new Error(`Backend returned ${res.status}`);
 
     const payload = await res.json();
-    const rows = Array.isArray(payload) ? payload : [];
+    const rows = Array.isArray(payload) ? payload : rowsFromColumns(payload);
 
     if (!rows.length) {
       usageBody.innerHTML = `<tr><td colspan="15">No data returned for this week.</td></tr>`;
@@ -6,6 +6,10 @@ import { API_BASE as BACKEND_URL } from "./config.js";
 
 let pbpData = [];
 
+// Plays per /nfl/multi-pbp page; the first page renders while the rest load
+const PAGE_SIZE = 500;
+let loadGeneration = 0;
+
 /* ===============================
    DOM ELEMENTS (FIXED IDS)
 =============================== */
@@ -118,8 +122,22 @@ function normalizePBP(raw) {
 }
 
 /* ==========================================================
-   LOAD MULTI-WEEK PBP (FIXED)
+   LOAD MULTI-WEEK PBP (PAGINATED)
 ========================================================== */
+async function fetchPBPPage(season, weekParam, cursor) {
+  const params = new URLSearchParams({ weeks: weekParam, limit: String(PAGE_SIZE) });
+  if (cursor) params.set("cursor", cursor);
+
+  const res = await fetch(`${BACKEND_URL}/nfl/multi-pbp/${season}?${params}`);
+  if (!res.ok) throw new Error(`Backend returned ${res.status}`);
+
+  const payload = await res.json();
+  return {
+    plays: Array.isArray(payload?.plays) ? payload.plays : [],
+    nextCursor: payload?.next_cursor || null,
+  };
+}
+
 async function loadMultiPBP() {
   const season = Number(seasonInput?.value);
   const weeks = getSelectedWeeks();
@@ -130,23 +148,21 @@ async function loadMultiPBP() {
     return;
   }
 
+  // A newer load cancels the remaining pages of this one
+  const generation = ++loadGeneration;
+
+  pbpData = [];
   pbpBody.innerHTML = "";
   tableWrapper.classList.add("hidden");
   loadingIndicator.classList.remove("hidden");
 
   try {
-    const res = await fetch(
-      `${BACKEND_URL}/nfl/multi-pbp/${season}?weeks=${weekParam}`
-    );
-
-    if (!res.ok) throw new Error(`Backend returned ${res.status}`);
-
-    const payload = await res.json();
-    const rows = Array.isArray(payload) ? payload : [];
-
-    pbpData = rows.map(normalizePBP);
+    let page = await fetchPBPPage(season, weekParam, null);
+    if (generation !== loadGeneration) return;
 
+    pbpData = page.plays.map(normalizePBP);
     renderTable(pbpData);
+    tableWrapper.classList.remove("hidden");
 
     // OPTIONAL: show charts if present
     if (chartsContainer) {
@@ -154,28 +170,34 @@ async function loadMultiPBP() {
       // future: renderEPAChart(pbpData)
     }
 
+    // Remaining pages are appended as they arrive
+    while (page.nextCursor) {
+      page = await fetchPBPPage(season, weekParam, page.nextCursor);
+      if (generation !== loadGeneration) return;
+
+      const rows = page.plays.map(normalizePBP);
+      pbpData.push(...rows);
+      appendRows(rows);
+    }
+
   } catch (err) {
     console.error("❌ Error loading multi-week PBP:", err);
-    pbpBody.innerHTML = `<tr><td colspan="10">Error loading data.</td></tr>`;
+    if (!pbpData.length) {
+      pbpBody.innerHTML = `<tr><td colspan="10">Error loading data.</td></tr>`;
+    }
   } finally {
-    loadingIndicator.classList.add("hidden");
-    tableWrapper.classList.remove("hidden");
+    if (generation === loadGeneration) {
+      loadingIndicator.classList.add("hidden");
+      tableWrapper.classList.remove("hidden");
+    }
   }
 }
 
 /* ==========================================================
    TABLE RENDERING (SAFE)
 ========================================================== */
-function renderTable(data) {
-  if (!pbpBody) return;
-
-  if (!data.length) {
-    pbpBody.innerHTML = `<tr><td colspan="10">No PBP data returned.</td></tr>`;
-    return;
-  }
-
-  pbpBody.innerHTML = data
-    .map(p => `
+function rowHTML(p) {
+  return `
       <tr>
         <td>${p.game_id}</td>
         <td>${p.play_id}</td>
@@ -186,8 +208,29 @@ function renderTable(data) {
         <td>${p.epa.toFixed(3)}</td>
         <td>${p.success}</td>
       </tr>
-    `)
-    .join("");
+    `;
+}
+
+function renderTable(data) {
+  if (!pbpBody) return;
+
+  if (!data.length) {
+    pbpBody.innerHTML = `<tr><td colspan="10">No PBP data returned.</td></tr>`;
+    return;
+  }
+
+  pbpBody.innerHTML = data.map(rowHTML).join("");
+}
+
+function appendRows(rows) {
+  if (!pbpBody || !rows.length) return;
+
+  // First rows may follow the "No PBP data" placeholder
+  if (pbpData.length === rows.length) {
+    renderTable(rows);
+    return;
+  }
+  pbpBody.insertAdjacentHTML("beforeend", rows.map(rowHTML).join(""));
 }
 
 /* ==========================================================
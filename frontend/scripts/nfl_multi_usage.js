@@ -98,6 +98,13 @@ function getSelectedWeeks() {
   return selected.map(Number);
 }
 
+// Contiguous selections go as "a-b" (served from season-to-date totals)
+function weekParamFor(weeks) {
+  const sorted = [...weeks].sort((a, b) => a - b);
+  const contiguous = sorted.length > 1 && sorted.every((w, i) => i === 0 || w === sorted[i - 1] + 1);
+  return contiguous ? `${sorted[0]}-${sorted[sorted.length - 1]}` : sorted.join(",");
+}
+
 /* ==========================================================
    NORMALIZATION
 ========================================================== */
@@ -180,7 +187,7 @@ async function loadMultiUsage() {
   const weeks = getSelectedWeeks();
   const scoring = scoringFilter.value;
 
-  const weekParam = weeks.join(",");
+  const weekParam = weekParamFor(weeks);
 
   usageBody.innerHTML = "";
   tableWrapper.classList.add("hidden");